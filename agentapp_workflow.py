@@ -6,10 +6,17 @@ Orchestrates all features: tracking, AI assistance, analytics, reminders
 import os
 import json
 from datetime import datetime
-from job_tracker_manager import JobTrackerManager, generate_status_color_code
+from job_tracker_manager import DuplicateApplicationError, JobTrackerManager, generate_status_color_code
 from ai_assistant import JobApplicationAI, generate_weekly_summary
+import tracker_metrics
 
+# An update goes to a fuzzy match only if it scores at least this...
+AUTO_MATCH_SCORE = 0.85
+# ...and leads the next candidate by this much; otherwise the candidates are offered
+AUTO_MATCH_MARGIN = 0.1
 
+
+@tracker_metrics.instrumented
 class JobTrackerWorkflow:
     """Main workflow orchestrator for the Job Application Tracker AgentApp"""
 
@@ -63,7 +70,14 @@ class JobTrackerWorkflow:
         }
 
         # Add to tracker
-        application = self.tracker.add_application(app_data)
+        try:
+            application = self.tracker.add_application(app_data)
+        except DuplicateApplicationError as e:
+            return {
+                'status': 'error',
+                'message': f'❌ This application is already tracked as {e.existing_id}',
+                'existing_id': e.existing_id
+            }
 
         # Generate automatic follow-up date if not provided
         if not app_data.get('Follow-up Date'):
@@ -73,8 +87,10 @@ class JobTrackerWorkflow:
             application['Suggested Follow-up Date'] = suggested_followup.strftime('%Y-%m-%d')
 
         # Get AI suggestions for this application
-        all_apps = self.tracker.load_applications()
-        suggestions = self.ai_assistant.get_application_suggestions(application, all_apps)
+        all_apps = self.tracker.get_records()
+        suggestions = self.ai_assistant.get_application_suggestions(
+            application, all_apps, self.tracker.get_status_counts()
+        )
 
         return {
             'status': 'success',
@@ -92,21 +108,65 @@ class JobTrackerWorkflow:
             'color_code': generate_status_color_code(application['Status'])
         }
 
+    def _find_application(self, company: str, job_title: str):
+        """The tracked application best matching a company and job title (typos allowed), or None"""
+        matches = self.tracker.find_similar_applications(company, job_title, limit=1)
+        return matches[0]['application'] if matches else None
+
+    def _find_application_to_update(self, form_data: dict) -> tuple:
+        """
+        The application a write should change, and otherwise the candidates
+
+        An Application ID in the form is used as is. Otherwise a match by
+        company and job title is taken only when it is unambiguous: the
+        single exact match (ignoring case, punctuation and legal forms), or
+        a fuzzy match that scores AUTO_MATCH_SCORE and leads the runner-up
+        by AUTO_MATCH_MARGIN. A typo or a new job title must not silently
+        change a different application.
+
+        Returns:
+            (application or None, [{'application', 'score'}] candidates)
+        """
+        app_id = form_data.get('Application ID')
+        if app_id:
+            return self.tracker.get_application(app_id), []
+
+        matches = self.tracker.find_similar_applications(
+            form_data.get('Company Name', ''), form_data.get('Job Title', ''), limit=5
+        )
+        if not matches:
+            return None, []
+        best = matches[0]['score']
+        runner_up = matches[1]['score'] if len(matches) > 1 else 0.0
+        if best == 1.0:
+            unambiguous = runner_up < 1.0
+        else:
+            unambiguous = best >= AUTO_MATCH_SCORE and best - runner_up >= AUTO_MATCH_MARGIN
+        if unambiguous:
+            return matches[0]['application'], []
+        return None, matches
+
     def update_application_status(self, form_data: dict) -> dict:
         """Update an existing application's status"""
 
-        # In a real implementation, you'd have an app_id field
-        # For now, we'll match by company + job title
+        # Matched by Application ID, or by company + job title when that is unambiguous
         company = form_data.get('Company Name', '')
         job_title = form_data.get('Job Title', '')
 
-        applications = self.tracker.load_applications()
-        target_app = None
+        target_app, candidates = self._find_application_to_update(form_data)
 
-        for app in applications:
-            if app['Company Name'] == company and app['Job Title'] == job_title:
-                target_app = app
-                break
+        if candidates:
+            options = ', '.join(
+                f"{match['application']['Company Name']} - {match['application']['Job Title']} "
+                f"({match['application']['Application ID']})"
+                for match in candidates
+            )
+            return {
+                'status': 'error',
+                'message': f'No single application matches {job_title} at {company}. '
+                           f'Did you mean: {options}? Resubmit with its Application ID.',
+                'candidates': candidates
+            }
 
         if not target_app:
             return {
@@ -116,7 +176,7 @@ class JobTrackerWorkflow:
 
         # Update the application
         updates = {
-            'Status': form_data.get('Status'),
+            'Status': form_data.get('Status') or target_app.get('Status', ''),
             'Interview Date': form_data.get('Interview Date', target_app.get('Interview Date', '')),
             'Follow-up Date': form_data.get('Follow-up Date', target_app.get('Follow-up Date', '')),
             'Notes': form_data.get('Notes', target_app.get('Notes', ''))
@@ -129,7 +189,7 @@ class JobTrackerWorkflow:
 
         return {
             'status': 'success',
-            'message': f'✅ Updated {company} - {job_title}',
+            'message': f'✅ Updated {updated_app["Company Name"]} - {updated_app["Job Title"]}',
             'application': updated_app,
             'automations': automations,
             'color_code': generate_status_color_code(updated_app['Status'])
@@ -138,8 +198,8 @@ class JobTrackerWorkflow:
     def generate_dashboard(self) -> dict:
         """Generate analytics dashboard"""
 
-        analytics = self.tracker.get_analytics()
-        action_items = self.tracker.get_applications_needing_action()
+        action_items = self.tracker.dashboard_snapshot()
+        analytics = action_items['analytics']
 
         # Prepare dashboard data
         dashboard_data = {
@@ -190,13 +250,7 @@ class JobTrackerWorkflow:
         company = form_data.get('Company Name', '')
         job_title = form_data.get('Job Title', '')
 
-        applications = self.tracker.load_applications()
-        target_app = None
-
-        for app in applications:
-            if app['Company Name'] == company and app['Job Title'] == job_title:
-                target_app = app
-                break
+        target_app = self._find_application(company, job_title)
 
         if not target_app:
             return {
@@ -225,18 +279,16 @@ class JobTrackerWorkflow:
         company = form_data.get('Company Name', '')
         job_title = form_data.get('Job Title', '')
 
-        applications = self.tracker.load_applications()
+        applications = self.tracker.get_records()
 
         # If specific application provided, get suggestions for it
         if company and job_title:
-            target_app = None
-            for app in applications:
-                if app['Company Name'] == company and app['Job Title'] == job_title:
-                    target_app = app
-                    break
+            target_app = self._find_application(company, job_title)
 
             if target_app:
-                suggestions = self.ai_assistant.get_application_suggestions(target_app, applications)
+                suggestions = self.ai_assistant.get_application_suggestions(
+                    target_app, applications, self.tracker.get_status_counts()
+                )
 
                 # Also get interview notes summary if available
                 notes_summary = None
@@ -291,14 +343,13 @@ class JobTrackerWorkflow:
         """Export all application data"""
 
         filename = self.tracker.export_to_csv()
-        applications = self.tracker.load_applications()
         analytics = self.tracker.get_analytics()
 
         return {
             'status': 'success',
             'message': f'✅ Data exported successfully',
             'filename': filename,
-            'total_applications': len(applications),
+            'total_applications': len(self.tracker.get_records()),
             'analytics_snapshot': analytics
         }
 
@@ -6,7 +6,10 @@ Generates follow-up emails, summarizes interviews, and provides suggestions
 from datetime import datetime
 from typing import Dict, List, Any
 
+import tracker_metrics
 
+
+@tracker_metrics.instrumented
 class JobApplicationAI:
     """AI-powered assistant for job applications"""
 
@@ -177,8 +180,17 @@ Best regards,
         }
 
     @staticmethod
-    def get_application_suggestions(application: Dict[str, Any], all_applications: List[Dict]) -> Dict[str, List[str]]:
-        """Provide AI-powered suggestions to improve job search"""
+    def get_application_suggestions(application: Dict[str, Any], all_applications: List[Dict],
+                                    status_counts: Dict[str, int] = None) -> Dict[str, List[str]]:
+        """
+        Provide AI-powered suggestions to improve job search
+
+        Args:
+            application: The application (dict or Application record)
+            all_applications: Every tracked application (dicts or records)
+            status_counts: Precomputed {status: count} for all_applications,
+                e.g. JobTrackerManager.get_status_counts(); counted here if omitted
+        """
         suggestions = {
             'immediate_actions': [],
             'strategy_tips': [],
@@ -187,7 +199,9 @@ Best regards,
         }
 
         status = application.get('Status', '')
-        days_since = int(application.get('Days Since Applied', 0))
+        days_since = application.get('Days Since Applied', 0)
+        if not isinstance(days_since, int):
+            days_since = int(days_since)
         company = application.get('Company Name', '')
         job_title = application.get('Job Title', '')
 
@@ -224,10 +238,12 @@ Best regards,
         total_apps = len(all_applications)
         if total_apps >= 5:
             # Analyze patterns
-            status_counts = {}
-            for app in all_applications:
-                st = app.get('Status', 'Applied')
-                status_counts[st] = status_counts.get(st, 0) + 1
+            if status_counts is None:
+                tracker_metrics.count_rows(total_apps)
+                status_counts = {}
+                for app in all_applications:
+                    st = app.get('Status', 'Applied')
+                    status_counts[st] = status_counts.get(st, 0) + 1
 
             interviews = status_counts.get('Interviewed', 0) + status_counts.get('Interview Scheduled', 0)
             interview_rate = (interviews / total_apps * 100) if total_apps > 0 else 0
@@ -0,0 +1,188 @@
+"""
+Application Record for Job Application Tracker
+Typed, compact in-memory representation of a tracked application
+"""
+
+from datetime import date, datetime
+from typing import Dict, Any, Optional
+
+
+def parse_date(text: Any) -> Optional[date]:
+    """YYYY-MM-DD (or a date/datetime object) to a date, or None if blank or malformed"""
+    if not text:
+        return None
+    if isinstance(text, datetime):
+        return text.date()
+    if isinstance(text, date):
+        return text
+    try:
+        return date.fromisoformat(text)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_datetime(text: Any) -> Optional[datetime]:
+    """YYYY-MM-DD HH:MM:SS (or with a T separator, or a datetime object) to a datetime, or None"""
+    if not text:
+        return None
+    if isinstance(text, datetime):
+        value = text
+    elif isinstance(text, date):
+        value = datetime(text.year, text.month, text.day)
+    else:
+        try:
+            value = datetime.fromisoformat(text)
+        except (TypeError, ValueError):
+            return None
+    # Compare everything as naive local time
+    return value.astimezone().replace(tzinfo=None) if value.tzinfo else value
+
+
+# Success Score by status; decaying statuses lose points after two weeks
+STATUS_WEIGHTS = {
+    'Applied': 30,
+    'Phone Screen': 50,
+    'Interview Scheduled': 60,
+    'Interviewed': 70,
+    'Second Interview': 85,
+    'Offer Received': 95,
+    'Accepted': 100,
+    'Rejected': 0,
+    'Withdrawn': 0,
+    'Follow-up Needed': 40
+}
+DEFAULT_WEIGHT = 30
+DECAYING_STATUSES = ('Applied', 'Follow-up Needed')
+DECAY_AFTER_DAYS = 14
+SCORE_FLOOR = 10
+# Days after which every decaying score has reached SCORE_FLOOR
+SCORE_SETTLED_DAYS = DECAY_AFTER_DAYS + max(
+    (STATUS_WEIGHTS[status] - SCORE_FLOOR + 1) // 2 for status in DECAYING_STATUSES
+)
+
+
+def days_since(applied_on: Optional[date], as_of: date) -> int:
+    """Whole days from applied_on to as_of, or 0 without a valid date"""
+    return as_of.toordinal() - applied_on.toordinal() if applied_on is not None else 0
+
+
+def success_score(status: str, days: int) -> int:
+    """Success probability score (0-100)"""
+    base_score = STATUS_WEIGHTS.get(status, DEFAULT_WEIGHT)
+
+    # Reduce score if too much time has passed without progress
+    if status in DECAYING_STATUSES and days > DECAY_AFTER_DAYS:
+        base_score = max(SCORE_FLOOR, base_score - (days - DECAY_AFTER_DAYS) * 2)
+
+    return min(100, max(0, base_score))
+
+
+class Application:
+    """
+    One tracked application
+
+    Dates are parsed once, when the record is built; the original date
+    text is kept alongside so rows round-trip to storage unchanged. Days
+    Since Applied and Success Score are virtual: they are derived from
+    Application Date and Status against an as-of date (today unless one
+    is given) and memoized until the date changes, so they never go
+    stale and are never rewritten just because time passed. Stored
+    values for them are ignored on read.
+
+    Records also answer app['Column Name'] and app.get('Column Name')
+    with the API value, so code written against the dict form keeps
+    working. Use to_dict() at API boundaries and to_row() for storage.
+    """
+
+    __slots__ = (
+        'app_id', 'company', 'job_title', 'application_date', 'status',
+        'contact_person', 'contact_email', 'salary_range', 'job_url',
+        'interview_date', 'follow_up_date', 'notes', 'last_updated',
+        'applied_on', 'interview_at', 'follow_up_on', '_as_of', '_derived'
+    )
+
+    # Column name -> attribute, in column order
+    COLUMNS = (
+        ('Application ID', 'app_id'),
+        ('Company Name', 'company'),
+        ('Job Title', 'job_title'),
+        ('Application Date', 'application_date'),
+        ('Status', 'status'),
+        ('Days Since Applied', 'days_since_applied'),
+        ('Contact Person', 'contact_person'),
+        ('Contact Email', 'contact_email'),
+        ('Salary Range', 'salary_range'),
+        ('Job URL', 'job_url'),
+        ('Interview Date', 'interview_date'),
+        ('Follow-up Date', 'follow_up_date'),
+        ('Notes', 'notes'),
+        ('Last Updated', 'last_updated'),
+        ('Success Score', 'success_score'),
+    )
+    ATTRIBUTES = dict(COLUMNS)
+    # Derived on read (see derived()), never taken from storage
+    VIRTUAL = ('days_since_applied', 'success_score')
+    STORED_COLUMNS = tuple(pair for pair in COLUMNS if pair[1] not in ('days_since_applied', 'success_score'))
+    # Attributes holding a date without a time
+    DATE_ATTRIBUTES = ('application_date', 'follow_up_date')
+
+    def __init__(self, **fields):
+        for column, attr in self.STORED_COLUMNS:
+            value = fields.get(attr)
+            if value is None:
+                # Missing values are stored as empty text, as csv.DictWriter wrote them
+                value = ''
+            elif isinstance(value, date):
+                # date and datetime objects are kept as the text storage holds
+                if isinstance(value, datetime):
+                    value = value.date() if attr in self.DATE_ATTRIBUTES else value.replace(microsecond=0)
+                value = str(value)
+            setattr(self, attr, value)
+        self.applied_on = parse_date(self.application_date)
+        self.interview_at = parse_datetime(self.interview_date)
+        self.follow_up_on = parse_date(self.follow_up_date)
+        self._as_of = None
+        self._derived = None
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'Application':
+        """Build from a column-keyed dict (storage row or API dict)"""
+        return cls(**{attr: row.get(column, '') for column, attr in cls.STORED_COLUMNS})
+
+    def derived(self, as_of: Optional[date] = None) -> tuple:
+        """(Days Since Applied, Success Score) as of a date, today by default"""
+        if as_of is None:
+            as_of = date.today()
+        if as_of != self._as_of:
+            days = days_since(self.applied_on, as_of)
+            self._derived = (days, success_score(self.status, days))
+            self._as_of = as_of
+        return self._derived
+
+    @property
+    def days_since_applied(self) -> int:
+        return self.derived()[0]
+
+    @property
+    def success_score(self) -> int:
+        return self.derived()[1]
+
+    def to_dict(self, as_of: Optional[date] = None) -> Dict[str, Any]:
+        """Column-keyed dict with Days Since Applied and Success Score as of a date (ints)"""
+        derived = dict(zip(self.VIRTUAL, self.derived(as_of)))
+        return {column: derived[attr] if attr in derived else getattr(self, attr)
+                for column, attr in self.COLUMNS}
+
+    def to_row(self, as_of: Optional[date] = None) -> Dict[str, str]:
+        """Column-keyed dict of strings, as stored"""
+        return {column: str(value) for column, value in self.to_dict(as_of).items()}
+
+    def __getitem__(self, column: str) -> Any:
+        return getattr(self, self.ATTRIBUTES[column])
+
+    def get(self, column: str, default: Any = None) -> Any:
+        attr = self.ATTRIBUTES.get(column)
+        return getattr(self, attr) if attr is not None else default
+
+    def __repr__(self) -> str:
+        return f'Application({self.app_id!r}, {self.company!r}, {self.job_title!r}, {self.status!r})'
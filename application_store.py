@@ -0,0 +1,714 @@
+"""
+In-memory Application Store for Job Application Tracker
+Keeps parsed applications resident with primary and secondary indexes
+"""
+
+import heapq
+from array import array
+from bisect import bisect_left, insort
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from math import isqrt
+from typing import Dict, List, Any, Optional, Iterable
+
+from application_record import (
+    Application, DECAYING_STATUSES, SCORE_FLOOR, SCORE_SETTLED_DAYS, parse_date, success_score
+)
+from trigram_index import TrigramIndex, similarity
+
+
+def parse_app_id(app_id: str) -> Optional[int]:
+    """Numeric part of an APP### id, or None for ids in another format"""
+    if app_id.startswith('APP') and app_id[3:].isdigit():
+        return int(app_id[3:])
+    return None
+
+
+def format_app_id(number: int) -> str:
+    """APP followed by at least three digits (APP007, APP1234)"""
+    return f'APP{number:03d}'
+
+
+@lru_cache(maxsize=65536)
+def _normalize_text(value: str) -> str:
+    # Company names and titles repeat across applications, so results are cached
+    return ' '.join((value or '').casefold().split())
+
+
+def _normalize_url(value: str) -> str:
+    if not value:
+        return ''
+    url = value.strip().casefold().split('#', 1)[0]
+    for prefix in ('https://', 'http://'):
+        if url.startswith(prefix):
+            url = url[len(prefix):]
+    if url.startswith('www.'):
+        url = url[4:]
+    return url.rstrip('/')
+
+
+def duplicate_key(company: str, job_title: str, application_date: str, job_url: str) -> tuple:
+    """
+    Normalized (company, title, date, URL) identity of an application
+
+    Case and runs of whitespace are ignored in names, dates compare as
+    dates (unparseable ones as stripped text), and URLs ignore scheme, a leading www., fragment and trailing
+    slash.
+    """
+    if isinstance(application_date, str):
+        application_date = application_date.strip()
+    applied_on = parse_date(application_date)
+    return (
+        _normalize_text(company),
+        _normalize_text(job_title),
+        applied_on or str(application_date or ''),
+        _normalize_url(job_url)
+    )
+
+
+def record_key(record: Application) -> tuple:
+    """duplicate_key() of a stored record"""
+    return (
+        _normalize_text(record.company),
+        _normalize_text(record.job_title),
+        record.applied_on or record.application_date.strip(),
+        _normalize_url(record.job_url)
+    )
+
+
+def _text_fields(record: Application) -> tuple:
+    """The fields text_index.TextIndex indexes"""
+    return record.company, record.job_title, record.notes
+
+
+class ApplicationColumns:
+    """
+    Column arrays of the fields analytics aggregate, one slot per record
+
+    Status and Company Name are held as categorical codes into statuses
+    and companies; applied and follow_up hold date ordinals, with NO_DATE
+    where the record has none. Slots follow store order and are updated in place,
+    so numpy can view the arrays without copying (see
+    vectorized_analytics).
+    """
+
+    NO_DATE = 2 ** 31 - 1
+
+    def __init__(self):
+        self.statuses: List[str] = []
+        self.companies: List[str] = []
+        self._status_codes: Dict[str, int] = {}
+        self._company_codes: Dict[str, int] = {}
+        self.status = array('i')
+        self.company = array('i')
+        self.applied = array('i')
+        self.follow_up = array('i')
+
+    @staticmethod
+    def _code(value: str, codes: Dict[str, int], values: List[str]) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _fields(self, record: Application) -> tuple:
+        return (
+            self._code(record.status, self._status_codes, self.statuses),
+            self._code(record.company, self._company_codes, self.companies),
+            record.applied_on.toordinal() if record.applied_on is not None else self.NO_DATE,
+            record.follow_up_on.toordinal() if record.follow_up_on is not None else self.NO_DATE,
+        )
+
+    def append(self, record: Application):
+        status, company, applied, follow_up = self._fields(record)
+        self.status.append(status)
+        self.company.append(company)
+        self.applied.append(applied)
+        self.follow_up.append(follow_up)
+
+    def set(self, position: int, record: Application):
+        status, company, applied, follow_up = self._fields(record)
+        self.status[position] = status
+        self.company[position] = company
+        self.applied[position] = applied
+        self.follow_up[position] = follow_up
+
+
+class ApplicationAggregates:
+    """
+    Running totals behind the analytics metrics
+
+    Status counts come from the store's status index. This keeps the
+    number and ordinal sum of valid Application Dates, from which the
+    Days Since Applied total on any date follows, and per company the
+    record count, the Success Score total of records whose score does not
+    change with time, and the number of records whose score decays.
+    Decaying scores reach SCORE_FLOOR within SCORE_SETTLED_DAYS, so on
+    read only the ones applied more recently need scoring (see
+    ApplicationStore.company_score_averages). add() and remove() are
+    O(1), so the store applies a change by removing the old record and
+    adding the new one.
+    """
+
+    def __init__(self):
+        self.dated = 0
+        self.applied_total = 0
+        # company -> [fixed Success Score total, records, decaying records]
+        self.company_scores: Dict[str, List[int]] = {}
+
+    @staticmethod
+    def decays(record: Application) -> bool:
+        """Whether the record's Success Score depends on the as-of date"""
+        return record.status in DECAYING_STATUSES and record.applied_on is not None
+
+    def add(self, record: Application):
+        if record.applied_on is not None:
+            self.dated += 1
+            self.applied_total += record.applied_on.toordinal()
+        totals = self.company_scores.get(record.company)
+        if totals is None:
+            totals = self.company_scores[record.company] = [0, 0, 0]
+        totals[1] += 1
+        if self.decays(record):
+            totals[2] += 1
+        else:
+            totals[0] += success_score(record.status, 0)
+
+    def remove(self, record: Application):
+        if record.applied_on is not None:
+            self.dated -= 1
+            self.applied_total -= record.applied_on.toordinal()
+        totals = self.company_scores[record.company]
+        totals[1] -= 1
+        if self.decays(record):
+            totals[2] -= 1
+        else:
+            totals[0] -= success_score(record.status, 0)
+        if not totals[1]:
+            del self.company_scores[record.company]
+
+    def total_days(self, as_of: date) -> int:
+        """Sum of Days Since Applied as of a date"""
+        return self.dated * as_of.toordinal() - self.applied_total
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, ApplicationAggregates) and self.dated == other.dated
+                and self.applied_total == other.applied_total
+                and self.company_scores == other.company_scores)
+
+
+def date_key(value: date) -> int:
+    """Day number of a date"""
+    return value.toordinal()
+
+
+def datetime_key(value: datetime) -> int:
+    """Whole seconds since 0001-01-01 of a datetime (sub-second part dropped)"""
+    return value.toordinal() * 86400 + value.hour * 3600 + value.minute * 60 + value.second
+
+
+class DateIndex:
+    """
+    Store positions ordered by a date column, for range lookups
+
+    Entries are ints packing the date key above the 32-bit position, so
+    the sorted list orders by date, then store order. Additions are
+    insorted into a small sorted buffer, and removals of entries in the
+    main list become tombstones. Lookups bisect both lists, so neither
+    needs a re-sort. The buffer is merged into the main list (dropping
+    tombstones in the same pass) once it outgrows four times the square
+    root of the main list, or once tombstones reach a quarter of it, so a write costs
+    O(sqrt n) amortized and a lookup O(log n + k).
+    """
+
+    SHIFT = 32
+    MASK = (1 << 32) - 1
+    MIN_BUFFER = 256
+
+    def __init__(self):
+        self._entries: List[int] = []
+        self._sorted = True
+        self._buffer: List[int] = []
+        self._removed = set()
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._buffer) - len(self._removed)
+
+    def extend(self, items: Iterable[tuple]):
+        """Bulk-add (key, position) pairs; they are sorted once, on the next lookup"""
+        self._entries.extend(key << self.SHIFT | position for key, position in items)
+        self._sorted = False
+
+    def add(self, key: int, position: int):
+        entry = key << self.SHIFT | position
+        if entry in self._removed:
+            self._removed.discard(entry)
+            return
+        insort(self._buffer, entry)
+        if len(self._buffer) > max(self.MIN_BUFFER, 4 * isqrt(len(self._entries))):
+            self._merge()
+
+    def remove(self, key: int, position: int):
+        entry = key << self.SHIFT | position
+        buffer = self._buffer
+        index = bisect_left(buffer, entry)
+        if index < len(buffer) and buffer[index] == entry:
+            del buffer[index]
+            return
+        self._removed.add(entry)
+        if len(self._removed) * 4 >= len(self._entries):
+            self._merge()
+
+    def _merge(self):
+        """Fold the buffer into the main list and drop tombstones, in one pass"""
+        entries = self._entries
+        if self._removed:
+            removed = self._removed
+            entries = [entry for entry in entries if entry not in removed]
+            self._removed = set()
+        # Two sorted runs: Timsort merges them in linear time
+        entries.extend(self._buffer)
+        entries.sort()
+        self._entries = entries
+        self._buffer = []
+        self._sorted = True
+
+    def _settle(self):
+        if not self._sorted:
+            self._entries.sort()
+            self._sorted = True
+
+    def between(self, low: Optional[int] = None, high: Optional[int] = None) -> List[int]:
+        """Positions whose key is within [low, high] (either end open when None), in store order"""
+        self._settle()
+        low_entry = None if low is None else low << self.SHIFT
+        high_entry = None if high is None else (high + 1) << self.SHIFT
+        positions = []
+        for entries in (self._entries, self._buffer):
+            start = 0 if low_entry is None else bisect_left(entries, low_entry)
+            stop = len(entries) if high_entry is None else bisect_left(entries, high_entry)
+            positions.extend(entries[start:stop])
+        removed = self._removed
+        return sorted(entry & self.MASK for entry in positions if entry not in removed)
+
+    def last(self, count: int) -> List[int]:
+        """Positions of the count highest keys, highest first (ties in store order)"""
+        if count <= 0:
+            return []
+        self._settle()
+        removed = self._removed
+        latest = []
+        # Walk down from the top, finishing the last key reached so ties go to earlier rows
+        for entry in heapq.merge(reversed(self._entries), reversed(self._buffer), reverse=True):
+            if len(latest) >= count and entry >> self.SHIFT != latest[-1] >> self.SHIFT:
+                break
+            if entry not in removed:
+                latest.append(entry)
+        latest.sort(key=lambda entry: (-(entry >> self.SHIFT), entry & self.MASK))
+        return [entry & self.MASK for entry in latest[:count]]
+
+
+class ApplicationStore:
+    """
+    Resident, indexed copy of the tracked applications
+
+    Records are kept in file order. The primary index maps Application ID
+    to the record, and secondary indexes map (Company Name, Job Title) and
+    Status to the Application IDs that carry them. by_company maps each
+    company to its job titles, and company_names indexes the companies by
+    trigram for fuzzy lookups, and company_first to the store position of
+    its first record (analytics list tied companies in that order, as a
+    scan would). by_duplicate_key maps
+    each record's normalized duplicate_key() to the first Application ID
+    with it, and duplicate_ids to any later ones. text_index, once set
+    (see text_index.TextIndex), is kept current with every change. max_id
+    tracks the highest APP### number seen, and version increases on every
+    change.
+    columns mirrors the aggregated fields column-wise, in record order,
+    and aggregates keeps the analytics running totals. Date indexes on
+    Application, Follow-up and Interview Date answer range queries
+    without a scan.
+    """
+
+    def __init__(self, records: Iterable[Application] = ()):
+        self.records: Dict[str, Application] = {}
+        self.max_id = 0
+        self.version = 0
+        self.by_company_title: Dict[tuple, List[str]] = {}
+        self.by_company: Dict[str, Dict[str, None]] = {}
+        self.company_names = TrigramIndex(strip_suffixes=True)
+        self.company_first: Dict[str, int] = {}
+        self.by_status: Dict[str, Dict[str, None]] = {}
+        self.by_duplicate_key: Dict[tuple, str] = {}
+        self.duplicate_ids: Dict[tuple, List[str]] = {}
+        self.positions: Dict[str, int] = {}
+        self.rows: List[Application] = []
+        self.columns = ApplicationColumns()
+        self.aggregates = ApplicationAggregates()
+        self.by_applied_on = DateIndex()
+        self.by_follow_up = DateIndex()
+        self.by_interview = DateIndex()
+        self.text_index = None
+
+        # Date indexes are built in one sort after the initial load
+        self._loading = True
+        for record in records:
+            self.add(record)
+        self._loading = False
+        self._build_date_indexes()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> 'ApplicationStore':
+        """Build from storage rows"""
+        return cls(Application.from_row(row) for row in rows)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, app_id: str) -> bool:
+        return app_id in self.records
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def _build_date_indexes(self):
+        self.by_applied_on = DateIndex()
+        self.by_follow_up = DateIndex()
+        self.by_interview = DateIndex()
+        records = list(self.records.values())
+        self.by_applied_on.extend((date_key(app.applied_on), position)
+                                  for position, app in enumerate(records) if app.applied_on is not None)
+        self.by_follow_up.extend((date_key(app.follow_up_on), position)
+                                 for position, app in enumerate(records) if app.follow_up_on is not None)
+        self.by_interview.extend((datetime_key(app.interview_at), position)
+                                 for position, app in enumerate(records) if app.interview_at is not None)
+
+    def _index(self, record: Application):
+        key = (record.company, record.job_title)
+        ids = self.by_company_title.get(key)
+        if ids is not None:
+            ids.append(record.app_id)
+        else:
+            self.by_company_title[key] = [record.app_id]
+            titles = self.by_company.get(record.company)
+            if titles is None:
+                self.by_company[record.company] = {record.job_title: None}
+                self.company_names.add(record.company)
+            else:
+                titles[record.job_title] = None
+        first = self.company_first.get(record.company)
+        if first is None or self.positions[record.app_id] < first:
+            self.company_first[record.company] = self.positions[record.app_id]
+        self.by_status.setdefault(record.status, {})[record.app_id] = None
+        key = record_key(record)
+        if self.by_duplicate_key.setdefault(key, record.app_id) != record.app_id:
+            self.duplicate_ids.setdefault(key, []).append(record.app_id)
+        self.aggregates.add(record)
+        if self.text_index is not None:
+            self.text_index.add(self.positions[record.app_id], record)
+        if self._loading:
+            return
+        position = self.positions[record.app_id]
+        if record.applied_on is not None:
+            self.by_applied_on.add(date_key(record.applied_on), position)
+        if record.follow_up_on is not None:
+            self.by_follow_up.add(date_key(record.follow_up_on), position)
+        if record.interview_at is not None:
+            self.by_interview.add(datetime_key(record.interview_at), position)
+
+    def _unindex(self, record: Application):
+        key = (record.company, record.job_title)
+        ids = self.by_company_title.get(key, [])
+        if record.app_id in ids:
+            ids.remove(record.app_id)
+        if not ids and self.by_company_title.pop(key, None) is not None:
+            titles = self.by_company[record.company]
+            titles.pop(record.job_title, None)
+            if not titles:
+                del self.by_company[record.company]
+                self.company_names.remove(record.company)
+        if self.company_first.get(record.company) == self.positions[record.app_id]:
+            # Its first record is going; the next one (if any) takes over
+            remaining = [self.positions[app_id] for title in self.by_company.get(record.company, ())
+                         for app_id in self.by_company_title[(record.company, title)]]
+            if remaining:
+                self.company_first[record.company] = min(remaining)
+            else:
+                del self.company_first[record.company]
+
+        members = self.by_status.get(record.status, {})
+        members.pop(record.app_id, None)
+        if not members:
+            self.by_status.pop(record.status, None)
+
+        key = record_key(record)
+        if self.by_duplicate_key.get(key) == record.app_id:
+            later = self.duplicate_ids.pop(key, None)
+            if later:
+                self.by_duplicate_key[key] = later.pop(0)
+                if later:
+                    self.duplicate_ids[key] = later
+            else:
+                del self.by_duplicate_key[key]
+        else:
+            ids = self.duplicate_ids.get(key, [])
+            if record.app_id in ids:
+                ids.remove(record.app_id)
+            if not ids:
+                self.duplicate_ids.pop(key, None)
+        self.aggregates.remove(record)
+        if self.text_index is not None:
+            self.text_index.remove(self.positions[record.app_id], record)
+        if self._loading:
+            return
+        position = self.positions[record.app_id]
+        if record.applied_on is not None:
+            self.by_applied_on.remove(date_key(record.applied_on), position)
+        if record.follow_up_on is not None:
+            self.by_follow_up.remove(date_key(record.follow_up_on), position)
+        if record.interview_at is not None:
+            self.by_interview.remove(datetime_key(record.interview_at), position)
+
+    def add(self, record: Application):
+        """Insert a record, replacing any record with the same Application ID"""
+        app_id = record.app_id
+        if app_id in self.records:
+            self._unindex(self.records[app_id])
+            self.rows[self.positions[app_id]] = record
+            self.columns.set(self.positions[app_id], record)
+        else:
+            self.positions[app_id] = len(self.rows)
+            self.rows.append(record)
+            self.columns.append(record)
+        self.records[app_id] = record
+        self._index(record)
+        self.version += 1
+
+        number = parse_app_id(app_id)
+        if number is not None and number > self.max_id:
+            self.max_id = number
+
+    def replace(self, record: Application):
+        """Swap the stored record with the same Application ID and refresh its index entries"""
+        self._unindex(self.records[record.app_id])
+        self.records[record.app_id] = record
+        self._index(record)
+        self.rows[self.positions[record.app_id]] = record
+        self.columns.set(self.positions[record.app_id], record)
+        self.version += 1
+
+    def adopt_text_index(self, previous: 'ApplicationStore'):
+        """
+        Take over previous's full-text index, reindexing only what differs
+
+        Records are matched by Application ID, so a reload after rows were
+        appended, updated or archived re-tokenizes just those rows and moves
+        the postings of the rest to their new positions.
+        """
+        index, old_rows = previous.text_index, previous.rows
+        previous.text_index = None
+        moved = {}  # old position -> new position, for records whose text is unchanged
+        for position, old in enumerate(old_rows):
+            new_position = self.positions.get(old.app_id)
+            if new_position is not None and _text_fields(old) == _text_fields(self.rows[new_position]):
+                moved[position] = new_position
+            else:
+                index.remove(position, old)
+        if any(old != new for old, new in moved.items()):
+            index.remap(moved)
+        kept = set(moved.values())
+        for position, record in enumerate(self.rows):
+            if position not in kept:
+                index.add(position, record)
+        self.text_index = index
+
+    def get(self, app_id: str) -> Optional[Application]:
+        return self.records.get(app_id)
+
+    def find(self, company: str, job_title: str) -> List[Application]:
+        """Records matching an exact Company Name + Job Title pair"""
+        return [self.records[app_id] for app_id in self.by_company_title.get((company, job_title), [])]
+
+    def find_similar(self, company: str, job_title: str = '', limit: int = 5,
+                     min_score: float = 0.6) -> List[tuple]:
+        """
+        Records whose Company Name and Job Title best match, allowing typos
+        and legal-form differences ("Google" vs "Google LLC")
+
+        Candidate companies come from the trigram index; only their job
+        titles are compared. Company and title must each be at least
+        min_score similar (the title only when job_title is given); the
+        score weights the company twice the title, and an exact pair
+        scores 1.0.
+
+        Returns:
+            [(score, record)], best first (equal scores in store order), at
+            most limit
+        """
+        positions = self.positions
+        scored = []
+        if (company, job_title) in self.by_company_title:
+            scored.append((1.0, -1, company, job_title))  # ahead of any other perfect match
+        candidates = self.company_names.similar(company, limit=10, min_score=min_score, order=self.company_first)
+        for company_score, name in candidates:
+            for title in self.by_company[name]:
+                if name == company and title == job_title:
+                    continue
+                if job_title:
+                    title_score = similarity(job_title, title)
+                    if title_score < min_score:
+                        continue
+                    score = round((2 * company_score + title_score) / 3, 3)
+                else:
+                    score = company_score
+                first = min(map(positions.__getitem__, self.by_company_title[(name, title)]))
+                scored.append((score, first, name, title))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        matches = []
+        for score, _, name, title in scored:
+            for app_id in sorted(self.by_company_title[(name, title)], key=positions.__getitem__):
+                matches.append((score, self.records[app_id]))
+                if len(matches) >= limit:
+                    return matches
+        return matches
+
+    def duplicates_of(self, key: tuple) -> List[Application]:
+        """Records whose duplicate_key() equals key"""
+        first = self.by_duplicate_key.get(key)
+        if first is None:
+            return []
+        return [self.records[app_id] for app_id in [first] + self.duplicate_ids.get(key, [])]
+
+    def find_duplicates(self) -> List[List[Application]]:
+        """Groups of two or more records sharing a duplicate_key(), in one pass over the duplicates"""
+        return [
+            [self.records[app_id] for app_id in [self.by_duplicate_key[key]] + later]
+            for key, later in self.duplicate_ids.items()
+        ]
+
+    def with_status(self, status: str) -> List[Application]:
+        """Records currently in the given status, in insertion order"""
+        return [self.records[app_id] for app_id in self.by_status.get(status, {})]
+
+    def matching(self, filters: Dict[str, Any]) -> List[Application]:
+        """
+        Records whose columns equal the given values, in store order
+
+        Each filter value is a single value or a list/tuple/set of allowed
+        values. Status and an exact Company Name + Job Title pair are
+        answered from their indexes; other columns only narrow those
+        candidates (or, with no indexed filter, are checked on every record).
+        """
+        allowed = {
+            column: set(value) if isinstance(value, (list, tuple, set, frozenset)) else {value}
+            for column, value in filters.items()
+        }
+        for column in allowed:
+            if column not in Application.ATTRIBUTES:
+                raise ValueError(f"Unknown column '{column}'")
+
+        candidates = None
+        if 'Status' in allowed:
+            candidates = [app_id for status in allowed.pop('Status') for app_id in self.by_status.get(status, {})]
+        elif len(allowed.get('Company Name', ())) == 1 and len(allowed.get('Job Title', ())) == 1:
+            key = (next(iter(allowed.pop('Company Name'))), next(iter(allowed.pop('Job Title'))))
+            candidates = list(self.by_company_title.get(key, []))
+
+        if candidates is None:
+            records = self.rows
+        else:
+            records = self._at(sorted(self.positions[app_id] for app_id in candidates))
+        if not allowed:
+            return list(records)
+        checks = [(Application.ATTRIBUTES[column], values) for column, values in allowed.items()]
+        return [app for app in records if all(getattr(app, attr) in values for attr, values in checks)]
+
+    def status_counts(self) -> Dict[str, int]:
+        """Number of records per Status"""
+        return {status: len(ids) for status, ids in self.by_status.items()}
+
+    def company_score_averages(self, as_of: date) -> Dict[str, float]:
+        """
+        Mean Success Score per company as of a date
+
+        Fixed scores come from the running totals and settled decaying
+        ones count as SCORE_FLOOR; only applications dated within the last
+        SCORE_SETTLED_DAYS are scored individually, found through the
+        Application Date index. Companies are listed in order of their
+        first record, as a scan of the records would.
+        """
+        totals = {
+            company: [fixed + SCORE_FLOOR * decaying, count]
+            for company, (fixed, count, decaying) in self.aggregates.company_scores.items()
+        }
+        recent = self.by_applied_on.between(low=date_key(as_of) - SCORE_SETTLED_DAYS + 1)
+        for app in self._at(recent):
+            if app.status in DECAYING_STATUSES:
+                totals[app.company][0] += app.derived(as_of)[1] - SCORE_FLOOR
+        company_first = self.company_first
+        return {company: totals[company][0] / totals[company][1]
+                for company in sorted(totals, key=company_first.__getitem__)}
+
+    def _at(self, positions: List[int]) -> List[Application]:
+        rows = self.rows
+        return [rows[position] for position in positions]
+
+    def follow_ups_due(self, today: date) -> List[Application]:
+        """Records with a Follow-up Date on or before today, in store order"""
+        return self._at(self.by_follow_up.between(high=date_key(today)))
+
+    def interviews_between(self, start: datetime, end: datetime) -> List[Application]:
+        """Records with an Interview Date within [start, end], in store order"""
+        candidates = self._at(self.by_interview.between(datetime_key(start), datetime_key(end)))
+        # Keys are whole seconds; compare exactly at the edges
+        return [app for app in candidates if start <= app.interview_at <= end]
+
+    def latest_applied(self, count: int) -> List[Application]:
+        """
+        The count records with the latest Application Date, newest first
+
+        Records without a valid date come last, in store order.
+        """
+        latest = self._at(self.by_applied_on.last(count))
+        if len(latest) < count:
+            undated = (app for app in self.records.values() if app.applied_on is None)
+            latest.extend(islice(undated, count - len(latest)))
+        return latest
+
+    def verify_aggregates(self) -> bool:
+        """
+        Recount the status index and running totals from the records
+
+        Returns True if they matched; otherwise both are rebuilt from the
+        records and False is returned.
+        """
+        expected_status: Dict[str, int] = {}
+        expected_first: Dict[str, int] = {}
+        expected = ApplicationAggregates()
+        for position, record in enumerate(self.rows):
+            expected_status[record.status] = expected_status.get(record.status, 0) + 1
+            expected_first.setdefault(record.company, position)
+            expected.add(record)
+        if (expected == self.aggregates and expected_status == self.status_counts()
+                and expected_first == self.company_first):
+            return True
+
+        self.by_company_title = {}
+        self.by_company = {}
+        self.company_names = TrigramIndex(strip_suffixes=True)
+        self.company_first = {}
+        self.by_status = {}
+        self.by_duplicate_key = {}
+        self.duplicate_ids = {}
+        self.text_index = None
+        self.aggregates = ApplicationAggregates()
+        self._loading = True
+        for record in self.records.values():
+            self._index(record)
+        self._loading = False
+        self._build_date_indexes()
+        self.version += 1
+        return False
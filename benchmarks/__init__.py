@@ -0,0 +1,4 @@
+"""
+Benchmarks for Job Application Tracker
+Synthetic datasets and timing scripts; run the scripts from the repository root
+"""
@@ -0,0 +1,70 @@
+"""
+Analytics Benchmark for Job Application Tracker
+Times from-scratch (row-by-row and NumPy) against incremental analytics
+
+Usage: python benchmarks/analytics_benchmark.py [--sizes 10000 100000 1000000] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_store import ApplicationStore
+from benchmarks.synthetic_data import generate_records
+from job_tracker_manager import JobTrackerManager
+import vectorized_analytics
+
+
+def synthetic_store(size: int, seed: int = 42) -> ApplicationStore:
+    """size realistic applications dated within the last year (see synthetic_data)"""
+    return ApplicationStore(generate_records(size, seed))
+
+
+def best_of(repeat: int, func):
+    """Fastest wall time in seconds over repeat calls, and the last result"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if not vectorized_analytics.available():
+        sys.exit('numpy is not installed (pip install numpy)')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tracker = JobTrackerManager(os.path.join(tmp, 'bench.csv'), storage='csv')
+
+        def timed(engine, compute):
+            tracker.analytics_engine = engine
+            return best_of(args.repeat, compute)
+
+        print(f"{'rows':>10} {'python (ms)':>12} {'numpy (ms)':>12} {'incremental (ms)':>17}")
+        for size in args.sizes:
+            # Serve the synthetic store as if loaded; the empty file never changes
+            tracker.store = synthetic_store(size)
+            tracker._fingerprint = tracker.storage.fingerprint()
+
+            rows_time, rows_result = timed('python', tracker.recompute_analytics)
+            numpy_time, numpy_result = timed('numpy', tracker.recompute_analytics)
+            incremental_time, incremental_result = timed('auto', tracker._compute_analytics)
+            if not rows_result == numpy_result == incremental_result:
+                sys.exit(f'Results differ at {size} rows')
+            print(f'{size:>10} {rows_time * 1000:>12.1f} {numpy_time * 1000:>12.1f} '
+                  f'{incremental_time * 1000:>17.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+Synthetic Data for Job Application Tracker
+Reproducible, realistic application datasets for benchmarks (1k to 1M+ rows)
+
+Usage: python benchmarks/synthetic_data.py 100000 [-o synthetic.csv] [--seed 42]
+"""
+
+import argparse
+import bisect
+import itertools
+import os
+import random
+import sys
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Iterator, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_record import Application, days_since, success_score
+from application_store import format_app_id
+from tracker_export import csv_chunks, write_chunks
+
+HEADERS = [column for column, _ in Application.COLUMNS]
+
+# Share of applications in each status: most are waiting or rejected, few reach an offer
+STATUS_DISTRIBUTION = {
+    'Applied': 0.38,
+    'Rejected': 0.32,
+    'Phone Screen': 0.08,
+    'Interviewed': 0.05,
+    'Follow-up Needed': 0.04,
+    'Interview Scheduled': 0.04,
+    'Withdrawn': 0.035,
+    'Second Interview': 0.03,
+    'Offer Received': 0.015,
+    'Accepted': 0.01,
+}
+INTERVIEW_STATUSES = ('Interview Scheduled', 'Interviewed', 'Second Interview', 'Offer Received', 'Accepted')
+FOLLOW_UP_STATUSES = ('Applied', 'Follow-up Needed')
+
+COMPANY_PREFIXES = [
+    'Blue', 'Bright', 'Cloud', 'Cyber', 'Data', 'Deep', 'Digital', 'Green', 'Hyper', 'Iron',
+    'Lumen', 'Meta', 'Micro', 'Nova', 'Open', 'Peak', 'Quantum', 'Red', 'Silver', 'Smart',
+    'Solar', 'Stellar', 'Swift', 'True', 'Vast', 'Vertex', 'Wave', 'Zen', 'North', 'Core'
+]
+COMPANY_ROOTS = [
+    'bridge', 'byte', 'cast', 'dyne', 'field', 'flow', 'forge', 'gate', 'grid', 'hub',
+    'labs', 'line', 'logic', 'mind', 'path', 'point', 'scale', 'sense', 'shift', 'signal',
+    'soft', 'sphere', 'stack', 'stream', 'sys', 'tech', 'tide', 'ware', 'works', 'yard'
+]
+COMPANY_KINDS = [
+    '', ' Analytics', ' Systems', ' Health', ' Financial', ' Robotics', ' Media', ' Energy',
+    ' Labs', ' Software', ' Networks', ' Logistics', ' Security', ' Games', ' Bio', ' Retail'
+]
+LEGAL_FORMS = ['', '', '', ' Inc', ' LLC', ' Ltd', ' Corp']
+
+SENIORITY = ['', '', 'Junior ', 'Senior ', 'Senior ', 'Staff ', 'Lead ', 'Principal ']
+ROLES = [
+    'Software Engineer', 'Software Engineer', 'Backend Engineer', 'Frontend Engineer',
+    'Full Stack Developer', 'Data Scientist', 'Data Engineer', 'Machine Learning Engineer',
+    'DevOps Engineer', 'Site Reliability Engineer', 'Product Manager', 'Data Analyst',
+    'Mobile Developer', 'QA Engineer', 'Security Engineer', 'Engineering Manager'
+]
+SALARY_BANDS = [(70, 90), (80, 100), (90, 120), (110, 140), (120, 150), (140, 180), (160, 200), (180, 240)]
+
+FIRST_NAMES = ['Alex', 'Sam', 'Jordan', 'Taylor', 'Morgan', 'Casey', 'Riley', 'Jamie', 'Avery', 'Quinn',
+               'Priya', 'Wei', 'Fatima', 'Diego', 'Yuki', 'Olu', 'Anna', 'Luca', 'Noor', 'Mateo']
+LAST_NAMES = ['Smith', 'Chen', 'Garcia', 'Patel', 'Kim', 'Nguyen', 'Müller', 'Rossi', 'Okafor', 'Silva',
+              'Johnson', 'Cohen', 'Ivanova', 'Tanaka', 'Haddad', 'Brown', 'Lopez', 'Singh', 'Park', 'Novak']
+
+NOTE_WORDS = (
+    'great team culture remote hybrid onsite role position recruiter reached out referral from '
+    'friend applied via linkedin company website posting mentions python java go rust sql aws gcp '
+    'kubernetes docker react typescript node.js c++ c# spark kafka airflow terraform microservices '
+    'distributed systems machine learning data pipeline startup series funding benefits equity '
+    'salary negotiable relocation visa sponsorship take-home assignment coding challenge system design '
+    'behavioral interview went well need to prepare follow up next week hiring manager panel onsite '
+    'feedback pending strong fit stretch role tech stack matches experience mentor growth on-call '
+    'small team large scale product mission fintech healthcare ecommerce gaming climate security '
+    'asked about projects leadership tradeoffs deadline waiting response rejected email ghosted'
+).split()
+# Share of applications with no notes at all
+EMPTY_NOTES = 0.35
+
+
+def company_name(index: int) -> str:
+    """Deterministic, distinct company name for an index"""
+    p, r, k = len(COMPANY_PREFIXES), len(COMPANY_ROOTS), len(COMPANY_KINDS)
+    name = (COMPANY_PREFIXES[index % p] + COMPANY_ROOTS[(index // p) % r]
+            + COMPANY_KINDS[(index // (p * r)) % k])
+    cycle = index // (p * r * k)
+    if cycle:
+        name += f' {cycle + 1}'
+    return name + LEGAL_FORMS[index % len(LEGAL_FORMS)]
+
+
+def default_companies(size: int) -> int:
+    """Distinct companies for a dataset: grows sub-linearly (1k rows -> 178, 1M -> 31,622)"""
+    return max(1, int(size ** 0.75))
+
+
+def generate_rows(size: int, seed: int = 42, companies: Optional[int] = None, days: int = 365,
+                  as_of: Optional[date] = None) -> Iterator[Dict[str, str]]:
+    """
+    Yield size synthetic applications as stored CSV rows, in ID order
+
+    The same arguments always produce the same rows (as_of fixes "today").
+
+    Args:
+        size: Number of applications
+        seed: Random seed
+        companies: Distinct companies (default_companies(size) if omitted);
+            popularity follows a Zipf-like curve, so a few get many applications
+        days: Applications are spread over this many days before as_of
+        as_of: Reference date for application ages (today by default)
+    """
+    rng = random.Random(seed)
+    as_of = as_of or date.today()
+    companies = companies or default_companies(size)
+    company_names = [company_name(i) for i in range(companies)]
+    company_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(companies)))
+    statuses = list(STATUS_DISTRIBUTION)
+    status_weights = list(itertools.accumulate(STATUS_DISTRIBUTION.values()))
+    titles = [level + role for level in SENIORITY for role in ROLES]
+
+    for n in range(1, size + 1):
+        company = company_names[bisect.bisect(company_weights, rng.random() * company_weights[-1])]
+        status = rng.choices(statuses, cum_weights=status_weights)[0]
+        applied = as_of - timedelta(days=rng.randint(0, days))
+        age = (as_of - applied).days
+        days_applied = days_since(applied, as_of)
+
+        interview = ''
+        if status in INTERVIEW_STATUSES:
+            at = datetime.combine(applied + timedelta(days=rng.randint(5, 30)), time(rng.randint(9, 16)))
+            interview = at.strftime('%Y-%m-%d %H:%M')
+        follow_up = ''
+        if status in FOLLOW_UP_STATUSES and rng.random() < 0.7:
+            follow_up = (applied + timedelta(days=rng.choice((7, 7, 10, 14)))).isoformat()
+
+        contact = email = ''
+        if rng.random() < 0.5:
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            contact = f'{first} {last}'
+            email = f'{first.lower()}@{company.split()[0].lower()}.com'
+        salary = ''
+        if rng.random() < 0.4:
+            low, high = rng.choice(SALARY_BANDS)
+            salary = f'${low}k-${high}k'
+        url = f'https://careers.example.com/{company.split()[0].lower()}/{n}' if rng.random() < 0.8 else ''
+
+        notes = ''
+        if rng.random() >= EMPTY_NOTES:
+            # Mostly a sentence or two, occasionally long interview write-ups
+            words = min(400, max(1, int(rng.lognormvariate(2.5, 1.0))))
+            notes = ' '.join(rng.choices(NOTE_WORDS, k=words)).capitalize()
+
+        updated = datetime.combine(applied + timedelta(days=rng.randint(0, min(age, 60))),
+                                   time(rng.randint(8, 20), rng.randint(0, 59), rng.randint(0, 59)))
+        yield {
+            'Application ID': format_app_id(n),
+            'Company Name': company,
+            'Job Title': rng.choice(titles),
+            'Application Date': applied.isoformat(),
+            'Status': status,
+            'Days Since Applied': str(days_applied),
+            'Contact Person': contact,
+            'Contact Email': email,
+            'Salary Range': salary,
+            'Job URL': url,
+            'Interview Date': interview,
+            'Follow-up Date': follow_up,
+            'Notes': notes,
+            'Last Updated': updated.strftime('%Y-%m-%d %H:%M:%S'),
+            'Success Score': str(success_score(status, days_applied)),
+        }
+
+
+def generate_records(size: int, seed: int = 42, **options) -> List[Application]:
+    """generate_rows() as Application records"""
+    return [Application.from_row(row) for row in generate_rows(size, seed, **options)]
+
+
+def write_dataset(path: str, size: int, seed: int = 42, **options) -> str:
+    """Write a synthetic tracker CSV (see generate_rows() for options); returns path"""
+    write_chunks(csv_chunks(HEADERS, generate_rows(size, seed, **options), chunk_rows=5000), path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('size', type=int)
+    parser.add_argument('-o', '--output', default='synthetic_applications.csv')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--companies', type=int, help='distinct companies (grows with size by default)')
+    parser.add_argument('--days', type=int, default=365, help='spread of application dates')
+    args = parser.parse_args()
+
+    write_dataset(args.output, args.size, args.seed, companies=args.companies, days=args.days)
+    print(f'Wrote {args.size} applications to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,250 @@
+"""
+Tracker Benchmark for Job Application Tracker
+Times the main tracker, AI assistant and calendar operations on synthetic data
+
+Usage:
+    python benchmarks/tracker_benchmark.py [--sizes 1000 10000 100000] [--storage csv sqlite]
+        [--repeat 5] [--output results.json] [--compare baseline.json [current.json]]
+
+With --compare, results are checked against a saved run (after running, or
+between two saved runs when current.json is given); the exit status is 1 if
+any operation got slower by more than --threshold.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Any, Callable, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ai_assistant import JobApplicationAI
+from benchmarks.synthetic_data import write_dataset
+from calendar_integration import CalendarIntegration
+from job_tracker_manager import JobTrackerManager
+
+OPERATIONS = [
+    'load', 'add_application', 'update_application', 'get_analytics',
+    'get_applications_needing_action', 'export_to_csv', 'get_application_suggestions',
+    'batch_create_reminders'
+]
+
+# Bump when the dataset or the way operations are timed changes; runs with
+# different versions are not comparable
+SUITE_VERSION = 1
+
+
+def measure(func: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict[str, float]:
+    """
+    Time repeat calls of func (setup runs untimed before each)
+
+    Returns:
+        {'min_ms', 'median_ms', 'mean_ms', 'runs'}
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'min_ms': round(min(timings), 3),
+        'median_ms': round(statistics.median(timings), 3),
+        'mean_ms': round(statistics.mean(timings), 3),
+        'runs': repeat
+    }
+
+
+def benchmark_tracker(tracker: JobTrackerManager, operations: List[str], repeat: int,
+                      seed: int) -> Dict[str, Dict[str, float]]:
+    """Time operations on a tracker holding a synthetic dataset; writes go last"""
+    rng = random.Random(seed)
+    ai_assistant = JobApplicationAI()
+    calendar = CalendarIntegration()
+    app_ids = list(tracker.get_store().records)
+    all_applications = tracker.load_applications()
+    added = iter(range(1, repeat + 1))
+    statuses = ['Phone Screen', 'Interview Scheduled', 'Interviewed', 'Rejected']
+
+    def drop_cached():
+        # Time the computation, not a cache hit
+        tracker._derived_cache.clear()
+
+    def add():
+        n = next(added)
+        tracker.add_application({
+            'Company Name': f'Benchmark Company {n}',
+            'Job Title': 'Software Engineer',
+            'Application Date': datetime.now().strftime('%Y-%m-%d'),
+            'Status': 'Applied',
+            'Job URL': f'https://careers.example.com/benchmark/{n}',
+            'Notes': 'Added by the benchmark'
+        })
+
+    def update():
+        tracker.update_application(rng.choice(app_ids), {
+            'Status': rng.choice(statuses),
+            'Notes': 'Updated by the benchmark'
+        })
+
+    def suggest():
+        application = tracker.get_application(rng.choice(app_ids))
+        ai_assistant.get_application_suggestions(application, tracker.get_records(), tracker.get_status_counts())
+
+    cases = {
+        'load': (lambda: tracker.get_store(), tracker.reload),
+        'get_analytics': (tracker.get_analytics, drop_cached),
+        'get_applications_needing_action': (tracker.get_applications_needing_action, drop_cached),
+        'export_to_csv': (lambda: tracker.export_to_csv(io.BytesIO()), None),
+        'get_application_suggestions': (suggest, None),
+        'batch_create_reminders': (lambda: calendar.batch_create_reminders(all_applications), None),
+        'add_application': (add, None),
+        'update_application': (update, None),
+    }
+    return {name: measure(cases[name][0], repeat, cases[name][1]) for name in OPERATIONS if name in operations}
+
+
+def run(sizes: List[int], storages: List[str], operations: List[str], repeat: int, seed: int) -> Dict[str, Any]:
+    """Benchmark every size on every storage backend; returns the JSON-ready report"""
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            dataset = write_dataset(os.path.join(tmp, f'synthetic_{size}.csv'), size, seed)
+            for storage in storages:
+                # Each backend starts from its own copy (SQLite imports the CSV on first start)
+                directory = os.path.join(tmp, f'{storage}_{size}')
+                os.makedirs(directory)
+                path = os.path.join(directory, 'job_applications.csv')
+                with open(dataset, 'rb') as src, open(path, 'wb') as dst:
+                    dst.write(src.read())
+                tracker = JobTrackerManager(path, storage=storage)
+                timings = benchmark_tracker(tracker, operations, repeat, seed)
+                close = getattr(tracker.storage, 'close', None)
+                if close is not None:
+                    close()
+                for operation, timing in timings.items():
+                    results.append({'storage': storage, 'rows': size, 'operation': operation, **timing})
+                    print(f"{storage:>7} {size:>9} {operation:<32} {timing['median_ms']:>10.2f} ms")
+    return {
+        'suite_version': SUITE_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the repository (suffixed '-dirty' with local changes), if known"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=root,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + '-dirty' if dirty else commit
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Median timings of operations present in both runs
+
+    Returns:
+        [{'storage', 'rows', 'operation', 'baseline_ms', 'current_ms',
+          'change' (fraction, + is slower), 'regression'}]
+    """
+    if baseline.get('suite_version') != current.get('suite_version'):
+        raise ValueError('Runs come from different benchmark suite versions and are not comparable')
+
+    def key(entry):
+        return entry['storage'], entry['rows'], entry['operation']
+
+    before = {key(entry): entry for entry in baseline['results']}
+    rows = []
+    for entry in current['results']:
+        old = before.get(key(entry))
+        if old is None:
+            continue
+        change = (entry['median_ms'] - old['median_ms']) / old['median_ms'] if old['median_ms'] else 0.0
+        rows.append({
+            'storage': entry['storage'],
+            'rows': entry['rows'],
+            'operation': entry['operation'],
+            'baseline_ms': old['median_ms'],
+            'current_ms': entry['median_ms'],
+            'change': round(change, 4),
+            'regression': change > threshold
+        })
+    return rows
+
+
+def print_comparison(baseline: Dict[str, Any], current: Dict[str, Any], rows: List[Dict[str, Any]]):
+    print(f"\nBaseline {baseline.get('commit') or '?'} ({baseline.get('created')}) -> "
+          f"current {current.get('commit') or '?'} ({current.get('created')})")
+    if (baseline.get('python'), baseline.get('platform')) != (current.get('python'), current.get('platform')):
+        print('Warning: runs come from different Python versions or platforms')
+    print(f"{'storage':>7} {'rows':>9} {'operation':<32} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for row in rows:
+        flag = '  REGRESSION' if row['regression'] else ''
+        print(f"{row['storage']:>7} {row['rows']:>9} {row['operation']:<32} {row['baseline_ms']:>12.2f} "
+              f"{row['current_ms']:>12.2f} {row['change'] * 100:>+7.1f}%{flag}")
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--storage', nargs='+', default=['csv'], choices=['csv', 'sqlite'])
+    parser.add_argument('--operations', nargs='+', default=OPERATIONS, choices=OPERATIONS)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='write the results as JSON')
+    parser.add_argument('--compare', nargs='+', metavar='RESULTS',
+                        help='baseline JSON to compare with, and optionally a current JSON instead of running')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='slowdown (fraction of the baseline median) reported as a regression')
+    args = parser.parse_args()
+
+    if args.compare and len(args.compare) > 2:
+        parser.error('--compare takes a baseline and at most one current results file')
+    if args.compare and len(args.compare) == 2:
+        current = load_report(args.compare[1])
+    else:
+        current = run(args.sizes, args.storage, args.operations, args.repeat, args.seed)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(current, f, indent=2)
+            print(f'Results written to {args.output}')
+
+    if args.compare:
+        baseline = load_report(args.compare[0])
+        try:
+            rows = compare(baseline, current, args.threshold)
+        except ValueError as e:
+            sys.exit(str(e))
+        print_comparison(baseline, current, rows)
+        if any(row['regression'] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,10 @@ Creates reminders and events for interviews and follow-ups
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
+import tracker_metrics
 
+
+@tracker_metrics.instrumented
 class CalendarIntegration:
     """
     Handles Google Calendar integration for job application tracking
@@ -297,6 +300,7 @@ Application Deadline Reminder
         """
 
         reminders = []
+        tracker_metrics.count_rows(len(applications))
 
         for app in applications:
             status = app.get('Status', '')
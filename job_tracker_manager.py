@@ -3,14 +3,48 @@ Job Application Tracker Manager
 Handles data management, calculations, and analytics for job applications
 """
 
-import csv
+import operator
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable
 import json
 
+from application_record import Application, days_since, parse_date, parse_datetime, success_score
+from application_store import ApplicationStore, duplicate_key, format_app_id, parse_app_id
+from tracker_storage import create_storage
+from tracker_archive import ApplicationArchive, archive_key
+import tracker_export
+import tracker_import
+import tracker_metrics
+import vectorized_analytics
+from text_index import TextIndex, snippet
+
+# Below this many applications the row-by-row analytics are as fast as NumPy
+VECTORIZE_MIN_ROWS = 2000
+# How often get_analytics() checks the running aggregates against a full recount
+AGGREGATE_VERIFY_SECONDS = 300
+# archive_closed() moves closed applications untouched for this long out of the working set
+ARCHIVE_AFTER_DAYS = 180
+# What adding an application that duplicates a tracked one does
+DUPLICATE_POLICIES = ('error', 'skip', 'merge', 'allow')
+# Columns the tracker fills in itself; updates may not set them
+GENERATED_COLUMNS = ('Application ID', 'Last Updated') + tuple(
+    column for column, attr in Application.COLUMNS if attr in Application.VIRTUAL
+)
+
+
+class DuplicateApplicationError(ValueError):
+    """Raised when an added application matches a tracked one (same company, title, date and URL)"""
+
+    def __init__(self, existing_id: str):
+        super().__init__(f'Duplicate of application {existing_id}')
+        self.existing_id = existing_id
+
+
+@tracker_metrics.instrumented
 class JobTrackerManager:
-    def __init__(self, csv_file='job_applications.csv'):
+    def __init__(self, csv_file='job_applications.csv', storage=None, create=True):
         self.csv_file = csv_file
         self.headers = [
             'Application ID', 'Company Name', 'Job Title', 'Application Date',
@@ -18,74 +52,180 @@ class JobTrackerManager:
             'Salary Range', 'Job URL', 'Interview Date', 'Follow-up Date',
             'Notes', 'Last Updated', 'Success Score'
         ]
-        self.initialize_csv()
+        # storage is a backend name ('csv' or 'sqlite') or a ready-made backend
+        if storage is None:
+            storage = os.environ.get('JOB_TRACKER_STORAGE', 'csv')
+        if isinstance(storage, str):
+            storage = create_storage(storage, csv_file, self.headers)
+        self.storage = storage
+        # Closed applications moved out of storage by archive_closed()
+        self.archive = ApplicationArchive(os.path.splitext(csv_file)[0] + '.archive', self.headers)
+        self.store = None
+        self._fingerprint = None
+        self._derived_cache = {}
+        self.cache_stats = {
+            'store_hits': 0, 'store_misses': 0, 'derived_hits': 0, 'derived_misses': 0,
+            'aggregate_checks': 0, 'aggregate_repairs': 0
+        }
+        self._aggregates_verified_at = time.monotonic()
+        # 'auto' (NumPy for large trackers when installed), 'numpy' or 'python'
+        self.analytics_engine = os.environ.get('JOB_TRACKER_ANALYTICS', 'auto')
+        # With create=False nothing is written to disk until the first application is added
+        self._created = False
+        if create:
+            self.initialize_csv()
 
     def initialize_csv(self):
-        """Create CSV file if it doesn't exist"""
-        if not os.path.exists(self.csv_file):
-            with open(self.csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writeheader()
+        """Create the backing file (and its directory) if it doesn't exist"""
+        directory = os.path.dirname(self.storage.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.storage.initialize()
+        self._created = True
 
-    def generate_app_id(self) -> str:
-        """Generate unique application ID"""
-        applications = self.load_applications()
-        if not applications:
-            return 'APP001'
-
-        # Extract numbers from existing IDs and get max
-        ids = [int(app['Application ID'].replace('APP', '')) for app in applications if app['Application ID'].startswith('APP')]
-        next_id = max(ids) + 1 if ids else 1
-        return f'APP{next_id:03d}'
-
-    def calculate_days_since_applied(self, application_date: str) -> int:
-        """Calculate days since application date"""
-        try:
-            app_date = datetime.strptime(application_date, '%Y-%m-%d')
-            today = datetime.now()
-            delta = today - app_date
-            return delta.days
-        except:
-            return 0
+    def _storage_exists(self) -> bool:
+        """Whether the backing file exists, noticing one another tracker created"""
+        if not self._created and os.path.exists(self.storage.path):
+            self.initialize_csv()
+        return self._created
 
-    def calculate_success_score(self, status: str, days: int) -> int:
-        """Calculate success probability score (0-100)"""
-        status_weights = {
-            'Applied': 30,
-            'Phone Screen': 50,
-            'Interview Scheduled': 60,
-            'Interviewed': 70,
-            'Second Interview': 85,
-            'Offer Received': 95,
-            'Accepted': 100,
-            'Rejected': 0,
-            'Withdrawn': 0,
-            'Follow-up Needed': 40
-        }
+    def get_store(self) -> ApplicationStore:
+        """
+        Return the resident application store
 
-        base_score = status_weights.get(status, 30)
+        Storage is re-read only when its fingerprint (mtime, size and inode
+        of the backing files; the revision of an SQLite database) differs
+        from the one the store was loaded at, i.e. when another process or
+        tracker instance has written to it. Rows and updates appended since
+        are applied to the store in place when storage can tell what they
+        were; otherwise the store is rebuilt, and a full-text index already
+        built is carried over to it.
+        """
+        if not self._storage_exists():
+            # Nothing written yet; reading must not create the files
+            if self.store is None:
+                self.store = ApplicationStore()
+            return self.store
 
-        # Reduce score if too much time has passed without progress
-        if status in ['Applied', 'Follow-up Needed'] and days > 14:
-            base_score = max(10, base_score - (days - 14) * 2)
+        fingerprint = self.storage.fingerprint()
+        if self.store is not None and fingerprint == self._fingerprint:
+            self.cache_stats['store_hits'] += 1
+            return self.store
 
-        return min(100, max(0, base_score))
+        self.cache_stats['store_misses'] += 1
+        if self.store is not None and self._fingerprint is not None and self._apply_changes():
+            return self.store
+        with tracker_metrics.timed('storage.load'):
+            rows = self.storage.load()
+            tracker_metrics.count_rows(len(rows))
+        with tracker_metrics.timed('store.build'):
+            store = ApplicationStore.from_rows(rows)
+            if self.store is not None and self.store.text_index is not None:
+                store.adopt_text_index(self.store)
+        self.store = store
+        self._fingerprint = fingerprint
+        self._derived_cache = {}
+        return self.store
 
-    def add_application(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Add new job application"""
-        app_id = self.generate_app_id()
+    def _apply_changes(self) -> bool:
+        """
+        Bring the store up to date with what other writers appended
+
+        Returns:
+            False if storage can't list the changes since the store's
+            fingerprint and it must be reloaded
+        """
+        changes = self.storage.changes_since(self._fingerprint)
+        if changes is None:
+            return False
+        rows, deltas, fingerprint = changes
+        store = self.store
+        with tracker_metrics.timed('store.refresh'):
+            for row in rows:
+                store.add(Application.from_row(row))
+            for delta in deltas:
+                current = store.get(delta.get('Application ID'))
+                if current is not None:
+                    row = current.to_row()
+                    row.update((k, v) for k, v in delta.items() if k in row)
+                    store.replace(Application.from_row(row))
+        self._fingerprint = fingerprint
+        self._derived_cache = {}
+        return True
+
+    def reload(self):
+        """Re-read storage on the next access, keeping the full-text index to carry over"""
+        self._fingerprint = None
+
+    def _after_write(self, transition):
+        """
+        Keep the store fingerprint current after this tracker's own write
+
+        transition is the (before, after) pair a storage write returns. If
+        the file was exactly as loaded before the write, the store already
+        holds the result and only the fingerprint moves; otherwise the next
+        access reloads.
+        """
+        if transition and transition[0] == self._fingerprint:
+            self._fingerprint = transition[1]
+        else:
+            self._fingerprint = None
+
+    def _cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        """Memoize a derived result until the store changes or the day rolls over"""
+        store = self.get_store()
+        key = (name, store.version, datetime.now().date())
+        if key in self._derived_cache:
+            self.cache_stats['derived_hits'] += 1
+            return self._derived_cache[key]
+        self.cache_stats['derived_misses'] += 1
+        with tracker_metrics.timed('compute.' + (name[0] if isinstance(name, tuple) else name)):
+            result = compute()
+        self._derived_cache = {k: v for k, v in self._derived_cache.items() if k[1:] == key[1:]}
+        self._derived_cache[key] = result
+        return result
+
+    def _remember(self, name: str, result: Any):
+        """Seed the derived cache with a result computed as part of another one"""
+        self._derived_cache[(name, self.store.version, datetime.now().date())] = result
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the store and derived-result caches"""
+        stats = dict(self.cache_stats)
+        for kind in ('store', 'derived'):
+            lookups = stats[f'{kind}_hits'] + stats[f'{kind}_misses']
+            stats[f'{kind}_hit_rate'] = round(stats[f'{kind}_hits'] / lookups * 100, 1) if lookups else 0
+        return stats
+
+    def generate_app_id(self) -> str:
+        """Reserve the next unique application ID"""
+        return format_app_id(self._reserve_ids(1))
+
+    def _reserve_ids(self, count: int) -> int:
+        """Reserve count consecutive ID numbers without invalidating the resident store"""
+        if not self._storage_exists():
+            self.initialize_csv()
+        first, transition = self.storage.reserve_ids(count, floor=self.get_store().max_id)
+        if transition is not None:
+            self._after_write(transition)
+        return first
+
+    def calculate_days_since_applied(self, application_date: str, as_of: Optional[date] = None) -> int:
+        """Calculate days since application date (as of today unless given)"""
+        return days_since(parse_date(application_date), as_of or datetime.now().date())
 
-        # Calculate automatic fields
-        days_since = self.calculate_days_since_applied(data['Application Date'])
-        success_score = self.calculate_success_score(data['Status'], days_since)
+    def calculate_success_score(self, status: str, days: int) -> int:
+        """Calculate success probability score (0-100)"""
+        return success_score(status, days)
 
-        application = {
+    def _build_application(self, data: Dict[str, Any], app_id: str, last_updated: str) -> Application:
+        """Assemble a new record from user data; Days Since Applied and Success Score derive from it"""
+        return Application.from_row({
             'Application ID': app_id,
             'Company Name': data.get('Company Name', ''),
             'Job Title': data.get('Job Title', ''),
             'Application Date': data.get('Application Date', ''),
             'Status': data.get('Status', 'Applied'),
-            'Days Since Applied': days_since,
             'Contact Person': data.get('Contact Person', ''),
             'Contact Email': data.get('Contact Email', ''),
             'Salary Range': data.get('Salary Range', ''),
@@ -93,79 +233,605 @@ class JobTrackerManager:
             'Interview Date': data.get('Interview Date', ''),
             'Follow-up Date': data.get('Follow-up Date', ''),
             'Notes': data.get('Notes', ''),
-            'Last Updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'Success Score': success_score
+            'Last Updated': last_updated
+        })
+
+    def _duplicate_key(self, data: Dict[str, Any]) -> tuple:
+        return duplicate_key(data.get('Company Name', ''), data.get('Job Title', ''),
+                             data.get('Application Date', ''), data.get('Job URL', ''))
+
+    def _merge_updates(self, current: Dict[str, Any], data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fields of data that would fill a blank in current (generated columns excluded)"""
+        return {
+            key: value for key, value in data.items()
+            if key in self.headers and key not in GENERATED_COLUMNS and value and not current.get(key)
         }
 
-        # Write to CSV
-        with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers)
-            writer.writerow(application)
+    @staticmethod
+    def _check_duplicate_policy(on_duplicate: str):
+        if on_duplicate not in DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate policy '{on_duplicate}' (expected one of {', '.join(DUPLICATE_POLICIES)})")
+
+    def add_application(self, data: Dict[str, Any], on_duplicate: str = 'error') -> Dict[str, Any]:
+        """
+        Add new job application
+
+        Args:
+            data: Application fields
+            on_duplicate: When the same company, title, date and URL is
+                already tracked: 'error' raises DuplicateApplicationError,
+                'skip' returns the tracked application, 'merge' fills its
+                blank fields from data and returns it, 'allow' adds anyway.
+                Archived applications count as tracked; 'merge' leaves
+                them unchanged.
+        """
+        self._check_duplicate_policy(on_duplicate)
+        if on_duplicate != 'allow':
+            key = self._duplicate_key(data)
+            existing = self.get_store().duplicates_of(key)
+            if existing:
+                current = existing[0]
+                if on_duplicate == 'error':
+                    raise DuplicateApplicationError(current.app_id)
+                updates = self._merge_updates(current.to_dict(), data) if on_duplicate == 'merge' else {}
+                if updates:
+                    return self.update_application(current.app_id, updates)
+                return current.to_dict()
+            archived = self.archive.find_duplicate(key)
+            if archived is not None:
+                if on_duplicate == 'error':
+                    raise DuplicateApplicationError(archived['Application ID'])
+                return Application.from_row(archived).to_dict()
+
+        app_id = self.generate_app_id()
+        record = self._build_application(data, app_id, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        store = self.get_store()
+        transition = self.storage.append([record.to_row()])
+        store.add(record)
+        self._after_write(transition)
+
+        return record.to_dict()
+
+    def add_applications(self, records: Iterable[Dict[str, Any]], on_duplicate: str = 'skip') -> Dict[str, Any]:
+        """
+        Add many applications with one ID reservation and one write
+
+        Args:
+            records: Any iterable (including a generator) of application
+                dicts in the add_application format
+            on_duplicate: For rows matching a tracked application or an
+                earlier row: 'skip' (status 'duplicate'), 'merge' (fill the
+                match's blank fields; status 'merged'), 'error' (status
+                'error') or 'allow'. Rows matching an archived application
+                are never merged into it (status 'duplicate' or 'error')
+
+        Returns:
+            Dictionary with per-row results (in input order), counts and
+            throughput
+        """
+        self._check_duplicate_policy(on_duplicate)
+        started = time.perf_counter()
+        now = datetime.now()
+        last_updated = now.strftime('%Y-%m-%d %H:%M:%S')
+        today = now.date()
+        store = self.get_store()
+        archived_keys = self.archive.duplicate_keys() if on_duplicate != 'allow' else {}
+
+        results = []
+        prepared = []
+        pending = {}  # duplicate key -> index into prepared
+        merges = {}  # Application ID -> updates
+        duplicates = 0
+        for index, data in enumerate(records):
+            application_date = data.get('Application Date')
+            if not application_date:
+                results.append({'index': index, 'status': 'error', 'error': 'Missing Application Date'})
+                continue
+
+            if on_duplicate != 'allow':
+                key = self._duplicate_key(data)
+                existing = store.duplicates_of(key)
+                archived = None
+                if archived_keys and not existing and key not in pending:
+                    archived = archived_keys.get(archive_key(key))
+                if existing or key in pending or archived:
+                    duplicates += 1
+                    if existing:
+                        current = existing[0]
+                        target = {'existing': current.app_id}
+                        if on_duplicate == 'merge':
+                            fields = dict(current.to_dict(), **merges.get(current.app_id, {}))
+                            merges.setdefault(current.app_id, {}).update(self._merge_updates(fields, data))
+                    elif archived:
+                        target = {'existing': archived[0], 'archived': True}
+                    else:
+                        earlier = prepared[pending[key]]
+                        target = {'duplicate_of_index': earlier[0]['index']}
+                        if on_duplicate == 'merge':
+                            earlier[1].update(self._merge_updates(earlier[1], data))
+                    if on_duplicate == 'error':
+                        results.append(dict(target, index=index, status='error', error='Duplicate application'))
+                    else:
+                        status = 'merged' if on_duplicate == 'merge' and not archived else 'duplicate'
+                        results.append(dict(target, index=index, status=status))
+                    continue
+                pending[key] = len(prepared)
+                if on_duplicate == 'merge':
+                    data = dict(data)  # later rows may fill its blanks
+
+            result = {'index': index, 'status': 'added'}
+            results.append(result)
+            prepared.append((result, data))
 
-        return application
+        if prepared:
+            first_id = self._reserve_ids(len(prepared))
+            new_records = []
+            for offset, (result, data) in enumerate(prepared):
+                record = self._build_application(data, format_app_id(first_id + offset), last_updated)
+                result['application'] = record.to_dict(today)
+                new_records.append(record)
 
-    def load_applications(self) -> List[Dict[str, Any]]:
-        """Load all applications from CSV"""
-        applications = []
-        if os.path.exists(self.csv_file):
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                applications = list(reader)
-        return applications
+            transition = self.storage.append(record.to_row() for record in new_records)
+            for record in new_records:
+                store.add(record)
+            self._after_write(transition)
+
+        merges = {app_id: updates for app_id, updates in merges.items() if updates}
+        if merges:
+            self.update_applications(merges)
+
+        elapsed = time.perf_counter() - started
+        return {
+            'results': results,
+            'added': len(prepared),
+            'duplicates': duplicates,
+            'failed': sum(1 for result in results if result['status'] == 'error'),
+            'elapsed_seconds': round(elapsed, 4),
+            'rows_per_second': round(len(results) / elapsed, 1) if elapsed > 0 else 0
+        }
+
+    def import_csv(self, source, column_map: Optional[Dict[str, str]] = None, chunk_rows: int = 5000,
+                   max_errors: int = 100, on_duplicate: str = 'skip') -> Dict[str, Any]:
+        """
+        Import applications from a CSV file in chunks
+
+        Columns are matched to the tracker's headers by name (ignoring case
+        and punctuation) or common aliases; IDs, Last Updated and derived
+        columns are always generated fresh. Each chunk is validated and then
+        bulk-inserted with add_applications(), so files of any size are
+        imported without reading them whole.
+
+        Args:
+            source: Path, or a text or binary file-like object (such as a
+                Streamlit upload)
+            column_map: Optional {file column: tracker header} overrides
+            chunk_rows: Rows read, validated and written per batch
+            max_errors: Rejected rows to report in detail (all are counted)
+            on_duplicate: Policy for rows already tracked or repeated in
+                the file, as in add_applications() (re-imports skip them
+                by default)
+
+        Returns:
+            Dictionary with row counts, column mapping, rejected rows and
+            throughput
+        """
+        started = time.perf_counter()
+        report = {
+            'rows': 0,
+            'imported': 0,
+            'duplicates': 0,
+            'rejected': 0,
+            'errors': [],
+            'columns': {},
+            'unmapped_columns': []
+        }
+        for mapping, unmapped, records, record_rows, errors in tracker_import.iter_import(
+                source, self.headers, column_map, chunk_rows):
+            report['columns'] = mapping
+            report['unmapped_columns'] = unmapped
+            result = self.add_applications(records, on_duplicate=on_duplicate)
+            report['rows'] += len(records) + len(errors)
+            tracker_metrics.count_rows(len(records) + len(errors))
+            report['imported'] += result['added']
+            report['duplicates'] += result['duplicates']
+            report['rejected'] += len(errors) + result['failed']
+            errors.extend({'row': record_rows[row['index']], 'error': row['error']}
+                          for row in result['results'] if row['status'] == 'error')
+            errors.sort(key=operator.itemgetter('row'))
+            report['errors'].extend(errors[:max(0, max_errors - len(report['errors']))])
+
+        elapsed = time.perf_counter() - started
+        report['elapsed_seconds'] = round(elapsed, 4)
+        report['rows_per_second'] = round(report['rows'] / elapsed, 1) if elapsed > 0 else 0
+        return report
+
+    def load_applications(self, as_of: Optional[date] = None) -> List[Dict[str, Any]]:
+        """
+        Load all applications as dicts
+
+        Days Since Applied and Success Score are computed as of the given
+        date, today by default.
+        """
+        store = self.get_store()
+        tracker_metrics.count_rows(len(store))
+        return [app.to_dict(as_of) for app in store]
+
+    def get_records(self) -> List[Application]:
+        """
+        All applications as typed records, without converting to dicts
+
+        Records support app['Column'] / app.get('Column') like the dict
+        form. They are the store's own objects, so treat them as read-only.
+        """
+        store = self.get_store()
+        tracker_metrics.count_rows(len(store))
+        return list(store)
+
+    def get_status_counts(self) -> Dict[str, int]:
+        """Number of applications per Status, from the status index"""
+        return self.get_store().status_counts()
+
+    def get_application(self, app_id: str) -> Optional[Dict[str, Any]]:
+        """Look up a single application by Application ID"""
+        app = self.get_store().get(app_id)
+        return app.to_dict() if app else None
+
+    def find_applications(self, company: str, job_title: str) -> List[Dict[str, Any]]:
+        """Applications with an exact Company Name + Job Title match"""
+        return [app.to_dict() for app in self.get_store().find(company, job_title)]
+
+    def find_similar_applications(self, company: str, job_title: str = '', limit: int = 5,
+                                  min_score: float = 0.6) -> List[Dict[str, Any]]:
+        """
+        Applications whose Company Name and Job Title best match, tolerating
+        typos and legal-form differences ("Google" vs "Google LLC")
+
+        Returns:
+            List of {'application', 'score'} dicts, best first; an exact
+            match scores 1.0
+        """
+        today = date.today()
+        return [
+            {'application': app.to_dict(today), 'score': score}
+            for score, app in self.get_store().find_similar(company, job_title, limit, min_score)
+        ]
+
+    def find_duplicates(self) -> Dict[str, Any]:
+        """
+        Applications tracked more than once (same company, title, date and URL)
+
+        Returns:
+            Dictionary with the duplicate groups (each a list of
+            applications, oldest first), the group count and the number of
+            redundant applications
+        """
+        today = date.today()
+        groups = [[app.to_dict(today) for app in group] for group in self.get_store().find_duplicates()]
+        return {
+            'groups': groups,
+            'duplicate_groups': len(groups),
+            'redundant_applications': sum(len(group) - 1 for group in groups)
+        }
+
+    def _search_index(self) -> TextIndex:
+        """
+        The store's full-text index, building it on first use
+
+        From then on the store updates it with every change, and get_store()
+        keeps it across reloads, so it is built once per process.
+        """
+        store = self.get_store()
+        if store.text_index is None:
+            with tracker_metrics.timed('search.build'):
+                store.text_index = TextIndex.build(store.rows)
+        return store.text_index
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search over Company Name, Job Title and Notes
+
+        Every word of the query must appear (case-insensitive). Results are
+        ranked by how rare the words are and where they match: company
+        before title before notes.
+
+        Args:
+            query: Words to search for
+            limit: Maximum number of results
+
+        Returns:
+            List of {'application', 'score', 'snippet'} dicts, best first
+        """
+        index = self._search_index()
+        rows = self.store.rows
+        today = date.today()
+        return [
+            {
+                'application': rows[position].to_dict(today),
+                'score': score,
+                'snippet': snippet(rows[position].notes, query)
+            }
+            for score, position in index.search(query, limit)
+        ]
+
+    def _apply_updates(self, current: Application, updates: Dict[str, Any], last_updated: str) -> tuple:
+        """
+        Apply updates to a stored record
+
+        Returns:
+            (application dict, new record, delta of changed fields keyed by
+            Application ID)
+        """
+        app = current.to_dict()
+
+        # Update fields
+        for key, value in updates.items():
+            if key in self.headers:
+                app[key] = value
+
+        app['Last Updated'] = last_updated
+
+        # Days Since Applied and Success Score follow from the new record
+        record = Application.from_row(app)
+        app = record.to_dict()
+
+        # Persist only the fields that changed
+        before = current.to_row()
+        delta = {key: value for key, value in record.to_row().items() if before[key] != value}
+        delta['Application ID'] = current.app_id
+        return app, record, delta
 
     def update_application(self, app_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update existing application"""
-        applications = self.load_applications()
-        updated_app = None
+        result = self.update_applications({app_id: updates})
+        return result['updated'][0] if result['updated'] else None
 
-        for app in applications:
-            if app['Application ID'] == app_id:
-                # Update fields
-                for key, value in updates.items():
-                    if key in self.headers:
-                        app[key] = value
-
-                # Recalculate automatic fields
-                app['Days Since Applied'] = self.calculate_days_since_applied(app['Application Date'])
-                app['Success Score'] = self.calculate_success_score(app['Status'], int(app['Days Since Applied']))
-                app['Last Updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                updated_app = app
-                break
-
-        # Write back to CSV
-        if updated_app:
-            with open(self.csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writeheader()
-                writer.writerows(applications)
-
-        return updated_app
+    def update_applications(self, updates_by_id: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many applications and persist them in one write
+
+        Args:
+            updates_by_id: {Application ID: {field: new value}}
+
+        Returns:
+            Dictionary with the updated applications and any IDs not found
+
+        Raises:
+            ValueError: If any updates set a GENERATED_COLUMNS column
+                (nothing is written)
+        """
+        for updates in updates_by_id.values():
+            generated = [column for column in GENERATED_COLUMNS if column in updates]
+            if generated:
+                raise ValueError(f"Can't update generated columns: {', '.join(generated)}")
+
+        store = self.get_store()
+        last_updated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        updated = []
+        not_found = []
+        records = []
+        deltas = []
+        for app_id, updates in updates_by_id.items():
+            current = store.get(app_id)
+            if current is None:
+                not_found.append(app_id)
+                continue
+            app, record, delta = self._apply_updates(current, updates, last_updated)
+            updated.append(app)
+            records.append(record)
+            deltas.append(delta)
+
+        if deltas:
+            # Persist first: if the write fails, the store still matches storage
+            transition = self.storage.update(deltas)
+            for record in records:
+                store.replace(record)
+            self._after_write(transition)
+
+        return {'updated': updated, 'not_found': not_found}
+
+    def update_where(self, predicate: Callable[[Application], bool], updates: Dict[str, Any],
+                     status: str = None) -> Dict[str, Any]:
+        """
+        Apply the same updates to every application matching predicate
+
+        Args:
+            predicate: Called with each stored Application record (typed
+                attributes, or app['Column'] access); True selects it
+            updates: {field: new value} applied to every selected application
+            status: Only consider applications currently in this status
+                (uses the status index instead of visiting every row)
+
+        Returns:
+            Same shape as update_applications
+        """
+        store = self.get_store()
+        candidates = store.with_status(status) if status is not None else list(store)
+        selected = [app.app_id for app in candidates if predicate(app)]
+        return self.update_applications({app_id: updates for app_id in selected})
+
+    def compact_storage(self):
+        """Fold journaled updates back into the data file"""
+        if not self._storage_exists():
+            return
+        fresh = self.store is not None and self.storage.fingerprint() == self._fingerprint
+        self.storage.compact()
+        self._fingerprint = self.storage.fingerprint() if fresh else None
 
     def get_analytics(self) -> Dict[str, Any]:
-        """Generate analytics and insights"""
-        applications = self.load_applications()
+        """Generate analytics and insights (cached until the data or date changes)"""
+        if time.monotonic() - self._aggregates_verified_at >= AGGREGATE_VERIFY_SECONDS:
+            self.verify_analytics()
+        return self._cached('analytics', self._compute_analytics)
 
-        if not applications:
-            return {
-                'total_applications': 0,
-                'message': 'No applications tracked yet'
-            }
+    def verify_analytics(self) -> bool:
+        """
+        Check the store's running aggregates against a full recount
+
+        Runs from get_analytics() every AGGREGATE_VERIFY_SECONDS. Returns
+        True if they matched; on a mismatch the aggregates are rebuilt
+        from the records and counted in cache_stats['aggregate_repairs'].
+        """
+        matched = self.get_store().verify_aggregates()
+        self._aggregates_verified_at = time.monotonic()
+        self.cache_stats['aggregate_checks'] += 1
+        if not matched:
+            self.cache_stats['aggregate_repairs'] += 1
+        return matched
+
+    def _use_numpy(self, store: ApplicationStore) -> bool:
+        engine = self.analytics_engine
+        if engine == 'auto':
+            return vectorized_analytics.available() and len(store) >= VECTORIZE_MIN_ROWS
+        if engine not in ('numpy', 'python'):
+            raise ValueError(f"Unknown analytics engine '{engine}' (expected 'auto', 'numpy' or 'python')")
+        if engine == 'numpy' and not vectorized_analytics.available():
+            raise ImportError('The numpy analytics engine requires numpy (pip install numpy)')
+        return engine == 'numpy'
+
+    def _compute_analytics(self, store: Optional[ApplicationStore] = None) -> Dict[str, Any]:
+        """Metrics from the store's running aggregates, follow-ups from its date index"""
+        store = store if store is not None else self.get_store()
+        today = datetime.now().date()
+        return self._summarize_analytics(
+            len(store), store.status_counts(), store.aggregates.total_days(today),
+            self._overdue_followups(store.follow_ups_due(today), today),
+            store.company_score_averages(today)
+        )
+
+    def get_lifetime_analytics(self) -> Dict[str, Any]:
+        """
+        get_analytics() over current and archived applications together
 
-        total = len(applications)
+        Archive partitions are read on demand and merged with the working
+        set (cached until either changes), in Application ID order as if
+        nothing had been archived.
+        """
+        return self._cached(('lifetime_analytics', self.archive.signature()), self._compute_lifetime_analytics)
+
+    def _compute_lifetime_analytics(self) -> Dict[str, Any]:
+        store = self.get_store()
+        # A row present in both (archiving interrupted before removal) counts once
+        archived = [record for record in map(Application.from_row, self.archive.rows()) if record.app_id not in store]
+        if not archived:
+            return self._compute_analytics(store)
+        records = sorted(archived + list(store), key=lambda record: parse_app_id(record.app_id) or 0)
+        return self._compute_analytics(ApplicationStore(records))
+
+    def iter_archived(self) -> Iterator[Dict[str, Any]]:
+        """Archived applications as dicts, partition by partition (oldest month first)"""
+        today = date.today()
+        for row in self.archive.rows():
+            yield Application.from_row(row).to_dict(today)
+
+    def archive_closed(self, older_than_days: int = ARCHIVE_AFTER_DAYS) -> Dict[str, Any]:
+        """
+        Move closed applications out of the working set into the archive
+
+        Rejected, Accepted and Withdrawn applications whose Application Date
+        is more than older_than_days ago (Last Updated when it has none) are
+        written to compressed monthly partitions and then removed from
+        storage. Everyday operations no longer load them;
+        get_lifetime_analytics() and iter_archived() still see them.
+
+        Returns:
+            Dictionary with the number archived, rows per partition and
+            the remaining working-set size
+        """
+        started = time.perf_counter()
+        store = self.get_store()
+        cutoff = date.today() - timedelta(days=older_than_days)
+        selected = []
+        for status in vectorized_analytics.CLOSED_STATUSES:
+            for record in store.with_status(status):
+                applied_on = record.applied_on
+                if applied_on is None:
+                    touched = parse_datetime(record.last_updated)
+                    applied_on = touched.date() if touched else None
+                if applied_on is not None and applied_on < cutoff:
+                    selected.append(record)
+
+        partitions = {}
+        if selected:
+            # Archive first: if removal fails, rows are duplicated (and
+            # counted once), never lost
+            partitions = self.archive.add(record.to_row() for record in selected)
+            self.storage.remove(record.app_id for record in selected)
+            self.reload()
+
+        elapsed = time.perf_counter() - started
+        return {
+            'archived': len(selected),
+            'partitions': partitions,
+            'working_set': len(self.get_store()),
+            'archived_total': len(self.archive),
+            'elapsed_seconds': round(elapsed, 4)
+        }
+
+    def recompute_analytics(self) -> Dict[str, Any]:
+        """get_analytics() computed from scratch over every record, bypassing the aggregates"""
+        store = self.get_store()
+        tracker_metrics.count_rows(len(store))
+        if self._use_numpy(store):
+            return vectorized_analytics.compute_analytics(store, datetime.now().date())
+        return self._compute_analytics_rows(store)
+
+    def _compute_analytics_rows(self, store: ApplicationStore) -> Dict[str, Any]:
+        applications = list(store)
+        today = datetime.now().date()
 
         # Status breakdown
         status_counts = {}
         for app in applications:
-            status = app['Status']
-            status_counts[status] = status_counts.get(status, 0) + 1
+            status_counts[app.status] = status_counts.get(app.status, 0) + 1
+
+        # Average days since applied
+        total_days = sum(app.derived(today)[0] for app in applications)
+
+        # Top companies by success score
+        companies_scores = {}
+        for app in applications:
+            company = app.company
+            if company not in companies_scores:
+                companies_scores[company] = []
+            companies_scores[company].append(app.derived(today)[1])
+
+        return self._summarize_analytics(
+            len(applications), status_counts, total_days,
+            self._overdue_followups(store, today),
+            {company: sum(scores) / len(scores) for company, scores in companies_scores.items()}
+        )
+
+    def _overdue_followups(self, applications: Iterable[Application], today) -> List[Dict[str, Any]]:
+        """Applications needing follow-up"""
+        needs_followup = []
+        for app in applications:
+            followup_date = app.follow_up_on
+            if followup_date is not None and followup_date <= today and app.status not in ['Rejected', 'Accepted']:
+                needs_followup.append({
+                    'company': app.company,
+                    'job_title': app.job_title,
+                    'followup_date': app.follow_up_date,
+                    'days_overdue': (today - followup_date).days
+                })
+        return needs_followup
+
+    def _summarize_analytics(self, total: int, status_counts: Dict[str, int], total_days: int,
+                             needs_followup: List[Dict[str, Any]],
+                             company_averages: Dict[str, float]) -> Dict[str, Any]:
+        if not total:
+            return {
+                'total_applications': 0,
+                'message': 'No applications tracked yet'
+            }
 
         # Calculate metrics
-        interviewed = sum(1 for app in applications if app['Status'] in [
+        interviewed = sum(status_counts.get(status, 0) for status in [
             'Interviewed', 'Second Interview', 'Interview Scheduled'
         ])
-        offers = sum(1 for app in applications if app['Status'] == 'Offer Received')
-        accepted = sum(1 for app in applications if app['Status'] == 'Accepted')
-        rejected = sum(1 for app in applications if app['Status'] == 'Rejected')
+        offers = status_counts.get('Offer Received', 0)
+        accepted = status_counts.get('Accepted', 0)
+        rejected = status_counts.get('Rejected', 0)
 
         # Success rates
         interview_rate = (interviewed / total * 100) if total > 0 else 0
@@ -174,43 +840,13 @@ class JobTrackerManager:
         rejection_rate = (rejected / total * 100) if total > 0 else 0
 
         # Average days since applied
-        total_days = sum(int(app['Days Since Applied']) for app in applications)
         avg_days = total_days / total if total > 0 else 0
 
         # Active applications (not rejected or accepted)
-        active = sum(1 for app in applications if app['Status'] not in ['Rejected', 'Accepted', 'Withdrawn'])
-
-        # Applications needing follow-up
-        needs_followup = []
-        today = datetime.now()
-        for app in applications:
-            if app['Follow-up Date']:
-                try:
-                    followup_date = datetime.strptime(app['Follow-up Date'], '%Y-%m-%d')
-                    if followup_date <= today and app['Status'] not in ['Rejected', 'Accepted']:
-                        needs_followup.append({
-                            'company': app['Company Name'],
-                            'job_title': app['Job Title'],
-                            'followup_date': app['Follow-up Date'],
-                            'days_overdue': (today - followup_date).days
-                        })
-                except:
-                    pass
+        active = total - sum(status_counts.get(status, 0) for status in ['Rejected', 'Accepted', 'Withdrawn'])
 
         # Top companies by success score
-        companies_scores = {}
-        for app in applications:
-            company = app['Company Name']
-            score = int(app['Success Score'])
-            if company not in companies_scores:
-                companies_scores[company] = []
-            companies_scores[company].append(score)
-
-        top_companies = sorted(
-            [(company, sum(scores) / len(scores)) for company, scores in companies_scores.items()],
-            key=lambda x: x[1],
-            reverse=True
-        )[:5]
+        top_companies = sorted(company_averages.items(), key=lambda x: x[1], reverse=True)[:5]
 
         return {
             'total_applications': total,
@@ -228,61 +864,195 @@ class JobTrackerManager:
         }
 
     def get_applications_needing_action(self) -> Dict[str, List]:
-        """Get applications that need action"""
-        applications = self.load_applications()
-        today = datetime.now()
+        """Get applications that need action (see dashboard_snapshot() for what is cached)"""
+        snapshot = self.dashboard_snapshot()
+        return {
+            'needs_followup': snapshot['needs_followup'],
+            'upcoming_interviews': snapshot['upcoming_interviews'],
+            'stale_applications': snapshot['stale_applications']
+        }
 
-        needs_followup = []
-        upcoming_interviews = []
-        stale_applications = []
+    def dashboard_snapshot(self, recent: int = 10) -> Dict[str, Any]:
+        """
+        Everything the dashboard shows, from the store's indexes
 
-        for app in applications:
-            # Skip closed applications
-            if app['Status'] in ['Rejected', 'Accepted', 'Withdrawn']:
-                continue
+        Returns:
+            'analytics' (as get_analytics()), 'needs_followup',
+            'upcoming_interviews' and 'stale_applications' (as
+            get_applications_needing_action()) and 'recent_applications',
+            the `recent` latest by Application Date. Cached until the data
+            or date changes, and the analytics part also serves the next
+            get_analytics() call. Upcoming interviews are looked up on
+            every call, since their window moves with the clock.
+        """
+        snapshot = self._cached(f'dashboard:{recent}', lambda: self._compute_dashboard_snapshot(recent))
+        self._remember('analytics', snapshot['analytics'])
+        return dict(snapshot, upcoming_interviews=self._upcoming_interviews())
+
+    def _upcoming_interviews(self) -> List[Dict[str, Any]]:
+        """Open applications with an interview in the next 7 days from now"""
+        now = datetime.now()
+        closed = ['Rejected', 'Accepted', 'Withdrawn']
+        return [
+            app.to_dict() for app in self.get_store().interviews_between(now, now + timedelta(days=7))
+            if app.status not in closed
+        ]
+
+    def _compute_dashboard_snapshot(self, recent: int) -> Dict[str, Any]:
+        """
+        Range lookups on the date indexes and the status index replace a
+        scan: O(log n + k) for k matching applications.
+        """
+        store = self.get_store()
+        today = datetime.now().date()
+        closed = ['Rejected', 'Accepted', 'Withdrawn']
 
-            # Check follow-up date
-            if app['Follow-up Date']:
-                try:
-                    followup_date = datetime.strptime(app['Follow-up Date'], '%Y-%m-%d')
-                    if followup_date <= today:
-                        needs_followup.append(app)
-                except:
-                    pass
-
-            # Check upcoming interviews
-            if app['Interview Date']:
-                try:
-                    interview_dt = datetime.strptime(app['Interview Date'], '%Y-%m-%d %H:%M:%S')
-                    if today <= interview_dt <= today + timedelta(days=7):
-                        upcoming_interviews.append(app)
-                except:
-                    pass
-
-            # Check stale applications (applied > 14 days, no response)
-            days = int(app['Days Since Applied'])
-            if app['Status'] == 'Applied' and days > 14:
-                stale_applications.append(app)
+        # Check follow-up date
+        due = store.follow_ups_due(today)
+        needs_followup = [app.to_dict() for app in due if app.status not in closed]
 
+        # Check stale applications (applied > 14 days, no response)
+        stale = [app for app in store.with_status('Applied') if app.days_since_applied > 14]
+        stale.sort(key=lambda app: store.positions[app.app_id])
+
+        analytics = self._summarize_analytics(
+            len(store), store.status_counts(), store.aggregates.total_days(today),
+            self._overdue_followups(due, today), store.company_score_averages(today)
+        )
         return {
+            'analytics': analytics,
             'needs_followup': needs_followup,
-            'upcoming_interviews': upcoming_interviews,
-            'stale_applications': stale_applications
+            'stale_applications': [app.to_dict() for app in stale],
+            'recent_applications': [app.to_dict() for app in store.latest_applied(recent)]
         }
 
-    def export_to_csv(self, filename: str = None) -> str:
-        """Export current data to CSV"""
-        if filename is None:
-            filename = f'job_applications_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    def _export_rows(self, columns: Optional[List[str]], where, as_strings: bool) -> tuple:
+        """
+        Headers and a generator of projected rows for export
+
+        where is a {column: value or list of values} filter, answered from
+        the store's indexes where possible (see ApplicationStore.matching),
+        or a predicate receiving each Application record. Only the
+        requested columns are produced, so unrequested derived fields are
+        never computed.
+        """
+        headers = list(self.headers) if columns is None else list(columns)
+        for header in headers:
+            if header not in Application.ATTRIBUTES:
+                raise ValueError(f"Unknown column '{header}'")
+
+        store = self.get_store()
+        if where is None:
+            # Later writes swap or append records; export the rows as they are now
+            records = list(store.rows)
+        elif callable(where):
+            records = [app for app in store.rows if where(app)]
+        else:
+            records = store.matching(where)
+        tracker_metrics.count_rows(len(records))
+
+        as_of = datetime.now().date()
+        getters = []
+        for header in headers:
+            attr = Application.ATTRIBUTES[header]
+            if attr in Application.VIRTUAL:
+                getters.append((header, lambda app, i=Application.VIRTUAL.index(attr): app.derived(as_of)[i]))
+            else:
+                getters.append((header, operator.attrgetter(attr)))
+
+        if as_strings:
+            rows = ({header: str(get(app)) for header, get in getters} for app in records)
+        else:
+            rows = ({header: get(app) for header, get in getters} for app in records)
+        return headers, rows
+
+    def iter_export(self, compression: Optional[str] = None, chunk_rows: int = 1000, format: str = 'csv',
+                    columns: Optional[List[str]] = None, where=None) -> Iterator[bytes]:
+        """
+        Stream the current data as CSV or JSON Lines bytes
+
+        Rows are encoded (and compressed) chunk by chunk as the generator
+        is consumed, so memory stays bounded by chunk_rows whatever the
+        size of the tracker.
+
+        Args:
+            compression: None, 'gzip' or 'zstd'
+            chunk_rows: Rows per chunk handed to the compressor
+            format: 'csv' or 'jsonl'
+            columns: Columns to include, in order (all by default)
+            where: Row filter, as for export()
+        """
+        if format not in tracker_export.STREAM_FORMATS:
+            raise ValueError(f"Format '{format}' cannot be streamed (expected 'csv' or 'jsonl')")
+        if compression not in tracker_export.COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression '{compression}' (expected 'gzip' or 'zstd')")
+        headers, rows = self._export_rows(columns, where, as_strings=format == 'csv')
+        if format == 'csv':
+            chunks = tracker_export.csv_chunks(headers, rows, chunk_rows)
+        else:
+            chunks = tracker_export.jsonl_chunks(rows, chunk_rows)
+        return tracker_export.compress_chunks(chunks, compression)
+
+    def export(self, destination=None, format: str = 'csv', columns: Optional[List[str]] = None,
+               where=None, compression: Optional[str] = None) -> Optional[str]:
+        """
+        Export applications as CSV, JSON Lines, Parquet or Excel
+
+        Args:
+            destination: Path to write, or a binary file-like object; a
+                timestamped file in the working directory by default
+            format: 'csv', 'jsonl' (both streamed), 'parquet' (requires
+                pyarrow) or 'xlsx' (requires openpyxl)
+            columns: Columns to include, in order (all by default)
+            where: {column: value or list of values} (Status and Company
+                Name + Job Title use their indexes) or a predicate taking
+                an Application record
+            compression: 'gzip' or 'zstd' for csv/jsonl; a Parquet codec
+                for parquet; not supported for xlsx
+
+        Returns:
+            The path written (the object's name, if any, for file objects)
+        """
+        if format not in tracker_export.EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{format}' (expected one of {', '.join(tracker_export.EXPORT_FORMATS)})")
+        if format == 'xlsx' and compression:
+            raise ValueError('xlsx exports are already compressed')
+
+        if destination is None:
+            suffix = tracker_export.FORMAT_SUFFIXES[format]
+            if format in tracker_export.STREAM_FORMATS:
+                suffix += tracker_export.COMPRESSION_SUFFIXES.get(compression, '')
+            destination = f'job_applications_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}{suffix}'
+
+        if format in tracker_export.STREAM_FORMATS:
+            tracker_export.write_chunks(
+                self.iter_export(compression, format=format, columns=columns, where=where), destination
+            )
+        else:
+            headers, rows = self._export_rows(columns, where, as_strings=False)
+            if format == 'parquet':
+                int_columns = [header for header in headers if Application.ATTRIBUTES[header] in Application.VIRTUAL]
+                tracker_export.write_parquet(headers, rows, destination, int_columns, compression)
+            else:
+                tracker_export.write_xlsx(headers, rows, destination)
+
+        if hasattr(destination, 'write'):
+            return getattr(destination, 'name', None)
+        return destination
 
-        applications = self.load_applications()
+    def export_to_csv(self, filename=None, compression: Optional[str] = None) -> str:
+        """
+        Export current data to CSV
 
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.headers)
-            writer.writeheader()
-            writer.writerows(applications)
+        Args:
+            filename: Path to write, or a binary file-like object; a
+                timestamped file in the working directory by default
+            compression: None, 'gzip' or 'zstd'
 
-        return filename
+        Returns:
+            The path written (the object's name, if any, for file objects)
+        """
+        return self.export(filename, 'csv', compression=compression)
 
 
 def generate_status_color_code(status: str) -> str:
@@ -10,11 +10,14 @@ import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import os
 import json
+import uuid
 
 # Import our modules
-from job_tracker_manager import JobTrackerManager, generate_status_color_code
+from job_tracker_manager import DuplicateApplicationError, JobTrackerManager, generate_status_color_code
 from ai_assistant import JobApplicationAI, generate_weekly_summary
 from calendar_integration import CalendarIntegration
+from tracker_pool import SharedTracker, TrackerPool
+import tracker_metrics
 
 # Page configuration
 st.set_page_config(
@@ -65,12 +68,50 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Opt-in performance metrics (JOB_TRACKER_METRICS=1); exporters start once per server process
+tracker_metrics.configure_from_env()
+
+# Shared deployments: set JOB_TRACKER_DATA_DIR to give every user their own data
+USER_DATA_DIR = os.environ.get('JOB_TRACKER_DATA_DIR')
+
+
+@st.cache_resource
+def get_tracker_pool() -> TrackerPool:
+    """One pool of per-user trackers for the whole server"""
+    return TrackerPool(USER_DATA_DIR, capacity=int(os.environ.get('JOB_TRACKER_POOL_SIZE', 128)))
+
+
+@st.cache_resource
+def get_shared_tracker() -> SharedTracker:
+    """The single data file's tracker, loaded once and shared by every session"""
+    return SharedTracker(JobTrackerManager())
+
+
+def current_user_id() -> str:
+    """The signed-in user's email, or else this browser session's workspace ID (kept apart by prefix)"""
+    user = getattr(st, 'user', None) or getattr(st, 'experimental_user', None)
+    try:
+        email = user.email if user is not None else None
+    except (AttributeError, KeyError):
+        email = None
+    if email:
+        return f'user:{email}'
+    if 'workspace_id' not in st.session_state:
+        st.session_state.workspace_id = uuid.uuid4().hex
+    return f'workspace:{st.session_state.workspace_id}'
+
+
 # Initialize session state
-if 'tracker' not in st.session_state:
-    st.session_state.tracker = JobTrackerManager()
+if 'ai_assistant' not in st.session_state:
     st.session_state.ai_assistant = JobApplicationAI()
     st.session_state.calendar = CalendarIntegration()
 
+# Fetched from the pool on every run, so idle sessions don't hold evicted trackers open
+if USER_DATA_DIR:
+    tracker = get_tracker_pool().get(current_user_id())
+else:
+    tracker = get_shared_tracker()
+
 # Header
 st.markdown('<h1 class="main-header">📊 Job Application Tracker Pro</h1>', unsafe_allow_html=True)
 st.markdown('<p style="text-align: center; color: #666; font-size: 1.2rem;">Your AI-powered job search command center</p>', unsafe_allow_html=True)
@@ -89,7 +130,8 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 📈 Quick Stats")
 
-    analytics = st.session_state.tracker.get_analytics()
+    snapshot = tracker.dashboard_snapshot()
+    analytics = snapshot['analytics']
     st.metric("Total Apps", analytics.get('total_applications', 0))
     st.metric("Active", analytics.get('active_applications', 0))
 
@@ -100,7 +142,7 @@ with st.sidebar:
 if page == "🏠 Dashboard":
     st.header("📊 Dashboard Overview")
 
-    analytics = st.session_state.tracker.get_analytics()
+    analytics = snapshot['analytics']
 
     if analytics.get('total_applications', 0) == 0:
         st.info("👋 Welcome! Get started by adding your first job application using the '➕ Add Application' page.")
@@ -167,16 +209,17 @@ if page == "🏠 Dashboard":
                     'Follow-up Needed': '#FFD93D'
                 }
 
-                fig = px.bar(
-                    status_data,
-                    x='Count',
-                    y='Status',
-                    orientation='h',
-                    color='Status',
-                    color_discrete_map=color_map
-                )
-                fig.update_layout(showlegend=False, height=400)
-                st.plotly_chart(fig, use_container_width=True)
+                with tracker_metrics.timed('render.status_chart'):
+                    fig = px.bar(
+                        status_data,
+                        x='Count',
+                        y='Status',
+                        orientation='h',
+                        color='Status',
+                        color_discrete_map=color_map
+                    )
+                    fig.update_layout(showlegend=False, height=400)
+                    st.plotly_chart(fig, use_container_width=True)
 
         with col2:
             st.subheader("🎯 Success Metrics")
@@ -186,24 +229,25 @@ if page == "🏠 Dashboard":
                 {'Metric': 'Acceptance Rate', 'Value': analytics['metrics'].get('acceptance_rate', 0)},
             ])
 
-            fig = go.Figure(data=[
-                go.Bar(
-                    x=metrics_data['Metric'],
-                    y=metrics_data['Value'],
-                    marker_color=['#667eea', '#764ba2', '#9D7EFF']
+            with tracker_metrics.timed('render.metrics_chart'):
+                fig = go.Figure(data=[
+                    go.Bar(
+                        x=metrics_data['Metric'],
+                        y=metrics_data['Value'],
+                        marker_color=['#667eea', '#764ba2', '#9D7EFF']
+                    )
+                ])
+                fig.update_layout(
+                    yaxis_title="Percentage (%)",
+                    height=400
                 )
-            ])
-            fig.update_layout(
-                yaxis_title="Percentage (%)",
-                height=400
-            )
-            st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
 
         # Action Items
         st.markdown("---")
         st.subheader("⚡ Action Items")
 
-        action_items = st.session_state.tracker.get_applications_needing_action()
+        action_items = snapshot
 
         if action_items['needs_followup']:
             st.warning(f"🔔 **{len(action_items['needs_followup'])} applications need follow-up**")
@@ -224,13 +268,34 @@ if page == "🏠 Dashboard":
         st.markdown("---")
         st.subheader("📋 Recent Applications")
 
-        applications = st.session_state.tracker.load_applications()
+        applications = snapshot['recent_applications']
         if applications:
             df = pd.DataFrame(applications)
             df = df[['Application ID', 'Company Name', 'Job Title', 'Application Date', 'Status', 'Days Since Applied', 'Success Score']]
-            df = df.sort_values('Application Date', ascending=False).head(10)
             st.dataframe(df, use_container_width=True)
 
+        # Full-text search
+        st.markdown("---")
+        st.subheader("🔍 Search Applications")
+        query = st.text_input("Search company, title and notes", placeholder="e.g. kubernetes onsite")
+        if query:
+            results = tracker.search(query, limit=50)
+            if results:
+                df = pd.DataFrame([
+                    {
+                        'Application ID': result['application']['Application ID'],
+                        'Company Name': result['application']['Company Name'],
+                        'Job Title': result['application']['Job Title'],
+                        'Status': result['application']['Status'],
+                        'Notes': result['snippet'],
+                        'Relevance': result['score']
+                    }
+                    for result in results
+                ])
+                st.dataframe(df, use_container_width=True)
+            else:
+                st.info(f"No applications match '{query}'")
+
 elif page == "➕ Add Application":
     st.header("➕ Add New Application")
 
@@ -276,32 +341,39 @@ elif page == "➕ Add Application":
                     'Notes': notes
                 }
 
-                application = st.session_state.tracker.add_application(app_data)
-
-                st.success(f"✅ Application added successfully!")
-                st.info(f"""
-                **Application Details:**
-                - 📝 Application ID: {application['Application ID']}
-                - 🏢 Company: {application['Company Name']}
-                - 💼 Role: {application['Job Title']}
-                - 📅 Applied: {application['Application Date']}
-                - ⏱️ Days since applied: {application['Days Since Applied']}
-                - 🎯 Success Score: {application['Success Score']}/100
-                """)
+                try:
+                    application = tracker.add_application(app_data)
+                except DuplicateApplicationError as e:
+                    application = None
+                    st.warning(f"⚠️ This application is already tracked as {e.existing_id}")
+
+                if application:
+                    st.success(f"✅ Application added successfully!")
+                    st.info(f"""
+                    **Application Details:**
+                    - 📝 Application ID: {application['Application ID']}
+                    - 🏢 Company: {application['Company Name']}
+                    - 💼 Role: {application['Job Title']}
+                    - 📅 Applied: {application['Application Date']}
+                    - ⏱️ Days since applied: {application['Days Since Applied']}
+                    - 🎯 Success Score: {application['Success Score']}/100
+                    """)
+
+                    # Get AI suggestions
+                    all_apps = tracker.get_records()
+                    suggestions = st.session_state.ai_assistant.get_application_suggestions(
+                        application, all_apps, tracker.get_status_counts()
+                    )
 
-                # Get AI suggestions
-                all_apps = st.session_state.tracker.load_applications()
-                suggestions = st.session_state.ai_assistant.get_application_suggestions(application, all_apps)
-
-                if suggestions['immediate_actions']:
-                    st.warning("**💡 Immediate Actions:**")
-                    for action in suggestions['immediate_actions']:
-                        st.markdown(f"- {action}")
+                    if suggestions['immediate_actions']:
+                        st.warning("**💡 Immediate Actions:**")
+                        for action in suggestions['immediate_actions']:
+                            st.markdown(f"- {action}")
 
 elif page == "📝 Update Status":
     st.header("📝 Update Application Status")
 
-    applications = st.session_state.tracker.load_applications()
+    applications = tracker.load_applications()
 
     if not applications:
         st.info("No applications to update. Add your first application!")
@@ -339,7 +411,7 @@ elif page == "📝 Update Status":
                             'Notes': notes
                         }
 
-                        updated_app = st.session_state.tracker.update_application(target_app['Application ID'], updates)
+                        updated_app = tracker.update_application(target_app['Application ID'], updates)
 
                         st.success(f"✅ Updated {company} - {job_title}")
                         st.info(f"""
@@ -352,7 +424,7 @@ elif page == "📝 Update Status":
 elif page == "📧 Generate Email":
     st.header("📧 Generate Follow-up Email")
 
-    applications = st.session_state.tracker.load_applications()
+    applications = tracker.load_applications()
 
     if not applications:
         st.info("No applications yet. Add applications first!")
@@ -390,7 +462,7 @@ elif page == "📧 Generate Email":
 elif page == "💡 AI Suggestions":
     st.header("💡 AI Suggestions & Insights")
 
-    applications = st.session_state.tracker.load_applications()
+    applications = tracker.load_applications()
 
     if not applications:
         st.info("Add applications to get personalized suggestions!")
@@ -400,7 +472,7 @@ elif page == "💡 AI Suggestions":
         with tab1:
             st.subheader("📊 Overall Job Search Strategy")
 
-            analytics = st.session_state.tracker.get_analytics()
+            analytics = tracker.get_analytics()
 
             st.metric("Total Applications", analytics.get('total_applications', 0))
 
@@ -461,7 +533,7 @@ elif page == "💡 AI Suggestions":
 elif page == "📊 Analytics":
     st.header("📊 Detailed Analytics")
 
-    applications = st.session_state.tracker.load_applications()
+    applications = tracker.load_applications()
 
     if not applications:
         st.info("Add applications to see analytics!")
@@ -469,17 +541,19 @@ elif page == "📊 Analytics":
         df = pd.DataFrame(applications)
 
         # Export option
+        compress_export = st.checkbox("Compress export (gzip)")
         if st.button("📥 Export to CSV"):
-            filename = st.session_state.tracker.export_to_csv()
-            st.success(f"✅ Data exported to: {filename}")
-
-            with open(filename, 'rb') as f:
-                st.download_button(
-                    label="⬇️ Download CSV",
-                    data=f,
-                    file_name=filename,
-                    mime='text/csv'
-                )
+            compression = 'gzip' if compress_export else None
+            data = b''.join(tracker.iter_export(compression))
+            filename = f'job_applications_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
+            st.success(f"✅ Exported {len(applications)} applications")
+
+            st.download_button(
+                label="⬇️ Download CSV",
+                data=data,
+                file_name=filename + ('.gz' if compression else ''),
+                mime='application/gzip' if compression else 'text/csv'
+            )
 
         st.markdown("---")
 
@@ -489,27 +563,29 @@ elif page == "📊 Analytics":
         df_timeline['Application Date'] = pd.to_datetime(df_timeline['Application Date'])
         df_timeline = df_timeline.sort_values('Application Date')
 
-        fig = px.scatter(
-            df_timeline,
-            x='Application Date',
-            y='Company Name',
-            color='Status',
-            size='Success Score',
-            hover_data=['Job Title', 'Days Since Applied']
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        with tracker_metrics.timed('render.timeline_chart'):
+            fig = px.scatter(
+                df_timeline,
+                x='Application Date',
+                y='Company Name',
+                color='Status',
+                size='Success Score',
+                hover_data=['Job Title', 'Days Since Applied']
+            )
+            st.plotly_chart(fig, use_container_width=True)
 
         # Company breakdown
         st.subheader("🏢 Top Companies by Success Score")
         companies_scores = df.groupby('Company Name')['Success Score'].mean().sort_values(ascending=False).head(10)
 
-        fig = px.bar(
-            x=companies_scores.values,
-            y=companies_scores.index,
-            orientation='h',
-            labels={'x': 'Average Success Score', 'y': 'Company'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        with tracker_metrics.timed('render.company_chart'):
+            fig = px.bar(
+                x=companies_scores.values,
+                y=companies_scores.index,
+                orientation='h',
+                labels={'x': 'Average Success Score', 'y': 'Company'}
+            )
+            st.plotly_chart(fig, use_container_width=True)
 
 elif page == "⚙️ Settings":
     st.header("⚙️ Settings")
@@ -520,13 +596,123 @@ elif page == "⚙️ Settings":
 
     with col1:
         if st.button("📥 Export All Data"):
-            filename = st.session_state.tracker.export_to_csv()
-            st.success(f"✅ Exported to: {filename}")
+            # Served as a download: on shared servers the working directory belongs to everyone
+            st.download_button(
+                label="⬇️ Download CSV",
+                data=b''.join(tracker.iter_export()),
+                file_name=f'job_applications_export_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv',
+                mime='text/csv'
+            )
 
     with col2:
         uploaded_file = st.file_uploader("📤 Import CSV", type=['csv'])
-        if uploaded_file is not None:
-            st.info("Import functionality - CSV file uploaded!")
+        if uploaded_file is not None and st.button("Import Applications"):
+            try:
+                with st.spinner("Importing..."):
+                    report = tracker.import_csv(uploaded_file)
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                st.success(
+                    f"✅ Imported {report['imported']} of {report['rows']} rows "
+                    f"({report['rows_per_second']:,.0f} rows/sec)"
+                )
+                if report['duplicates']:
+                    st.info(f"ℹ️ {report['duplicates']} rows skipped as already tracked")
+                if report['unmapped_columns']:
+                    st.caption(f"Ignored columns: {', '.join(report['unmapped_columns'])}")
+                if report['rejected']:
+                    st.warning(f"⚠️ {report['rejected']} rows rejected")
+                    st.dataframe(pd.DataFrame(report['errors']), use_container_width=True)
+
+    with st.expander("🔍 Duplicate Applications"):
+        duplicates = tracker.find_duplicates()
+        if duplicates['duplicate_groups']:
+            st.warning(
+                f"{duplicates['redundant_applications']} applications duplicate "
+                f"{duplicates['duplicate_groups']} others (same company, title, date and URL)"
+            )
+            for group in duplicates['groups']:
+                st.dataframe(
+                    pd.DataFrame(group)[['Application ID', 'Company Name', 'Job Title', 'Application Date', 'Status', 'Last Updated']],
+                    use_container_width=True
+                )
+        else:
+            st.success("✅ No duplicate applications")
+
+    with st.expander("📦 Archive Closed Applications"):
+        st.caption(
+            "Moves rejected, accepted and withdrawn applications out of the working data "
+            "into compressed monthly archives. Lifetime totals still include them."
+        )
+        archive_days = st.number_input("Applied more than (days ago)", min_value=0, value=180, step=30)
+        if st.button("Archive"):
+            with st.spinner("Archiving..."):
+                report = tracker.archive_closed(int(archive_days))
+            if report['archived']:
+                st.success(
+                    f"✅ Archived {report['archived']} applications into {len(report['partitions'])} monthly partitions "
+                    f"({report['working_set']} remain active)"
+                )
+            else:
+                st.info("No closed applications old enough to archive")
+        if len(tracker.archive):
+            lifetime = tracker.get_lifetime_analytics()
+            st.caption(
+                f"{len(tracker.archive)} applications archived; "
+                f"{lifetime.get('total_applications', 0)} in total including active ones"
+            )
+
+    with st.expander("🗄️ Cache Statistics"):
+        cache_stats = tracker.get_cache_stats()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Data Cache Hit Rate", f"{cache_stats['store_hit_rate']}%")
+            st.caption(f"{cache_stats['store_hits']} hits / {cache_stats['store_misses']} reloads")
+        with col2:
+            st.metric("Analytics Cache Hit Rate", f"{cache_stats['derived_hit_rate']}%")
+            st.caption(f"{cache_stats['derived_hits']} hits / {cache_stats['derived_misses']} recomputes")
+        st.caption(
+            f"Running totals verified {cache_stats['aggregate_checks']} times, "
+            f"{cache_stats['aggregate_repairs']} repairs"
+        )
+        if USER_DATA_DIR:
+            pool_stats = get_tracker_pool().get_stats()
+            st.caption(
+                f"{pool_stats['open_trackers']}/{pool_stats['capacity']} user trackers open, "
+                f"{pool_stats['hit_rate']}% pool hit rate, {pool_stats['evictions']} evictions"
+            )
+
+    if tracker_metrics.enabled():
+        with st.expander("📈 Performance Metrics"):
+            metrics = tracker_metrics.snapshot()
+            st.caption(f"Recorded since {metrics['since']}, slowest in total first")
+            if metrics['timers']:
+                st.dataframe(
+                    pd.DataFrame.from_dict(metrics['timers'], orient='index'),
+                    use_container_width=True
+                )
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(
+                    "Download JSON", json.dumps(metrics, indent=2),
+                    file_name='job_tracker_metrics.json', mime='application/json'
+                )
+            with col2:
+                st.download_button(
+                    "Download Prometheus", tracker_metrics.prometheus_text(),
+                    file_name='job_tracker_metrics.prom', mime='text/plain'
+                )
+
+    if USER_DATA_DIR and 'workspace_id' in st.session_state:
+        st.markdown("---")
+        st.subheader("👤 Workspace")
+        st.caption("Your applications are private to this workspace. Keep its ID to come back to it from another browser.")
+        st.code(st.session_state.workspace_id)
+        other_workspace = st.text_input("Open another workspace", placeholder="Workspace ID")
+        if other_workspace and st.button("Switch Workspace"):
+            st.session_state.workspace_id = other_workspace.strip()
+            st.rerun()
 
     st.markdown("---")
 
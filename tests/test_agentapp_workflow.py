@@ -0,0 +1,37 @@
+"""
+Workflow Tests for Job Application Tracker
+Form submissions routed through JobTrackerWorkflow
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agentapp_workflow import JobTrackerWorkflow
+
+
+@pytest.fixture
+def workflow(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    workflow = JobTrackerWorkflow()
+    workflow.tracker.add_application({
+        'Company Name': 'Acme', 'Job Title': 'Software Engineer',
+        'Application Date': '2026-01-05', 'Status': 'Phone Screen'
+    })
+    return workflow
+
+
+def test_update_without_status_keeps_the_current_one(workflow):
+    result = workflow.update_application_status({
+        'Application ID': 'APP001', 'Company Name': 'Acme', 'Job Title': 'Software Engineer',
+        'Notes': 'Sent thank-you note'
+    })
+
+    assert result['status'] == 'success'
+    assert result['application']['Status'] == 'Phone Screen'
+    for path in (workflow.tracker.csv_file, workflow.tracker.csv_file + '.journal'):
+        with open(path, encoding='utf-8') as f:
+            assert 'None' not in f.read()
@@ -0,0 +1,46 @@
+"""
+Record Tests for Job Application Tracker
+Parsing and serialization of Application records
+"""
+
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_record import Application, parse_date, parse_datetime
+
+
+def test_missing_values_are_stored_as_empty_text():
+    record = Application.from_row({'Application ID': 'APP001', 'Status': None, 'Notes': None})
+
+    row = record.to_row()
+    assert row['Status'] == ''
+    assert row['Notes'] == ''
+    assert 'None' not in row.values()
+
+
+def test_date_objects_are_accepted_and_stored_as_text():
+    record = Application.from_row({
+        'Application ID': 'APP001', 'Status': 'Applied',
+        'Application Date': date(2026, 1, 5),
+        'Follow-up Date': datetime(2026, 1, 19, 9, 30),
+        'Interview Date': datetime(2026, 1, 12, 14, 0, 0, 250),
+    })
+
+    assert record.applied_on == date(2026, 1, 5)
+    assert record.follow_up_on == date(2026, 1, 19)
+    assert record.interview_at == datetime(2026, 1, 12, 14, 0)
+    row = record.to_row()
+    assert row['Application Date'] == '2026-01-05'
+    assert row['Follow-up Date'] == '2026-01-19'
+    assert row['Interview Date'] == '2026-01-12 14:00:00'
+    assert Application.from_row(row).to_dict() == record.to_dict()
+
+
+def test_unparseable_dates_are_treated_as_missing():
+    assert parse_date(20260105) is None
+    assert parse_date('05/01/2026') is None
+    assert parse_datetime(1.5) is None
+    assert parse_datetime(date(2026, 1, 5)) == datetime(2026, 1, 5)
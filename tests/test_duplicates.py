@@ -0,0 +1,80 @@
+"""
+Duplicate Detection Tests for Job Application Tracker
+Normalized duplicate keys and the duplicate policies of single and bulk adds
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_store import duplicate_key
+from job_tracker_manager import DuplicateApplicationError, JobTrackerManager
+
+ACME = {'Company Name': 'Acme', 'Job Title': 'Software Engineer', 'Application Date': '2026-01-05',
+        'Status': 'Applied', 'Job URL': 'https://acme.example/jobs/1'}
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+    tracker.add_application(ACME)
+    return tracker
+
+
+def test_key_ignores_case_spacing_and_url_form():
+    assert duplicate_key(' ACME ', 'software  engineer', '2026-01-05', 'http://www.acme.example/jobs/1/#apply') == \
+        duplicate_key('Acme', 'Software Engineer', '2026-01-05 ', 'https://acme.example/jobs/1')
+    assert duplicate_key('Acme', 'Software Engineer', '2026-01-06', '') != \
+        duplicate_key('Acme', 'Software Engineer', '2026-01-05', '')
+
+
+def test_single_add_policies(tracker):
+    again = dict(ACME, **{'Company Name': 'acme', 'Contact Person': 'Dana'})
+    with pytest.raises(DuplicateApplicationError) as raised:
+        tracker.add_application(again)
+    assert raised.value.existing_id == 'APP001'
+
+    assert tracker.add_application(again, on_duplicate='skip')['Contact Person'] == ''
+    assert tracker.add_application(again, on_duplicate='merge')['Contact Person'] == 'Dana'
+    assert tracker.add_application(again, on_duplicate='allow')['Application ID'] == 'APP002'
+    assert len(tracker.load_applications()) == 2
+
+    with pytest.raises(ValueError, match='ignore'):
+        tracker.add_application(again, on_duplicate='ignore')
+
+
+def test_bulk_add_reports_tracked_and_repeated_rows(tracker):
+    report = tracker.add_applications([
+        dict(ACME, Notes='again'),
+        {'Company Name': 'Globex', 'Job Title': 'Data Engineer', 'Application Date': '2026-01-06'},
+        {'Company Name': 'GLOBEX', 'Job Title': 'Data Engineer', 'Application Date': '2026-01-06',
+         'Notes': 'second row'},
+    ], on_duplicate='merge')
+
+    assert [result['status'] for result in report['results']] == ['merged', 'added', 'merged']
+    assert report['results'][0]['existing'] == 'APP001'
+    assert report['results'][2]['duplicate_of_index'] == 1
+    applications = {app['Application ID']: app for app in tracker.load_applications()}
+    assert applications['APP001']['Notes'] == 'again'
+    assert len(applications) == 2 and applications['APP002']['Notes'] == 'second row'
+
+
+def test_find_duplicates_groups_oldest_first(tracker):
+    tracker.add_application(dict(ACME, **{'Job URL': 'acme.example/jobs/1/'}), on_duplicate='allow')
+    tracker.add_application(dict(ACME, **{'Job Title': 'Staff Engineer'}))
+
+    report = tracker.find_duplicates()
+    assert [[app['Application ID'] for app in group] for group in report['groups']] == [['APP001', 'APP002']]
+    assert report['redundant_applications'] == 1
+
+
+def test_update_moves_an_application_out_of_its_group(tracker):
+    tracker.add_application(ACME, on_duplicate='allow')
+    tracker.update_application('APP002', {'Application Date': '2026-01-06'})
+
+    assert tracker.find_duplicates()['duplicate_groups'] == 0
+    tracker.add_application(dict(ACME, **{'Application Date': '2026-01-06'}), on_duplicate='skip')
+    assert len(tracker.load_applications()) == 2
@@ -0,0 +1,97 @@
+"""
+Tracker Tests for Job Application Tracker
+Behavior of JobTrackerManager reads and writes against real storage files
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_tracker_manager import DuplicateApplicationError, JobTrackerManager
+
+
+def storage_files(tracker: JobTrackerManager) -> dict:
+    """{path: bytes} of the tracker's data file and journal"""
+    contents = {}
+    for path in (tracker.csv_file, tracker.csv_file + '.journal'):
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                contents[path] = f.read()
+    return contents
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+    tracker.add_application({
+        'Company Name': 'Acme', 'Job Title': 'Software Engineer',
+        'Application Date': '2026-01-05', 'Status': 'Applied'
+    })
+    return tracker
+
+
+@pytest.mark.parametrize('column, value', [
+    ('Application ID', 'APP999'),
+    ('Last Updated', '2020-01-01 00:00:00'),
+    ('Days Since Applied', 3),
+    ('Success Score', 90),
+])
+def test_rejected_update_leaves_storage_unchanged(tracker, column, value):
+    before = storage_files(tracker)
+    with pytest.raises(ValueError, match=column):
+        tracker.update_application('APP001', {'Status': 'Rejected', column: value})
+
+    assert storage_files(tracker) == before
+    assert tracker.get_application('APP001')['Status'] == 'Applied'
+    reloaded = JobTrackerManager(tracker.csv_file, storage='csv')
+    assert reloaded.get_application('APP001') == tracker.get_application('APP001')
+
+
+def test_update_is_persisted(tracker):
+    tracker.update_application('APP001', {'Status': 'Phone Screen', 'Notes': 'Call on Monday'})
+
+    reloaded = JobTrackerManager(tracker.csv_file, storage='csv')
+    application = reloaded.get_application('APP001')
+    assert application['Status'] == 'Phone Screen'
+    assert application['Notes'] == 'Call on Monday'
+
+
+def test_none_values_are_not_written_as_text(tracker):
+    tracker.update_application('APP001', {'Notes': None, 'Contact Person': None})
+
+    assert b'None' not in b''.join(storage_files(tracker).values())
+    assert JobTrackerManager(tracker.csv_file, storage='csv').get_application('APP001')['Notes'] == ''
+
+
+def test_bulk_add_reports_the_derived_fields_it_stores(tracker):
+    applied = date.today() - timedelta(days=20)
+    report = tracker.add_applications([
+        {'Company Name': 'Globex', 'Job Title': 'Data Engineer', 'Application Date': applied.isoformat(),
+         'Status': 'Phone Screen'},
+        {'Company Name': 'Initech', 'Job Title': 'QA Engineer', 'Application Date': 'next week'},
+    ])
+
+    added = [result['application'] for result in report['results']]
+    assert added[0]['Days Since Applied'] == 20
+    for application in added:
+        assert application == tracker.get_application(application['Application ID'])
+
+
+def test_date_objects_are_stored_as_dates(tracker):
+    added = tracker.add_application({
+        'Company Name': 'Globex', 'Job Title': 'Data Engineer',
+        'Application Date': date(2026, 1, 5), 'Status': 'Applied'
+    })
+    tracker.update_application(added['Application ID'], {'Follow-up Date': date(2026, 1, 19)})
+
+    # Still a duplicate when the same date comes as text
+    with pytest.raises(DuplicateApplicationError):
+        tracker.add_application({'Company Name': 'Globex', 'Job Title': 'Data Engineer',
+                                 'Application Date': '2026-01-05', 'Status': 'Applied'})
+    reloaded = JobTrackerManager(tracker.csv_file, storage='csv').get_application(added['Application ID'])
+    assert reloaded['Application Date'] == '2026-01-05'
+    assert reloaded['Follow-up Date'] == '2026-01-19'
@@ -0,0 +1,259 @@
+"""
+Storage Tests for Job Application Tracker
+Journal replay, change reads, compaction, group commit, ID sequences, date indexes and running aggregates
+"""
+
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import vectorized_analytics
+from application_store import DateIndex
+from job_tracker_manager import JobTrackerManager
+from tracker_storage import CSVStorage, GroupCommit, SQLiteStorage, create_storage
+
+HEADERS = [
+    'Application ID', 'Company Name', 'Job Title', 'Application Date',
+    'Status', 'Days Since Applied', 'Contact Person', 'Contact Email',
+    'Salary Range', 'Job URL', 'Interview Date', 'Follow-up Date',
+    'Notes', 'Last Updated', 'Success Score'
+]
+
+
+def make_row(n: int, **fields) -> dict:
+    row = {header: '' for header in HEADERS}
+    row.update({
+        'Application ID': f'APP{n:03d}',
+        'Company Name': f'Company {n}',
+        'Job Title': 'Software Engineer',
+        'Application Date': '2026-01-05',
+        'Status': 'Applied',
+    })
+    row.update(fields)
+    return row
+
+
+@pytest.fixture
+def csv_storage(tmp_path):
+    storage = CSVStorage(str(tmp_path / 'job_applications.csv'), HEADERS)
+    storage.initialize()
+    return storage
+
+
+def test_journal_replays_updates_over_the_data_file(csv_storage):
+    csv_storage.append([make_row(1), make_row(2)])
+    csv_storage.update([{'Application ID': 'APP001', 'Status': 'Rejected'}])
+    csv_storage.update([{'Application ID': 'APP002', 'Notes': 'first'},
+                        {'Application ID': 'APP002', 'Notes': 'second'}])
+
+    assert os.path.exists(csv_storage.journal_path)
+    reopened = CSVStorage(csv_storage.path, HEADERS)
+    rows = {row['Application ID']: row for row in reopened.load()}
+    assert rows['APP001']['Status'] == 'Rejected'
+    assert rows['APP002']['Notes'] == 'second'
+    assert rows['APP002']['Status'] == 'Applied'
+
+
+def test_torn_journal_line_is_skipped(csv_storage):
+    csv_storage.append([make_row(1)])
+    csv_storage.update([{'Application ID': 'APP001', 'Notes': 'kept'}])
+    # An append interrupted mid-line
+    with open(csv_storage.journal_path, 'a', encoding='utf-8') as f:
+        f.write('{"Application ID": "APP001", "Notes": "to')
+
+    assert csv_storage.load()[0]['Notes'] == 'kept'
+
+    # The next append starts on a fresh line, so it isn't glued to the torn one
+    csv_storage.update([{'Application ID': 'APP001', 'Status': 'Phone Screen'}])
+    row = csv_storage.load()[0]
+    assert row['Notes'] == 'kept'
+    assert row['Status'] == 'Phone Screen'
+
+
+def test_changes_since_reads_only_what_was_appended(csv_storage):
+    csv_storage.append([make_row(1)])
+    csv_storage.update([{'Application ID': 'APP001', 'Notes': 'first'}])
+    fingerprint = csv_storage.fingerprint()
+
+    csv_storage.append([make_row(2)])
+    csv_storage.update([{'Application ID': 'APP001', 'Status': 'Rejected'}])
+    rows, deltas, current = csv_storage.changes_since(fingerprint)
+    assert rows == [make_row(2)]
+    assert deltas == [{'Application ID': 'APP001', 'Status': 'Rejected'}]
+    assert current == csv_storage.fingerprint()
+    assert csv_storage.changes_since(current) == ([], [], current)
+
+    # Compaction rewrites the data file, so only a full load will do
+    csv_storage.compact()
+    assert csv_storage.changes_since(current) is None
+
+
+def test_journal_compacts_once_larger_than_the_data_file(tmp_path):
+    storage = CSVStorage(str(tmp_path / 'job_applications.csv'), HEADERS, compact_threshold_bytes=0)
+    storage.initialize()
+    storage.append([make_row(n) for n in range(1, 4)])
+
+    storage.update([{'Application ID': 'APP001', 'Notes': 'short'}])
+    assert os.path.exists(storage.journal_path)
+
+    storage.update([{'Application ID': 'APP002', 'Notes': 'x' * os.path.getsize(storage.path)}])
+    assert not os.path.exists(storage.journal_path)
+    rows = {row['Application ID']: row for row in storage.load()}
+    assert rows['APP001']['Notes'] == 'short'
+    assert len(rows['APP002']['Notes']) > 100
+
+
+@pytest.mark.parametrize('backend', ['csv', 'sqlite'])
+def test_supported_backends_round_trip(tmp_path, backend):
+    storage = create_storage(backend, str(tmp_path / 'job_applications.csv'), HEADERS)
+    storage.initialize()
+    storage.append([make_row(1), make_row(2)])
+    storage.update([{'Application ID': 'APP002', 'Status': 'Interviewed'}])
+
+    reopened = create_storage(backend, str(tmp_path / 'job_applications.csv'), HEADERS)
+    reopened.initialize()
+    assert reopened.load() == [make_row(1), make_row(2, Status='Interviewed')]
+
+
+def test_unknown_backend_is_rejected(tmp_path):
+    with pytest.raises(ValueError, match='arrow'):
+        create_storage('arrow', str(tmp_path / 'job_applications.csv'), HEADERS)
+
+
+def test_group_commit_batches_writers_queued_behind_a_commit():
+    committer = GroupCommit()
+    batches = []
+    first_started = threading.Event()
+    release = threading.Event()
+
+    def apply_batch(items):
+        batches.append(list(items))
+        if len(batches) == 1:
+            first_started.set()
+            release.wait(5)
+        return len(batches)
+
+    results = {}
+
+    def submit(item):
+        results[item] = committer.submit(item, apply_batch)
+
+    leader = threading.Thread(target=submit, args=('first',))
+    leader.start()
+    assert first_started.wait(5)
+    followers = [threading.Thread(target=submit, args=(n,)) for n in range(8)]
+    for thread in followers:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while len(committer._pending) < len(followers) and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert batches[0] == ['first']
+    assert len(batches) == 2 and sorted(batches[1]) == list(range(8))
+    assert results['first'] == (1, 1)
+    assert all(results[n] == (2, 8) for n in range(8))
+    assert GroupCommit.transition(*results['first']) == 1
+    assert GroupCommit.transition(*results[0]) is None
+
+
+def allocate_in_process(backend: str, path: str, count: int) -> list:
+    storage = SQLiteStorage(path, HEADERS) if backend == 'sqlite' else CSVStorage(path, HEADERS)
+    storage.initialize()
+    return [storage.allocate_ids(1) for _ in range(count)]
+
+
+@pytest.mark.parametrize('backend, filename', [('csv', 'job_applications.csv'), ('sqlite', 'job_applications.db')])
+def test_id_sequence_is_unique_across_processes(tmp_path, backend, filename):
+    path = str(tmp_path / filename)
+    allocate_in_process(backend, path, 0)  # create the files before the race
+    # Spawned, not forked: a forked child inherits the parent's SQLite state
+    with ProcessPoolExecutor(max_workers=4, mp_context=multiprocessing.get_context('spawn')) as pool:
+        allocated = [n for ids in pool.map(allocate_in_process, [backend] * 4, [path] * 4, [25] * 4) for n in ids]
+    assert sorted(allocated) == list(range(1, 101))
+
+
+def test_date_index_tombstones():
+    index = DateIndex()
+    index.extend((key, position) for position, key in enumerate([10, 20, 20, 30, 40]))
+
+    index.remove(20, 1)
+    index.remove(40, 4)
+    assert index.between(15, 45) == [2, 3]
+    assert index.last(2) == [3, 2]
+    assert len(index) == 3
+
+    # Re-adding a removed entry clears its tombstone
+    index.add(20, 1)
+    assert index.between(20, 20) == [1, 2]
+    assert len(index) == 4
+
+    # Purging tombstones keeps buffered additions
+    index.add(25, 5)
+    for key, position in [(10, 0), (20, 1), (20, 2)]:
+        index.remove(key, position)
+    assert index._removed == set()
+    assert index.between() == [3, 5]
+    assert index.last(5) == [3, 5]
+    assert len(index) == 2
+
+
+def test_date_index_matches_a_scan_under_random_writes():
+    rng = random.Random(7)
+    index, keys = DateIndex(), {}
+    for position in range(2000):
+        if keys and rng.random() < 0.4:
+            position = rng.choice(list(keys))
+            index.remove(keys.pop(position), position)
+        else:
+            keys[position] = rng.randint(0, 100)
+            index.add(keys[position], position)
+        if position % 50 == 0:
+            low, high = sorted((rng.randint(0, 100), rng.randint(0, 100)))
+            assert index.between(low, high) == sorted(p for p, key in keys.items() if low <= key <= high)
+            ranked = sorted(keys.items(), key=lambda item: (-item[1], item[0]))
+            assert index.last(10) == [p for p, _ in ranked[:10]]
+    assert len(index) == len(keys)
+
+
+@pytest.mark.parametrize('engine', ['python', 'numpy'])
+def test_running_aggregates_match_a_recompute(tmp_path, engine):
+    if engine == 'numpy' and not vectorized_analytics.available():
+        pytest.skip('numpy is not installed')
+    tracker = JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+    tracker.analytics_engine = engine
+    rng = random.Random(3)
+    statuses = ['Applied', 'Phone Screen', 'Interviewed', 'Offer Received', 'Rejected', 'Accepted']
+    tracker.add_applications([
+        {'Company Name': f'Company {rng.randint(0, 30)}', 'Job Title': f'Engineer {n}',
+         'Application Date': f'2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}', 'Status': rng.choice(statuses),
+         'Follow-up Date': rng.choice(['', '2026-01-20', '2027-03-01'])}
+        for n in range(300)
+    ])
+    app_ids = [app['Application ID'] for app in tracker.load_applications()]
+
+    for step in range(200):
+        app_id = rng.choice(app_ids)
+        tracker.update_application(app_id, rng.choice([
+            {'Status': rng.choice(statuses)},
+            {'Company Name': f'Company {rng.randint(0, 35)}'},
+            {'Application Date': f'2025-1{rng.randint(0, 2)}-0{rng.randint(1, 9)}'},
+            {'Follow-up Date': rng.choice(['', '2026-02-01'])},
+        ]))
+        if step % 40 == 0:
+            assert tracker.get_analytics() == tracker.recompute_analytics()
+
+    assert tracker.get_store().verify_aggregates()
+    assert tracker.get_analytics() == tracker.recompute_analytics()
+    reloaded = JobTrackerManager(tracker.csv_file, storage='csv')
+    assert reloaded.get_analytics() == tracker.get_analytics()
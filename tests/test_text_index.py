@@ -0,0 +1,109 @@
+"""
+Search Tests for Job Application Tracker
+Full-text ranking, and the index kept current across writes from other trackers
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_record import Application
+from application_store import ApplicationStore
+from job_tracker_manager import JobTrackerManager
+from text_index import TextIndex, tokenize
+
+
+def make_record(n: int, **fields) -> Application:
+    row = {
+        'Application ID': f'APP{n:03d}', 'Company Name': f'Company {n}', 'Job Title': 'Software Engineer',
+        'Application Date': '2026-01-05', 'Status': 'Applied', 'Notes': f'note {n}'
+    }
+    row.update(fields)
+    return Application.from_row(row)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+    tracker.add_applications([
+        {'Company Name': 'Acme', 'Job Title': 'Python Developer', 'Application Date': '2026-01-05',
+         'Notes': 'Remote team'},
+        {'Company Name': 'Globex', 'Job Title': 'Data Engineer', 'Application Date': '2026-01-06',
+         'Notes': 'Python and Spark'},
+        {'Company Name': 'Initech', 'Job Title': 'QA Engineer', 'Application Date': '2026-01-07'},
+    ])
+    return tracker
+
+
+def search_ids(tracker: JobTrackerManager, query: str) -> list:
+    return [result['application']['Application ID'] for result in tracker.search(query)]
+
+
+def test_tokenize_keeps_language_names():
+    assert tokenize('C++ and C# with Node.js') == ['c++', 'and', 'c#', 'with', 'node.js']
+
+
+def test_company_matches_rank_before_notes():
+    index = TextIndex.build([
+        make_record(1, Notes='Referred by someone at Acme'),
+        make_record(2, **{'Company Name': 'Acme'}),
+    ])
+    assert [position for _, position in index.search('acme')] == [1, 0]
+    assert index.search('acme missing') == []
+
+
+def test_search_sees_another_trackers_writes_without_a_rebuild(tracker):
+    assert search_ids(tracker, 'python') == ['APP001', 'APP002']
+    store = tracker.get_store()
+    index = store.text_index
+
+    other = JobTrackerManager(tracker.csv_file, storage='csv')
+    other.add_application({'Company Name': 'Umbrella', 'Job Title': 'Python Engineer',
+                           'Application Date': '2026-01-08', 'Status': 'Applied'})
+    other.update_application('APP001', {'Job Title': 'Go Developer'})
+
+    assert search_ids(tracker, 'python') == ['APP004', 'APP002']
+    assert search_ids(tracker, 'go developer') == ['APP001']
+    # Applied in place from the appended row and journal line, not reloaded
+    assert tracker.get_store() is store
+    assert store.text_index is index
+
+
+def test_rewritten_storage_reloads_and_keeps_the_index(tracker):
+    tracker.search('python')
+    index = tracker.get_store().text_index
+
+    other = JobTrackerManager(tracker.csv_file, storage='csv')
+    other.update_application('APP002', {'Notes': 'Scala only'})
+    other.storage.compact()
+
+    assert search_ids(tracker, 'python') == ['APP001']
+    assert search_ids(tracker, 'scala') == ['APP002']
+    assert tracker.get_store().text_index is index
+
+
+def test_no_index_file_is_written(tracker):
+    tracker.search('python')
+    tracker.update_application('APP003', {'Notes': 'Python tests'})
+    assert search_ids(tracker, 'python') == ['APP001', 'APP002', 'APP003']
+    assert not [name for name in os.listdir(os.path.dirname(tracker.csv_file)) if 'search' in name]
+
+
+def test_adopted_index_matches_a_fresh_build():
+    records = [make_record(n) for n in range(1, 8)]
+    previous = ApplicationStore(records)
+    previous.text_index = TextIndex.build(previous.rows)
+
+    # Two archived, one edited, one added
+    current = ApplicationStore(
+        [records[0], records[2], make_record(4, Notes='moved to Berlin')] + records[4:6] + [make_record(8)]
+    )
+    current.adopt_text_index(previous)
+
+    fresh = TextIndex.build(current.rows)
+    assert current.text_index.postings == fresh.postings
+    assert current.text_index.documents == fresh.documents
+    assert previous.text_index is None
@@ -0,0 +1,69 @@
+"""
+Archive Tests for Job Application Tracker
+Moving old closed applications to monthly partitions and reading them back
+"""
+
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_tracker_manager import DuplicateApplicationError, JobTrackerManager
+
+OLD = (date.today() - timedelta(days=400)).replace(day=10)
+
+
+def application(company: str, status: str, applied: date = OLD) -> dict:
+    return {'Company Name': company, 'Job Title': 'Engineer', 'Application Date': applied.isoformat(),
+            'Status': status}
+
+
+@pytest.fixture(params=['csv', 'sqlite'])
+def backend(request):
+    return request.param
+
+
+@pytest.fixture
+def tracker(tmp_path, backend):
+    tracker = JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage=backend)
+    tracker.add_applications([
+        application('Globex', 'Applied'),
+        application('Umbrella', 'Withdrawn', date.today()),
+        application('Acme', 'Rejected'),
+        application('Initech', 'Accepted', OLD.replace(day=1) - timedelta(days=1)),
+    ])
+    return tracker
+
+
+def test_only_old_closed_applications_are_archived(tracker, backend):
+    before = tracker.get_lifetime_analytics()
+    report = tracker.archive_closed(180)
+
+    assert report['archived'] == 2
+    assert sorted(report['partitions']) == sorted({OLD.strftime('%Y-%m'),
+                                                   (OLD.replace(day=1) - timedelta(days=1)).strftime('%Y-%m')})
+    assert (report['working_set'], report['archived_total']) == (2, 2)
+    assert [app['Company Name'] for app in tracker.load_applications()] == ['Globex', 'Umbrella']
+    assert sorted(app['Company Name'] for app in tracker.iter_archived()) == ['Acme', 'Initech']
+    assert tracker.get_lifetime_analytics() == before
+
+    # Nothing comes back on a restart, and archiving again is a no-op
+    reopened = JobTrackerManager(tracker.csv_file, storage=backend)
+    assert len(reopened.load_applications()) == 2
+    assert reopened.archive_closed(180)['archived'] == 0
+
+
+def test_archived_applications_still_count_as_tracked(tracker):
+    tracker.archive_closed(180)
+
+    with pytest.raises(DuplicateApplicationError) as raised:
+        tracker.add_application(application('Acme', 'Rejected'))
+    assert raised.value.existing_id == 'APP003'
+    report = tracker.add_applications([application('Acme', 'Applied')], on_duplicate='merge')
+    assert report['results'][0] == {'existing': 'APP003', 'archived': True, 'index': 0, 'status': 'duplicate'}
+
+    # IDs are never reused, even after the highest one was archived
+    assert tracker.add_application(application('Hooli', 'Applied'))['Application ID'] == 'APP005'
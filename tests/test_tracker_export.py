@@ -0,0 +1,124 @@
+"""
+Export Tests for Job Application Tracker
+Streamed, compressed and multi-format exports with column and row selection
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tracker_export
+from job_tracker_manager import JobTrackerManager
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+    tracker.add_applications([
+        {'Company Name': f'Company {n}', 'Job Title': 'Engineer', 'Application Date': '2026-01-05',
+         'Status': 'Rejected' if n % 3 == 0 else 'Applied', 'Notes': 'Line one\nline "two", with comma'}
+        for n in range(25)
+    ])
+    return tracker
+
+
+def read_csv(data: bytes) -> list:
+    return list(csv.DictReader(io.StringIO(data.decode('utf-8'), newline='')))
+
+
+def test_streamed_csv_matches_the_applications(tracker):
+    chunks = list(tracker.iter_export(chunk_rows=10))
+
+    assert len(chunks) > 1
+    assert read_csv(b''.join(chunks)) == [
+        {column: str(value) for column, value in app.items()} for app in tracker.load_applications()
+    ]
+
+
+@pytest.mark.parametrize('compression, decompress', [
+    ('gzip', gzip.decompress),
+    ('zstd', lambda data: tracker_export.zstandard.ZstdDecompressor().decompressobj().decompress(data)),
+])
+def test_compressed_export_round_trips(tracker, tmp_path, compression, decompress):
+    if compression == 'zstd' and tracker_export.zstandard is None:
+        pytest.skip('zstandard is not installed')
+    plain = b''.join(tracker.iter_export())
+    path = tracker.export_to_csv(str(tmp_path / f'export.csv.{compression}'), compression=compression)
+
+    with open(path, 'rb') as f:
+        assert decompress(f.read()) == plain
+
+
+def test_export_to_a_file_object(tracker):
+    destination = io.BytesIO()
+    assert tracker.export_to_csv(destination, compression='gzip') is None
+    assert len(read_csv(gzip.decompress(destination.getvalue()))) == 25
+
+
+def test_export_is_a_snapshot(tracker):
+    chunks = tracker.iter_export(chunk_rows=5)
+    first = next(chunks)
+    tracker.add_application({'Company Name': 'Late', 'Job Title': 'Engineer',
+                             'Application Date': '2026-01-06', 'Status': 'Applied'})
+
+    assert len(read_csv(first + b''.join(chunks))) == 25
+
+
+def test_unknown_compression_is_rejected(tracker):
+    with pytest.raises(ValueError, match='brotli'):
+        tracker.iter_export('brotli')
+
+
+def test_jsonl_export_projects_columns_and_filters_rows(tracker, tmp_path):
+    path = tracker.export(str(tmp_path / 'rejected.jsonl'), 'jsonl',
+                          columns=['Company Name', 'Success Score'], where={'Status': 'Rejected'})
+
+    with open(path, 'r', encoding='utf-8') as f:
+        rows = [json.loads(line) for line in f]
+    assert len(rows) == 9
+    assert all(list(row) == ['Company Name', 'Success Score'] for row in rows)
+    assert all(isinstance(row['Success Score'], int) for row in rows)
+
+
+def test_predicate_filter(tracker):
+    chunks = tracker.iter_export(columns=['Company Name'], where=lambda app: app.company.endswith('7'))
+    assert read_csv(b''.join(chunks)) == [{'Company Name': 'Company 7'}, {'Company Name': 'Company 17'}]
+
+
+def test_parquet_export_types_derived_columns(tracker, tmp_path):
+    parquet = pytest.importorskip('pyarrow.parquet')
+    path = tracker.export(str(tmp_path / 'export.parquet'), 'parquet',
+                          columns=['Application ID', 'Days Since Applied'], compression='zstd')
+
+    table = parquet.read_table(path)
+    assert table.column_names == ['Application ID', 'Days Since Applied']
+    assert str(table.schema.field('Days Since Applied').type) == 'int64'
+    assert table.num_rows == 25
+
+
+def test_xlsx_export(tracker, tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+    path = tracker.export(str(tmp_path / 'export.xlsx'), 'xlsx', columns=['Company Name', 'Status'])
+
+    rows = list(openpyxl.load_workbook(path, read_only=True)['Applications'].values)
+    assert rows[0] == ('Company Name', 'Status')
+    assert rows[1] == ('Company 0', 'Rejected')
+    assert len(rows) == 26
+
+
+@pytest.mark.parametrize('kwargs, message', [
+    ({'format': 'pdf'}, 'pdf'),
+    ({'format': 'xlsx', 'compression': 'gzip'}, 'xlsx'),
+    ({'columns': ['Salary']}, 'Salary'),
+])
+def test_invalid_exports_are_rejected(tracker, tmp_path, kwargs, message):
+    with pytest.raises(ValueError, match=message):
+        tracker.export(str(tmp_path / 'export'), **kwargs)
+    assert not os.path.exists(tmp_path / 'export')
@@ -0,0 +1,79 @@
+"""
+Import Tests for Job Application Tracker
+Column mapping, row validation and chunked bulk import of CSV files
+"""
+
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_tracker_manager import JobTrackerManager
+from tracker_import import map_columns
+
+UPLOAD = (
+    '\ufeffEmployer,Position,Date Applied,Stage,Days Since Applied,Comments\n'
+    'Acme,Python Developer,2026-01-05,phone screen,99,Referred\n'
+    'Globex,Data Engineer,,Applied,,\n'
+    'Initech,QA Engineer,2026-01-07,,,\n'
+    'Umbrella,SRE,2026-01-08,Ghosted,,\n'
+    'Hooli,ML Engineer,2026-01-09,Interviewed,,\n'
+)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+
+
+def test_columns_map_by_name_alias_and_override():
+    headers = ['Application ID', 'Company Name', 'Job Title', 'Application Date', 'Status', 'Notes', 'Last Updated']
+    mapping, unmapped = map_columns(['company name', 'Role', 'applied on', 'ID', 'Memo', 'Extra'], headers,
+                                    column_map={'Memo': 'Notes'})
+    assert mapping == {'company name': 'Company Name', 'Role': 'Job Title',
+                       'applied on': 'Application Date', 'Memo': 'Notes'}
+    # Generated columns are never imported
+    assert unmapped == ['ID', 'Extra']
+
+    with pytest.raises(ValueError, match='Salary'):
+        map_columns(['Pay'], headers, column_map={'Pay': 'Salary'})
+
+
+def test_import_validates_rows_across_chunks(tracker):
+    report = tracker.import_csv(io.BytesIO(UPLOAD.encode('utf-8')), chunk_rows=2)
+
+    assert (report['rows'], report['imported'], report['rejected']) == (5, 3, 2)
+    assert report['errors'] == [
+        {'row': 2, 'error': 'Missing Application Date'},
+        {'row': 4, 'error': "Unknown Status 'Ghosted'"},
+    ]
+    assert report['unmapped_columns'] == ['Days Since Applied']
+    applications = {app['Company Name']: app for app in tracker.load_applications()}
+    assert sorted(applications) == ['Acme', 'Hooli', 'Initech']
+    assert applications['Acme']['Status'] == 'Phone Screen'
+    assert applications['Acme']['Notes'] == 'Referred'
+    assert applications['Initech']['Status'] == 'Applied'
+    assert applications['Acme']['Days Since Applied'] != 99
+
+
+def test_reimport_skips_tracked_applications(tracker):
+    tracker.import_csv(io.StringIO(UPLOAD))
+    report = tracker.import_csv(io.StringIO(UPLOAD))
+
+    assert (report['imported'], report['duplicates']) == (0, 3)
+    assert len(tracker.load_applications()) == 3
+
+
+def test_upload_stream_is_left_open(tracker):
+    upload = io.BytesIO(UPLOAD.encode('utf-8'))
+    tracker.import_csv(upload)
+    assert not upload.closed
+
+
+def test_file_without_application_dates_is_rejected(tracker):
+    with pytest.raises(ValueError, match='Application Date'):
+        tracker.import_csv(io.StringIO('Company,Role\nAcme,Engineer\n'))
+    assert tracker.load_applications() == []
@@ -0,0 +1,95 @@
+"""
+Metrics Tests for Job Application Tracker
+Opt-in instrumentation of tracker methods and stages, and its exports
+"""
+
+import json
+import os
+import sys
+import urllib.request
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tracker_metrics
+from job_tracker_manager import JobTrackerManager
+
+APPLICATION = {'Company Name': 'Acme', 'Job Title': 'Engineer', 'Application Date': '2026-01-05',
+               'Status': 'Applied'}
+
+
+@pytest.fixture
+def metrics():
+    was_enabled = tracker_metrics.enabled()
+    tracker_metrics.reset()
+    tracker_metrics.enable()
+    yield tracker_metrics
+    if not was_enabled:
+        tracker_metrics.disable()
+    tracker_metrics.reset()
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return JobTrackerManager(str(tmp_path / 'job_applications.csv'), storage='csv')
+
+
+def test_disabled_metrics_leave_the_class_untouched():
+    if tracker_metrics.enabled():
+        pytest.skip('JOB_TRACKER_METRICS is set')
+    assert not hasattr(JobTrackerManager.add_application, '__wrapped__')
+    assert tracker_metrics.timed('storage.load') is tracker_metrics.timed('store.build')
+
+
+def test_calls_errors_and_rows_are_recorded(metrics, tracker):
+    tracker.add_applications([dict(APPLICATION, **{'Job Title': f'Engineer {n}'}) for n in range(3)])
+    tracker.load_applications()
+    with pytest.raises(ValueError):
+        tracker.update_application('APP001', {'Application ID': 'APP009'})
+
+    timers = metrics.snapshot()['timers']
+    assert timers['JobTrackerManager.add_applications']['calls'] == 1
+    assert timers['JobTrackerManager.load_applications']['rows_scanned'] == 3
+    # update_application() goes through update_applications(); both are recorded
+    assert timers['JobTrackerManager.update_application']['errors'] == 1
+    assert timers['JobTrackerManager.update_applications']['errors'] == 1
+    assert timers['storage.load']['calls'] >= 1
+    assert set(timers['storage.load']) >= {'p50_ms', 'p95_ms', 'p99_ms', 'max_ms'}
+
+
+def test_disabling_restores_the_methods(metrics, tracker):
+    assert hasattr(JobTrackerManager.load_applications, '__wrapped__')
+    metrics.disable()
+    tracker.load_applications()
+
+    assert not hasattr(JobTrackerManager.load_applications, '__wrapped__')
+    assert 'JobTrackerManager.load_applications' not in metrics.snapshot()['timers']
+
+
+def test_prometheus_and_json_files(metrics, tracker, tmp_path):
+    tracker.add_application(APPLICATION)
+
+    with open(metrics.write(str(tmp_path / 'tracker.prom')), encoding='utf-8') as f:
+        text = f.read()
+    assert 'job_tracker_calls_total{name="JobTrackerManager.add_application"} 1' in text
+    assert 'job_tracker_latency_seconds{name="JobTrackerManager.add_application",quantile="0.95"}' in text
+    with open(metrics.write(str(tmp_path / 'tracker.json')), encoding='utf-8') as f:
+        assert json.load(f)['timers']['JobTrackerManager.add_application']['calls'] == 1
+    with pytest.raises(ValueError, match='xml'):
+        metrics.write(str(tmp_path / 'tracker.xml'), format='xml')
+
+
+def test_metrics_are_served_over_http(metrics, tracker):
+    tracker.add_application(APPLICATION)
+    server = metrics.serve(port=0)
+    try:
+        base = f'http://127.0.0.1:{server.server_address[1]}'
+        with urllib.request.urlopen(base + '/metrics') as response:
+            assert response.headers['Content-Type'] == tracker_metrics.PROMETHEUS_CONTENT_TYPE
+            assert b'job_tracker_calls_total' in response.read()
+        with urllib.request.urlopen(base + '/metrics.json') as response:
+            assert json.load(response)['enabled'] is True
+    finally:
+        server.shutdown()
+        server.server_close()
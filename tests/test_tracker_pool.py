@@ -0,0 +1,104 @@
+"""
+Pool Tests for Job Application Tracker
+Per-user trackers: lazy file creation, eviction and locking of shared trackers
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tracker_pool import SharedTracker, TrackerPool
+
+APPLICATION = {'Company Name': 'Acme', 'Job Title': 'Software Engineer',
+               'Application Date': '2026-01-05', 'Status': 'Applied'}
+
+
+def files_under(root) -> list:
+    return [os.path.join(directory, name) for directory, _, names in os.walk(root) for name in names]
+
+
+@pytest.mark.parametrize('backend', ['csv', 'sqlite'])
+def test_files_are_created_by_the_first_write(tmp_path, backend):
+    pool = TrackerPool(str(tmp_path / 'users'), storage=backend)
+    tracker = pool.get('visitor')
+    assert tracker.load_applications() == []
+    assert tracker.get_analytics()['total_applications'] == 0
+    assert tracker.search('acme') == []
+    assert len(tracker.archive) == 0
+    assert not os.path.exists(tmp_path / 'users')
+
+    tracker.add_application(APPLICATION)
+    assert os.path.exists(os.path.dirname(pool.data_file('visitor')))
+
+    reopened = TrackerPool(str(tmp_path / 'users'), storage=backend).get('visitor')
+    assert [app['Company Name'] for app in reopened.load_applications()] == ['Acme']
+
+
+def test_users_get_separate_data(tmp_path):
+    pool = TrackerPool(str(tmp_path / 'users'), storage='csv')
+    pool.get('alice').add_application(APPLICATION)
+
+    assert pool.get('bob').load_applications() == []
+    assert pool.data_file('alice') != pool.data_file('bob')
+    assert len(pool.get('alice').load_applications()) == 1
+
+
+def test_least_recently_used_tracker_is_evicted(tmp_path):
+    pool = TrackerPool(str(tmp_path / 'users'), capacity=2, storage='csv')
+    first = pool.get('alice')
+    first.add_application(APPLICATION)
+    pool.get('bob')
+    pool.get('alice')
+    pool.get('carol')
+
+    assert 'bob' not in pool and 'alice' in pool and 'carol' in pool
+    assert pool.get_stats()['evictions'] == 1
+    # An evicted tracker reloads from its files if a session still holds it
+    pool.evict('alice')
+    assert first.tracker.store is None
+    assert len(first.load_applications()) == 1
+
+
+def call_while_locked(shared: SharedTracker, call) -> tuple:
+    """(whether call finished while another thread held shared.lock, its result)"""
+    held, release = threading.Event(), threading.Event()
+
+    def hold():
+        with shared.lock:
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait(5)
+    done, result = threading.Event(), []
+    caller = threading.Thread(target=lambda: (result.append(call()), done.set()))
+    caller.start()
+    finished_early = done.wait(0.2)
+    release.set()
+    holder.join(5)
+    caller.join(5)
+    return finished_early, result[0]
+
+
+def test_attributes_and_generators_hold_the_lock(tmp_path):
+    shared = TrackerPool(str(tmp_path / 'users'), storage='csv').get('alice')
+    shared.add_application(APPLICATION)
+    chunks = shared.iter_export()
+
+    assert call_while_locked(shared, lambda: len(shared.archive)) == (False, 0)
+    finished_early, chunk = call_while_locked(shared, lambda: next(chunks))
+    assert not finished_early and chunk.startswith(b'Application ID,')
+
+
+def test_mutable_attributes_are_copies(tmp_path):
+    shared = TrackerPool(str(tmp_path / 'users'), storage='csv').get('alice')
+    shared.cache_stats['store_hits'] = -1
+    shared.headers.append('Extra')
+
+    assert shared.tracker.cache_stats['store_hits'] >= 0
+    assert 'Extra' not in shared.tracker.headers
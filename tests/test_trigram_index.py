@@ -0,0 +1,67 @@
+"""
+Fuzzy Matching Tests for Job Application Tracker
+Trigram similarity of company names and the store's similar-application lookup
+"""
+
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from application_record import Application
+from application_store import ApplicationStore
+from trigram_index import TrigramIndex, normalize_name, similarity
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_record(n: int, company: str, job_title: str = 'Software Engineer') -> Application:
+    return Application.from_row({'Application ID': f'APP{n:03d}', 'Company Name': company,
+                                 'Job Title': job_title, 'Application Date': '2026-01-05', 'Status': 'Applied'})
+
+
+def test_legal_forms_are_ignored():
+    assert normalize_name('Google, LLC', strip_suffixes=True) == 'google'
+    assert similarity('Gogle', 'Google') > 0.6
+    assert similarity('Google', 'Microsoft') < 0.2
+
+
+def test_ties_follow_the_given_order_then_name_order():
+    index = TrigramIndex(strip_suffixes=True)
+    for name in ['Acme Ltd', 'Acme Inc', 'Acme Corp']:
+        index.add(name)
+
+    assert [name for _, name in index.similar('Acme')] == ['Acme Corp', 'Acme Inc', 'Acme Ltd']
+    order = {'Acme Ltd': 0, 'Acme Inc': 1, 'Acme Corp': 2}
+    assert [name for _, name in index.similar('Acme', order=order)] == ['Acme Ltd', 'Acme Inc', 'Acme Corp']
+    assert [name for _, name in index.similar('Acme', limit=2, order=order)] == ['Acme Ltd', 'Acme Inc']
+
+
+def test_store_ranks_equal_matches_in_store_order():
+    store = ApplicationStore([
+        make_record(1, 'Acme Ltd'), make_record(2, 'Acme Inc'), make_record(3, 'Acme Ltd', 'Data Engineer'),
+        make_record(4, 'Acme Corp'), make_record(5, 'Acme Inc'),
+    ])
+    # A replaced record keeps its position
+    store.replace(make_record(2, 'Acme Inc'))
+
+    matches = store.find_similar('Acme', limit=10)
+    assert [record.app_id for _, record in matches] == ['APP001', 'APP002', 'APP005', 'APP003', 'APP004']
+    assert {score for score, _ in matches} == {1.0}
+
+
+def test_ranking_does_not_depend_on_the_hash_seed():
+    script = (
+        'import sys; sys.path.insert(0, sys.argv[1])\n'
+        'from trigram_index import TrigramIndex\n'
+        'index = TrigramIndex(strip_suffixes=True)\n'
+        'for n in range(40): index.add(f"Acme {n} Ltd")\n'
+        'print(index.similar("Acme", limit=5))\n'
+    )
+    outputs = {
+        subprocess.run([sys.executable, '-c', script, ROOT], capture_output=True, text=True, check=True,
+                       env=dict(os.environ, PYTHONHASHSEED=str(seed))).stdout
+        for seed in range(4)
+    }
+    assert len(outputs) == 1
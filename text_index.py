@@ -0,0 +1,184 @@
+"""
+Full-text Index for Job Application Tracker
+Token-based inverted index over Company Name, Job Title and Notes with ranked search
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Iterable
+
+from application_record import Application
+
+# Matches in the company count most, then the title, then the notes (last, weight 1)
+FIELD_WEIGHTS = (('company', 3), ('job_title', 2), ('notes', 1))
+
+# Weights are capped here (the score saturates anyway), bounding the buckets per token
+MAX_WEIGHT = 8
+
+# Further query words are ignored, bounding the work a single search can cause
+MAX_QUERY_TOKENS = 8
+
+# Words plus the symbols that make up names like C++, C# or Node.js
+TOKEN_PATTERN = re.compile(r'[^\W_]+(?:[.+#][^\W_]+|[+#]+)*')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of text"""
+    return TOKEN_PATTERN.findall(text.casefold()) if text else []
+
+
+def _weights(record: Application) -> Dict[str, int]:
+    """Field-weighted occurrence count of each token in a record"""
+    # Notes (weight 1) hold most of the text; Counter tallies them in C
+    weights = Counter(tokenize(record.notes))
+    for attr, field_weight in FIELD_WEIGHTS[:-1]:
+        for token in tokenize(getattr(record, attr)):
+            weights[token] += field_weight
+    return weights
+
+
+def _term_score(idf: float, weight: int) -> float:
+    return idf * weight / (weight + 1.0)
+
+
+class TextIndex:
+    """
+    Inverted index from token to {weight: {store position: None}}
+
+    Positions are the record's place in ApplicationStore.rows, so lookups
+    need no ID translation. Each token's postings are bucketed by their
+    capped field-weighted count: every document in a bucket scores the
+    same for that token, so a query can take the best-scoring buckets
+    first and stop once it has enough results. Updates re-tokenize the old
+    record to remove its postings, so no per-record token lists are kept.
+    """
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[int, Dict[int, None]]] = {}
+        self.documents = 0
+
+    @classmethod
+    def build(cls, records: Iterable[Application]) -> 'TextIndex':
+        """Index records in store order"""
+        index = cls()
+        for position, record in enumerate(records):
+            index.add(position, record)
+        return index
+
+    def add(self, position: int, record: Application):
+        postings = self.postings
+        for token, weight in _weights(record).items():
+            weight = min(weight, MAX_WEIGHT)
+            buckets = postings.get(token)
+            if buckets is None:
+                postings[token] = {weight: {position: None}}
+            elif weight in buckets:
+                buckets[weight][position] = None
+            else:
+                buckets[weight] = {position: None}
+        self.documents += 1
+
+    def remove(self, position: int, record: Application):
+        postings = self.postings
+        for token, weight in _weights(record).items():
+            weight = min(weight, MAX_WEIGHT)
+            buckets = postings.get(token)
+            if buckets is None or weight not in buckets:
+                continue
+            bucket = buckets[weight]
+            bucket.pop(position, None)
+            if not bucket:
+                del buckets[weight]
+                if not buckets:
+                    del postings[token]
+        self.documents -= 1
+
+    def remap(self, positions: Dict[int, int]):
+        """Move every posting to a new position; positions maps old to new"""
+        self.postings = {
+            token: {weight: dict.fromkeys(map(positions.__getitem__, bucket)) for weight, bucket in buckets.items()}
+            for token, buckets in self.postings.items()
+        }
+
+    def search(self, query: str, limit: int = 20) -> List[tuple]:
+        """
+        Positions containing every query token, best first
+
+        Each token contributes its inverse document frequency times a
+        saturating function of its field-weighted count, so rare terms
+        and company/title matches rank highest. Equal scores keep index
+        order. Only the first MAX_QUERY_TOKENS distinct tokens are used.
+
+        Candidates come from the rarest token's buckets, best first. They
+        are kept grouped by score and intersected with the other tokens'
+        buckets as sets, so cost grows with the matches rather than with
+        every combination of buckets, and the scan stops once no later
+        bucket can beat the results already found.
+
+        Returns:
+            [(score, position)], at most limit entries
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TOKENS]
+        if not tokens or limit <= 0:
+            return []
+        terms = []
+        for token in tokens:
+            buckets = self.postings.get(token)
+            if not buckets:
+                return []
+            matching = sum(map(len, buckets.values()))
+            terms.append((matching, math.log(1 + self.documents / matching), buckets))
+        terms.sort(key=lambda term: term[0])
+        (_, driver_idf, driver), others = terms[0], terms[1:]
+        best_others = sum(_term_score(idf, max(buckets)) for _, idf, buckets in others)
+
+        heap = []  # (score, -position), the limit best so far
+        for weight in sorted(driver, reverse=True):
+            base = _term_score(driver_idf, weight)
+            if len(heap) >= limit and heap[0][0] > base + best_others:
+                break
+            groups = {base: driver[weight].keys()}  # score so far -> positions
+            for _, idf, buckets in others:
+                matched = {}
+                for score, positions in groups.items():
+                    for other_weight, bucket in buckets.items():
+                        found = positions & bucket.keys()
+                        if found:
+                            key = score + _term_score(idf, other_weight)
+                            if key in matched:
+                                matched[key] |= found
+                            else:
+                                matched[key] = found
+                groups = matched
+                if not groups:
+                    break
+            for score, positions in groups.items():
+                score = round(score, 4)
+                if len(heap) >= limit and score < heap[0][0]:
+                    continue
+                # Equal scores rank lower positions first
+                for position in sorted(positions)[:limit]:
+                    item = (score, -position)
+                    if len(heap) < limit:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+                    else:
+                        break
+        return [(score, -negated) for score, negated in sorted(heap, reverse=True)]
+
+
+def snippet(text: str, query: str, width: int = 80) -> str:
+    """The part of text around the first query token, for display"""
+    if not text:
+        return ''
+    folded = text.casefold()
+    starts = [folded.find(token) for token in tokenize(query)]
+    starts = [start for start in starts if start >= 0]
+    if not starts:
+        return text[:width] + ('…' if len(text) > width else '')
+    begin = max(0, min(starts) - width // 4)
+    end = begin + width
+    return ('…' if begin else '') + text[begin:end] + ('…' if end < len(text) else '')
@@ -0,0 +1,154 @@
+"""
+Archive Partitions for Job Application Tracker
+Keeps closed applications out of the working set in gzip-compressed monthly CSV partitions
+"""
+
+import csv
+import gzip
+import json
+import os
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from application_record import Application
+from application_store import record_key
+from tracker_export import compress_chunks, csv_chunks, write_chunks
+from tracker_storage import file_signature, locked_file
+
+# Partition for applications without a usable Application Date
+UNDATED_PARTITION = 'undated'
+
+
+def partition_name(application_date: str) -> str:
+    """Monthly partition of an application: YYYY-MM of its Application Date"""
+    value = (application_date or '').strip()
+    if len(value) >= 7 and value[4] == '-' and value[:4].isdigit() and value[5:7].isdigit():
+        return value[:7]
+    return UNDATED_PARTITION
+
+
+def archive_key(key: tuple) -> str:
+    """Text form of a duplicate_key() tuple, as stored in the archive's key file"""
+    return '\x1f'.join(str(part) for part in key)
+
+
+class ApplicationArchive:
+    """
+    Archived applications, one compressed CSV per application month
+
+    Partitions are only rewritten when more applications are archived into
+    them, so reads never contend with the working data file. A manifest
+    records the row count of each partition, so sizes are known without
+    decompressing anything. A key file maps the duplicate key of every
+    archived application to its ID and partition, so re-imports can
+    recognize archived applications without reading the partitions.
+    """
+
+    def __init__(self, directory: str, headers: List[str]):
+        self.directory = directory
+        self.headers = headers
+        self.manifest_path = os.path.join(directory, 'manifest.json')
+        self.keys_path = os.path.join(directory, 'duplicate_keys.json')
+        self._keys = None  # (signature, keys) of the key file last read
+
+    def _path(self, partition: str) -> str:
+        return os.path.join(self.directory, f'{partition}.csv.gz')
+
+    def manifest(self) -> Dict[str, int]:
+        """{partition: archived rows}, oldest partition first"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def signature(self) -> tuple:
+        """Changes whenever anything is archived"""
+        return file_signature(self.manifest_path)
+
+    def _read_keys(self) -> Dict[str, List[str]]:
+        try:
+            with open(self.keys_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            # Archives written before the key file existed
+            keys = {}
+            for partition in self.manifest():
+                for row in self.read_partition(partition):
+                    keys.setdefault(archive_key(record_key(Application.from_row(row))),
+                                    [row[self.headers[0]], partition])
+            return keys
+
+    def duplicate_keys(self) -> Dict[str, List[str]]:
+        """{archive_key(duplicate key): [Application ID, partition]} of every archived application"""
+        signature = file_signature(self.keys_path)
+        if self._keys is None or self._keys[0] != signature:
+            self._keys = (signature, self._read_keys())
+        return self._keys[1]
+
+    def find_duplicate(self, key: tuple) -> Optional[Dict[str, str]]:
+        """The archived row with this duplicate_key(), if any"""
+        found = self.duplicate_keys().get(archive_key(key))
+        if found is None:
+            return None
+        app_id, partition = found
+        return next((row for row in self.read_partition(partition) if row[self.headers[0]] == app_id), None)
+
+    def __len__(self) -> int:
+        return sum(self.manifest().values())
+
+    def read_partition(self, partition: str) -> Iterator[Dict[str, str]]:
+        """Rows of one partition, streamed"""
+        path = self._path(partition)
+        if not os.path.exists(path):
+            return
+        with gzip.open(path, 'rt', newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+    def rows(self) -> Iterator[Dict[str, str]]:
+        """Every archived row, partition by partition"""
+        for partition in self.manifest():
+            yield from self.read_partition(partition)
+
+    def add(self, rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Archive rows, merging them into their monthly partitions
+
+        Rows already archived (same Application ID) are replaced. Each
+        touched partition is rewritten atomically, then the key file and
+        the manifest.
+
+        Returns:
+            {partition: rows added to it}
+        """
+        key = self.headers[0]
+        by_partition: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for row in rows:
+            by_partition.setdefault(partition_name(row.get('Application Date')), {})[row[key]] = row
+        if not by_partition:
+            return {}
+
+        os.makedirs(self.directory, exist_ok=True)
+        with locked_file(os.path.join(self.directory, '.lock')):
+            manifest = self.manifest()
+            keys = self._read_keys()
+            for partition, new_rows in by_partition.items():
+                merged = {row[key]: row for row in self.read_partition(partition)}
+                merged.update(new_rows)
+                path = self._path(partition)
+                tmp_path = path + '.tmp'
+                write_chunks(compress_chunks(csv_chunks(self.headers, merged.values()), 'gzip'), tmp_path)
+                os.replace(tmp_path, path)
+                manifest[partition] = len(merged)
+                for app_id, row in new_rows.items():
+                    keys.setdefault(archive_key(record_key(Application.from_row(row))), [app_id, partition])
+
+            self._write_json(self.keys_path, keys, indent=None)
+            self._write_json(self.manifest_path, dict(sorted(manifest.items())), indent=1)
+        return {partition: len(new_rows) for partition, new_rows in sorted(by_partition.items())}
+
+    @staticmethod
+    def _write_json(path: str, data: Any, indent: Optional[int]):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+        os.replace(tmp_path, path)
@@ -0,0 +1,151 @@
+"""
+Export Writers for Job Application Tracker
+Writes application rows as CSV or JSON Lines streams (optionally compressed), Parquet or XLSX
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet
+except ImportError:
+    pa = None
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet', 'xlsx')
+# Formats written as a byte stream (and so compressible with compress_chunks)
+STREAM_FORMATS = ('csv', 'jsonl')
+FORMAT_SUFFIXES = {'csv': '.csv', 'jsonl': '.jsonl', 'parquet': '.parquet', 'xlsx': '.xlsx'}
+
+# File name suffix for each supported compression
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+
+def csv_chunks(headers: List[str], rows: Iterable[Dict[str, Any]], chunk_rows: int = 1000) -> Iterator[bytes]:
+    """
+    Encode rows as UTF-8 CSV, header first, yielding about chunk_rows rows at a time
+
+    Only one chunk is held in memory, whatever the number of rows.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=headers)
+    writer.writeheader()
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode('utf-8')
+
+
+def jsonl_chunks(rows: Iterable[Dict[str, Any]], chunk_rows: int = 1000) -> Iterator[bytes]:
+    """Encode rows as UTF-8 JSON Lines, yielding about chunk_rows rows at a time"""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, ensure_ascii=False))
+        if len(lines) >= chunk_rows:
+            yield ('\n'.join(lines) + '\n').encode('utf-8')
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+def write_parquet(headers: List[str], rows: Iterable[Dict[str, Any]], destination,
+                  int_columns: Iterable[str] = (), compression: Optional[str] = None,
+                  chunk_rows: int = 65536) -> None:
+    """
+    Write rows to a Parquet file (requires pyarrow), one row group per chunk_rows
+
+    int_columns are typed int64; everything else is written as text, as
+    in the CSV. compression is a Parquet codec ('snappy' when None, or
+    'gzip', 'zstd', ...).
+    """
+    if pa is None:
+        raise ImportError('Parquet export requires pyarrow (pip install pyarrow)')
+    int_columns = set(int_columns)
+    schema = pa.schema([(header, pa.int64() if header in int_columns else pa.string()) for header in headers])
+
+    def batch(chunk):
+        return pa.Table.from_pydict({header: [row[header] for row in chunk] for header in headers}, schema=schema)
+
+    with pyarrow.parquet.ParquetWriter(destination, schema, compression=compression or 'snappy') as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                writer.write_table(batch(chunk))
+                chunk = []
+        writer.write_table(batch(chunk))
+
+
+def write_xlsx(headers: List[str], rows: Iterable[Dict[str, Any]], destination) -> None:
+    """Write rows to an Excel workbook (requires openpyxl) in write-only, streaming mode"""
+    if openpyxl is None:
+        raise ImportError('Excel export requires openpyxl (pip install openpyxl)')
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet('Applications')
+    sheet.append(headers)
+    for row in rows:
+        sheet.append([row[header] for header in headers])
+    workbook.save(destination)
+
+
+def compress_chunks(chunks: Iterable[bytes], compression: Optional[str]) -> Iterator[bytes]:
+    """
+    Compress a byte stream incrementally
+
+    Args:
+        chunks: Byte chunks to compress, in order
+        compression: None, 'gzip' or 'zstd' (zstd requires the zstandard package)
+    """
+    if compression is None:
+        yield from chunks
+        return
+    if compression == 'gzip':
+        compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ImportError('zstd compression requires zstandard (pip install zstandard)')
+        compressor = zstandard.ZstdCompressor().compressobj()
+    else:
+        raise ValueError(f"Unknown compression '{compression}' (expected 'gzip' or 'zstd')")
+
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def write_chunks(chunks: Iterable[bytes], destination) -> int:
+    """Write chunks to a path or a binary file-like object; returns the bytes written"""
+    written = 0
+    if hasattr(destination, 'write'):
+        for chunk in chunks:
+            destination.write(chunk)
+            written += len(chunk)
+        return written
+    with open(destination, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+            written += len(chunk)
+    return written
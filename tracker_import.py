@@ -0,0 +1,212 @@
+"""
+CSV Import for Job Application Tracker
+Reads uploaded CSVs in chunks, maps their columns and validates rows for bulk insert
+"""
+
+import csv
+import io
+import re
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from application_record import STATUS_WEIGHTS, parse_date, parse_datetime
+
+# Columns the tracker fills in itself; imported values are ignored
+GENERATED_COLUMNS = ('Application ID', 'Days Since Applied', 'Last Updated', 'Success Score')
+
+# Common spellings in other trackers' exports, by normalized name
+COLUMN_ALIASES = {
+    'company': 'Company Name',
+    'employer': 'Company Name',
+    'organization': 'Company Name',
+    'title': 'Job Title',
+    'position': 'Job Title',
+    'role': 'Job Title',
+    'dateapplied': 'Application Date',
+    'applieddate': 'Application Date',
+    'appliedon': 'Application Date',
+    'applied': 'Application Date',
+    'date': 'Application Date',
+    'stage': 'Status',
+    'contact': 'Contact Person',
+    'recruiter': 'Contact Person',
+    'email': 'Contact Email',
+    'salary': 'Salary Range',
+    'compensation': 'Salary Range',
+    'url': 'Job URL',
+    'link': 'Job URL',
+    'joblink': 'Job URL',
+    'interview': 'Interview Date',
+    'followup': 'Follow-up Date',
+    'followupon': 'Follow-up Date',
+    'note': 'Notes',
+    'comments': 'Notes',
+}
+
+STATUSES = {status.lower(): status for status in STATUS_WEIGHTS}
+
+
+def normalize_column(name: str) -> str:
+    """Lower-case a column name and drop everything but letters and digits"""
+    return re.sub(r'[^a-z0-9]', '', (name or '').lower())
+
+
+def map_columns(fieldnames: List[str], headers: List[str],
+                column_map: Optional[Dict[str, str]] = None) -> tuple:
+    """
+    Match a file's columns to tracker headers
+
+    Explicit column_map entries ({file column: tracker header}) win, then
+    case/punctuation-insensitive matches on the header names, then
+    COLUMN_ALIASES. Generated columns are never imported.
+
+    Returns:
+        ({file column: tracker header}, [unmapped file columns])
+    """
+    by_normalized = {normalize_column(header): header for header in headers}
+    mapping = {}
+    unmapped = []
+    taken = set()
+    for name in fieldnames:
+        if column_map and name in column_map:
+            target = column_map[name]
+            if target not in headers:
+                raise ValueError(f"column_map target '{target}' is not a tracker column")
+        else:
+            key = normalize_column(name)
+            target = by_normalized.get(key) or COLUMN_ALIASES.get(key)
+        if target is None or target in GENERATED_COLUMNS or target in taken:
+            unmapped.append(name)
+            continue
+        mapping[name] = target
+        taken.add(target)
+    return mapping, unmapped
+
+
+def open_text(source) -> io.TextIOBase:
+    """A text stream over a path, a text stream or a binary stream (e.g. a Streamlit upload)"""
+    if isinstance(source, str):
+        return open(source, newline='', encoding='utf-8-sig')
+    if isinstance(source, io.TextIOBase):
+        return source
+    return io.TextIOWrapper(source, encoding='utf-8-sig', newline='')
+
+
+def read_chunks(reader: Iterable[Dict[str, str]], chunk_rows: int) -> Iterator[List[Dict[str, str]]]:
+    """Group csv.DictReader rows into lists of at most chunk_rows"""
+    chunk = []
+    for row in reader:
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _check_column(values: List[str], check) -> Dict[str, Any]:
+    """check() each distinct value once; returns {value: normalized value or None if invalid}"""
+    return {value: check(value) for value in set(values)}
+
+
+def _check_date(value: str) -> Optional[str]:
+    parsed = parse_date(value.strip())
+    return parsed.isoformat() if parsed else None
+
+
+def _check_datetime(value: str) -> Optional[str]:
+    parsed = parse_datetime(value.strip())
+    return parsed.strftime('%Y-%m-%d %H:%M:%S') if parsed else None
+
+
+def _check_status(value: str) -> Optional[str]:
+    return STATUSES.get(value.strip().lower())
+
+
+def validate_chunk(rows: List[Dict[str, str]], mapping: Dict[str, str], first_row: int) -> tuple:
+    """
+    Map and validate a chunk of file rows column by column
+
+    Each date and status column is checked in one pass over its distinct
+    values, then rows are assembled from the results. Application Date
+    is required; Status defaults to Applied; dates are normalized to
+    YYYY-MM-DD (Interview Date to YYYY-MM-DD HH:MM:SS).
+
+    Args:
+        rows: csv.DictReader rows
+        mapping: {file column: tracker header} from map_columns()
+        first_row: 1-based data row number of rows[0], for error reports
+
+    Returns:
+        ([application dicts], [their data row numbers], [{'row', 'error'}])
+    """
+    columns = {header: [(row.get(name) or '').strip() for row in rows] for name, header in mapping.items()}
+    blank = [''] * len(rows)
+
+    applied = columns.get('Application Date', blank)
+    applied_ok = _check_column(applied, _check_date)
+    status = columns.get('Status', blank)
+    status_ok = _check_column([value for value in status if value], _check_status)
+    checks = {}
+    for header, check in (('Follow-up Date', _check_date), ('Interview Date', _check_datetime)):
+        if header in columns:
+            checks[header] = _check_column([value for value in columns[header] if value], check)
+
+    records = []
+    record_rows = []
+    errors = []
+    for index in range(len(rows)):
+        row_number = first_row + index
+        if not applied[index]:
+            errors.append({'row': row_number, 'error': 'Missing Application Date'})
+            continue
+        if applied_ok[applied[index]] is None:
+            errors.append({'row': row_number, 'error': f"Invalid Application Date '{applied[index]}'"})
+            continue
+        if status[index] and status_ok[status[index]] is None:
+            errors.append({'row': row_number, 'error': f"Unknown Status '{status[index]}'"})
+            continue
+
+        record = {header: values[index] for header, values in columns.items()}
+        record['Application Date'] = applied_ok[applied[index]]
+        record['Status'] = status_ok[status[index]] if status[index] else 'Applied'
+        invalid = None
+        for header, valid in checks.items():
+            value = record[header]
+            if value:
+                if valid[value] is None:
+                    invalid = f"Invalid {header} '{value}'"
+                    break
+                record[header] = valid[value]
+        if invalid:
+            errors.append({'row': row_number, 'error': invalid})
+            continue
+        records.append(record)
+        record_rows.append(row_number)
+    return records, record_rows, errors
+
+
+def iter_import(source, headers: List[str], column_map: Optional[Dict[str, str]] = None,
+                chunk_rows: int = 5000) -> Iterator[tuple]:
+    """
+    Stream an import file as validated chunks
+
+    Yields (mapping, unmapped columns, records, record row numbers,
+    errors) per chunk; only one chunk of rows is in memory at a time.
+    """
+    stream = open_text(source)
+    try:
+        reader = csv.DictReader(stream)
+        mapping, unmapped = map_columns(reader.fieldnames or [], headers, column_map)
+        if 'Application Date' not in mapping.values():
+            raise ValueError('The file has no Application Date column (map one with column_map)')
+        first_row = 1
+        for chunk in read_chunks(reader, chunk_rows):
+            records, record_rows, errors = validate_chunk(chunk, mapping, first_row)
+            first_row += len(chunk)
+            yield mapping, unmapped, records, record_rows, errors
+    finally:
+        if isinstance(source, str):
+            stream.close()
+        elif not isinstance(source, io.TextIOBase):
+            # Leave the caller's binary stream open
+            stream.detach()
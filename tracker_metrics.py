@@ -0,0 +1,369 @@
+"""
+Metrics for Job Application Tracker
+Opt-in call counts, latency percentiles and rows scanned, exported as Prometheus text or JSON
+"""
+
+import atexit
+import contextlib
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+# Latency percentiles are taken over this many most recent calls of each method or stage
+SAMPLE_WINDOW = 1024
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+_enabled = os.environ.get('JOB_TRACKER_METRICS', '').strip().lower() in TRUE_VALUES
+_lock = threading.Lock()
+_local = threading.local()
+_stats: Dict[str, '_Stat'] = {}
+_since = datetime.now()
+_classes: List[type] = []
+_originals: Dict[type, Dict[str, Any]] = {}
+_configured = False
+
+# Handed out by timed() while metrics are off
+_NOT_TIMED = contextlib.nullcontext()
+
+
+class _Stat:
+    __slots__ = ('calls', 'errors', 'seconds', 'max', 'rows', 'samples')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.samples = deque(maxlen=SAMPLE_WINDOW)
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+def _frames() -> List[int]:
+    """This thread's stack of rows counted by each active method or stage"""
+    frames = getattr(_local, 'frames', None)
+    if frames is None:
+        frames = _local.frames = []
+    return frames
+
+
+def _record(name: str, seconds: float, rows: int, failed: bool):
+    with _lock:
+        stat = _stats.get(name)
+        if stat is None:
+            stat = _stats[name] = _Stat()
+        stat.calls += 1
+        stat.errors += failed
+        stat.seconds += seconds
+        stat.max = max(stat.max, seconds)
+        stat.rows += rows
+        stat.samples.append(seconds)
+
+
+def _finish(name: str, start: float, failed: bool):
+    """Record a call that started at start; its rows also count towards the caller"""
+    elapsed = time.perf_counter() - start
+    frames = _frames()
+    rows = frames.pop()
+    if frames:
+        frames[-1] += rows
+    _record(name, elapsed, rows, failed)
+
+
+def count_rows(rows: int):
+    """Count rows scanned by the innermost instrumented call (no-op while metrics are off)"""
+    if _enabled:
+        frames = getattr(_local, 'frames', None)
+        if frames:
+            frames[-1] += rows
+
+
+class _Timer:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        _frames().append(0)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        _finish(self.name, self.start, exc_type is not None)
+        return False
+
+
+def timed(name: str):
+    """
+    Context manager timing a stage of work (e.g. 'storage.load') like a method
+
+    Returns a shared no-op context while metrics are off.
+    """
+    return _Timer(name) if _enabled else _NOT_TIMED
+
+
+def _wrap(name: str, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        _frames().append(0)
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = func(*args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _finish(name, start, failed)
+    return wrapper
+
+
+def _instrument(cls: type):
+    if cls in _originals:
+        return
+    originals = {}
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith('_'):
+            continue
+        name = f'{cls.__name__}.{attr}'
+        if isinstance(value, staticmethod):
+            wrapped = staticmethod(_wrap(name, value.__func__))
+        elif isinstance(value, classmethod):
+            wrapped = classmethod(_wrap(name, value.__func__))
+        elif inspect.isfunction(value):
+            wrapped = _wrap(name, value)
+        else:
+            continue
+        originals[attr] = value
+        setattr(cls, attr, wrapped)
+    _originals[cls] = originals
+
+
+def _restore(cls: type):
+    for attr, value in _originals.pop(cls, {}).items():
+        setattr(cls, attr, value)
+
+
+def instrumented(cls: type) -> type:
+    """
+    Class decorator: record every public method of cls while metrics are on
+
+    Methods are only wrapped while metrics are enabled, so disabled
+    metrics leave the class exactly as written.
+    """
+    with _lock:
+        _classes.append(cls)
+        if _enabled:
+            _instrument(cls)
+    return cls
+
+
+def enable():
+    """Start recording (instruments every registered class)"""
+    global _enabled
+    with _lock:
+        _enabled = True
+        for cls in _classes:
+            _instrument(cls)
+
+
+def disable():
+    """Stop recording and restore the original methods; recorded metrics are kept"""
+    global _enabled
+    with _lock:
+        _enabled = False
+        for cls in _classes:
+            _restore(cls)
+
+
+def reset():
+    """Forget everything recorded so far"""
+    global _since
+    with _lock:
+        _stats.clear()
+        _since = datetime.now()
+
+
+def _quantile(ordered: List[float], q: float) -> float:
+    """Nearest-rank quantile of sorted samples"""
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _summaries() -> Dict[str, Dict[str, Any]]:
+    """{name: (calls, errors, seconds, max, rows, sorted samples)}, slowest in total first"""
+    with _lock:
+        copied = {name: (stat.calls, stat.errors, stat.seconds, stat.max, stat.rows, sorted(stat.samples))
+                  for name, stat in _stats.items()}
+    return dict(sorted(copied.items(), key=lambda item: -item[1][2]))
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    Everything recorded, JSON-ready
+
+    Returns:
+        'enabled', 'since' and 'timers': {name: {'calls', 'errors',
+        'total_ms', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms',
+        'rows_scanned'}}, slowest in total first. Names are Class.method
+        for methods and dotted stage names for timed() blocks.
+    """
+    timers = {}
+    for name, (calls, errors, seconds, longest, rows, samples) in _summaries().items():
+        timers[name] = {
+            'calls': calls,
+            'errors': errors,
+            'total_ms': round(seconds * 1000, 3),
+            'mean_ms': round(seconds / calls * 1000, 3),
+            **{f'p{int(q * 100)}_ms': round(_quantile(samples, q) * 1000, 3) for q in QUANTILES},
+            'max_ms': round(longest * 1000, 3),
+            'rows_scanned': rows
+        }
+    return {'enabled': _enabled, 'since': _since.isoformat(timespec='seconds'), 'timers': timers}
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text() -> str:
+    """Everything recorded, in the Prometheus text exposition format"""
+    summaries = [(_label(name), summary) for name, summary in _summaries().items()]
+    lines = [
+        '# HELP job_tracker_calls_total Calls of instrumented methods and stages.',
+        '# TYPE job_tracker_calls_total counter'
+    ]
+    lines += [f'job_tracker_calls_total{{name="{name}"}} {s[0]}' for name, s in summaries]
+    lines += [
+        '# HELP job_tracker_errors_total Calls that raised an exception.',
+        '# TYPE job_tracker_errors_total counter'
+    ]
+    lines += [f'job_tracker_errors_total{{name="{name}"}} {s[1]}' for name, s in summaries]
+    lines += [
+        f'# HELP job_tracker_latency_seconds Latency, quantiles over the last {SAMPLE_WINDOW} calls.',
+        '# TYPE job_tracker_latency_seconds summary'
+    ]
+    for name, (calls, _, seconds, _, _, samples) in summaries:
+        for q in QUANTILES:
+            lines.append(f'job_tracker_latency_seconds{{name="{name}",quantile="{q}"}} {_quantile(samples, q):.6f}')
+        lines.append(f'job_tracker_latency_seconds_sum{{name="{name}"}} {seconds:.6f}')
+        lines.append(f'job_tracker_latency_seconds_count{{name="{name}"}} {calls}')
+    lines += [
+        '# HELP job_tracker_rows_scanned_total Application rows read or scanned, including nested calls.',
+        '# TYPE job_tracker_rows_scanned_total counter'
+    ]
+    lines += [f'job_tracker_rows_scanned_total{{name="{name}"}} {s[4]}' for name, s in summaries]
+    return '\n'.join(lines) + '\n'
+
+
+def write(path: str, format: Optional[str] = None) -> str:
+    """
+    Write the metrics to a file atomically
+
+    Args:
+        path: Destination
+        format: 'json' or 'prometheus'; by default JSON for .json paths,
+            Prometheus text otherwise
+
+    Returns:
+        path
+    """
+    if format is None:
+        format = 'json' if path.lower().endswith('.json') else 'prometheus'
+    if format == 'json':
+        text = json.dumps(snapshot(), indent=2)
+    elif format == 'prometheus':
+        text = prometheus_text()
+    else:
+        raise ValueError(f"Unknown metrics format '{format}' (expected 'json' or 'prometheus')")
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return path
+
+
+def serve(port: int = 9464, host: str = '127.0.0.1'):
+    """
+    Serve /metrics (Prometheus text) and /metrics.json from a background thread
+
+    Binds to localhost by default. Returns the running HTTP server
+    (call shutdown() to stop it).
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == '/metrics':
+                body, content_type = prometheus_text(), PROMETHEUS_CONTENT_TYPE
+            elif path == '/metrics.json':
+                body, content_type = json.dumps(snapshot()), 'application/json'
+            else:
+                self.send_error(404)
+                return
+            data = body.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='tracker-metrics', daemon=True).start()
+    return server
+
+
+def _write_periodically(path: str, interval: float):
+    while True:
+        time.sleep(interval)
+        try:
+            write(path)
+        except OSError:
+            pass
+
+
+def configure_from_env():
+    """
+    Set up metrics from the environment (once per process)
+
+    JOB_TRACKER_METRICS=1 turns recording on. JOB_TRACKER_METRICS_PORT
+    serves them on JOB_TRACKER_METRICS_HOST (127.0.0.1 by default), and
+    JOB_TRACKER_METRICS_FILE writes them every
+    JOB_TRACKER_METRICS_INTERVAL seconds (60 by default) and at exit.
+    """
+    global _configured
+    with _lock:
+        if _configured:
+            return
+        _configured = True
+    if os.environ.get('JOB_TRACKER_METRICS', '').strip().lower() not in TRUE_VALUES:
+        return
+    enable()
+    port = os.environ.get('JOB_TRACKER_METRICS_PORT')
+    if port:
+        serve(int(port), os.environ.get('JOB_TRACKER_METRICS_HOST', '127.0.0.1'))
+    path = os.environ.get('JOB_TRACKER_METRICS_FILE')
+    if path:
+        interval = float(os.environ.get('JOB_TRACKER_METRICS_INTERVAL', 60))
+        threading.Thread(target=_write_periodically, args=(path, interval),
+                         name='tracker-metrics-file', daemon=True).start()
+        atexit.register(write, path)
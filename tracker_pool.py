@@ -0,0 +1,228 @@
+"""
+Tracker Pool for Job Application Tracker
+Per-user trackers in separate data directories, with a bounded LRU of open instances
+"""
+
+import functools
+import hashlib
+import os
+import threading
+import types
+from collections import OrderedDict
+from typing import Dict, Any
+
+# Attribute values a SharedTracker hands out as they are
+IMMUTABLE_TYPES = (str, bytes, int, float, bool, tuple, frozenset, type(None))
+
+from job_tracker_manager import JobTrackerManager
+
+DATA_FILE = 'job_applications.csv'
+
+
+def user_data_dir(root: str, user_id: str) -> str:
+    """
+    Directory holding one user's data
+
+    Named by a hash of the user ID, so any ID is path-safe and users can't
+    address each other's files, and spread over 256 subdirectories so no
+    single directory grows with the number of users.
+    """
+    digest = hashlib.sha256(user_id.encode('utf-8')).hexdigest()[:32]
+    return os.path.join(root, digest[:2], digest)
+
+
+def _guarded(value: Any, lock: threading.RLock) -> Any:
+    """
+    value as it may be handed to a session: used only under lock
+
+    Immutable values pass through and lists, dicts and sets are copied.
+    Methods and other objects (the archive, the store) are wrapped so that
+    every call, len() or iteration holds the lock, and generators a method
+    returns hold it for each item they produce.
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return value
+    if isinstance(value, (list, dict, set)):
+        with lock:
+            return value.copy()
+    if isinstance(value, types.GeneratorType):
+        return _LockedIterator(value, lock)
+    if callable(value):
+        @functools.wraps(value)
+        def locked(*args, **kwargs):
+            with lock:
+                result = value(*args, **kwargs)
+            return _LockedIterator(result, lock) if isinstance(result, types.GeneratorType) else result
+        return locked
+    return _LockedObject(value, lock)
+
+
+class _LockedIterator:
+    """A generator advanced only under a lock"""
+
+    def __init__(self, iterator, lock: threading.RLock):
+        self._iterator = iterator
+        self._lock = lock
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            return next(self._iterator)
+
+
+class _LockedObject:
+    """An object whose attributes, len(), iteration and item access hold a lock"""
+
+    def __init__(self, target: Any, lock: threading.RLock):
+        self._target = target
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        return _guarded(getattr(self._target, name), self._lock)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._target)
+
+    def __iter__(self):
+        # Taken whole, so writes can't change the object mid-iteration
+        with self._lock:
+            return iter(list(self._target))
+
+    def __contains__(self, item: Any) -> bool:
+        with self._lock:
+            return item in self._target
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            return self._target[key]
+
+
+class SharedTracker(_LockedObject):
+    """
+    A pooled JobTrackerManager that serializes calls from concurrent sessions
+
+    The manager and its store are not thread-safe, and every session of a
+    user gets the same instance, so everything reached through it holds
+    the tracker's re-entrant lock (see _guarded): method calls, attributes
+    such as archive, and the generators iter_export() returns, item by
+    item. Other method results are returned as they are, so a caller
+    working on the manager itself (shared.tracker) or on the store
+    get_store() returns must hold shared.lock.
+    """
+
+    def __init__(self, tracker: JobTrackerManager):
+        super().__init__(tracker, threading.RLock())
+
+    @property
+    def tracker(self) -> JobTrackerManager:
+        return self._target
+
+    @property
+    def lock(self) -> threading.RLock:
+        return self._lock
+
+
+class TrackerPool:
+    """
+    Hands out one JobTrackerManager per user, each on its own data files
+
+    At most capacity trackers are kept open; the least recently used one is
+    closed when another user needs a slot. Each tracker loads only its own
+    user's applications, so a request costs in proportion to that user's
+    data whatever the number of users. A user's directory and files are
+    created by their first write. Safe to share between threads
+    (e.g. Streamlit sessions): trackers are handed out as SharedTracker,
+    so one user's concurrent sessions take turns.
+    """
+
+    def __init__(self, root: str = 'user_data', capacity: int = 128, storage: str = None):
+        """
+        Args:
+            root: Directory under which every user's data directory is created
+            capacity: Maximum number of open trackers
+            storage: Backend name passed to each JobTrackerManager (None
+                follows JOB_TRACKER_STORAGE)
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        self.root = root
+        self.capacity = capacity
+        self.storage = storage
+        self._trackers: 'OrderedDict[str, SharedTracker]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+    def __len__(self) -> int:
+        return len(self._trackers)
+
+    def __contains__(self, user_id: str) -> bool:
+        return user_id in self._trackers
+
+    def data_file(self, user_id: str) -> str:
+        """Path of a user's data file (other backends store next to it)"""
+        return os.path.join(user_data_dir(self.root, user_id), DATA_FILE)
+
+    def get(self, user_id: str) -> SharedTracker:
+        """The user's tracker, opening it (and evicting the least recently used) if needed"""
+        if not user_id:
+            raise ValueError('user_id is required')
+        with self._lock:
+            tracker = self._trackers.get(user_id)
+            if tracker is not None:
+                self._trackers.move_to_end(user_id)
+                self.stats['hits'] += 1
+                return tracker
+
+            self.stats['misses'] += 1
+            # A visitor who never adds anything leaves no files behind
+            tracker = SharedTracker(JobTrackerManager(self.data_file(user_id), storage=self.storage, create=False))
+            self._trackers[user_id] = tracker
+            evicted = []
+            while len(self._trackers) > self.capacity:
+                evicted.append(self._trackers.popitem(last=False)[1])
+                self.stats['evictions'] += 1
+        # Closed outside the pool lock: closing waits for the tracker's own calls
+        for shared in evicted:
+            self._close(shared)
+        return tracker
+
+    def evict(self, user_id: str) -> bool:
+        """Close a user's tracker if it is open; returns whether it was"""
+        with self._lock:
+            tracker = self._trackers.pop(user_id, None)
+        if tracker is None:
+            return False
+        self._close(tracker)
+        return True
+
+    def clear(self):
+        """Close every open tracker"""
+        with self._lock:
+            trackers, self._trackers = list(self._trackers.values()), OrderedDict()
+        for tracker in trackers:
+            self._close(tracker)
+
+    @staticmethod
+    def _close(shared: SharedTracker):
+        # Waits for a call in progress; backends holding connections (SQLite)
+        # reopen them if a session still uses the tracker afterwards
+        with shared.lock:
+            tracker = shared.tracker
+            close = getattr(tracker.storage, 'close', None)
+            if close is not None:
+                close()
+            tracker.store = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool size and hit/miss/eviction counts"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                'open_trackers': len(self._trackers),
+                'capacity': self.capacity,
+                **self.stats,
+                'hit_rate': round(self.stats['hits'] / lookups * 100, 1) if lookups else 0.0
+            }
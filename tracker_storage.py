@@ -0,0 +1,662 @@
+"""
+Storage Backends for Job Application Tracker
+Persists application rows to CSV or SQLite behind a common interface
+"""
+
+import csv
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterable, Callable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class StorageLockTimeout(TimeoutError):
+    """Raised when a storage lock can't be acquired within the timeout"""
+
+
+@contextmanager
+def locked_file(path: str, shared: bool = False, timeout: float = 30.0):
+    """
+    Hold an advisory lock on path for the duration of the block
+
+    Args:
+        path: Lock file (created if missing)
+        shared: Take a shared (reader) lock instead of an exclusive one
+        timeout: Seconds to keep retrying before raising StorageLockTimeout
+
+    Yields the open file (binary, read/write) so callers can keep small
+    state such as a sequence number inside it.
+    """
+    f = open(path, 'a+b')
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    try:
+        while True:
+            try:
+                if fcntl is not None:
+                    mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+                    fcntl.flock(f.fileno(), mode | fcntl.LOCK_NB)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise StorageLockTimeout(f'Timed out waiting for lock on {path}')
+                # Back off so waiting writers don't spin against the holder
+                time.sleep(delay)
+                delay = min(delay * 2, 0.05)
+        try:
+            yield f
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        f.close()
+
+
+def file_signature(*paths: str) -> tuple:
+    """(mtime_ns, size, inode) for each path, None for missing files"""
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            signature.append(None)
+        else:
+            signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+    return tuple(signature)
+
+
+class GroupCommit:
+    """
+    Batches concurrent writes to one data file into a single commit
+
+    Each writer queues its item and then competes for the commit slot.
+    Whoever wins takes everything queued so far, applies it in one call
+    (one lock acquisition, one fsync) and wakes the writers it served, who
+    return without touching the file. Under contention, commits get bigger
+    rather than more frequent.
+    """
+
+    # Weak, so committers for paths no storage uses any more (e.g. pooled
+    # per-user trackers that were evicted) are freed
+    _registry = weakref.WeakValueDictionary()
+    _registry_lock = threading.Lock()
+
+    def __init__(self):
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._commit_lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, path: str) -> 'GroupCommit':
+        """Shared committer for every storage instance in this process writing to path"""
+        key = os.path.abspath(path)
+        with cls._registry_lock:
+            committer = cls._registry.get(key)
+            if committer is None:
+                committer = cls()
+                cls._registry[key] = committer
+            return committer
+
+    def submit(self, item: Any, apply_batch: Callable[[List[Any]], Any]) -> tuple:
+        """
+        Queue item and return once a commit containing it has completed
+
+        Returns:
+            (whatever apply_batch returned, number of items in the batch)
+        """
+        ticket = {'item': item, 'done': False, 'error': None, 'result': None, 'batch_size': 0}
+        with self._pending_lock:
+            self._pending.append(ticket)
+
+        with self._commit_lock:
+            if not ticket['done']:
+                with self._pending_lock:
+                    batch, self._pending = self._pending, []
+                result, error = None, None
+                try:
+                    result = apply_batch([t['item'] for t in batch])
+                except Exception as e:
+                    error = e
+                for t in batch:
+                    t.update(done=True, error=error, result=result, batch_size=len(batch))
+
+        if ticket['error'] is not None:
+            raise ticket['error']
+        return ticket['result'], ticket['batch_size']
+
+    @staticmethod
+    def transition(result: tuple, batch_size: int):
+        """A commit's (before, after) signatures, or None if other writers shared it"""
+        return result if batch_size == 1 else None
+
+
+class JournaledFileStorage:
+    """
+    Shared machinery for backends that keep a base data file plus a journal
+
+    Subclasses provide _read_base(), _read_base_since(offset),
+    _write_base(rows) and _append_base(rows).
+
+    Updates are appended as JSON deltas to a journal next to the data file
+    (e.g. job_applications.csv.journal) and replayed over it on load, so
+    changing one field costs one small append. compact() folds the journal
+    back into the data file; it also runs automatically once the journal is
+    larger than both compact_threshold_bytes and the data file itself.
+
+    Application ID numbers come from a sequence file (<data file>.seq)
+    advanced under a file lock, so concurrent processes never hand out the
+    same ID.
+
+    Writes from every process go through an advisory lock on
+    <data file>.lock, and concurrent writers within a process are
+    group-committed. Readers take the lock shared, so they never see a
+    compaction half done.
+
+    fingerprint() changes whenever the data file or journal does. append()
+    and update() return the (before, after) fingerprints of a commit that
+    held only the caller's write, so a cache can follow its own writes
+    without reloading; they return None when the commit included other
+    writers. Since the data file only grows by appends and the journal by
+    appended lines until a rewrite, changes_since() can hand a cache just
+    what other writers added after a fingerprint.
+    """
+
+    name = None
+
+    def __init__(self, path: str, headers: List[str], compact_threshold_bytes: int = 256 * 1024,
+                 lock_timeout: float = 30.0):
+        self.path = path
+        self.headers = headers
+        self.journal_path = path + '.journal'
+        self.seq_path = path + '.seq'
+        self.lock_path = path + '.lock'
+        self.compact_threshold_bytes = compact_threshold_bytes
+        self.lock_timeout = lock_timeout
+        self.committer = GroupCommit.for_path(path)
+
+    def _lock(self, shared: bool = False):
+        return locked_file(self.lock_path, shared=shared, timeout=self.lock_timeout)
+
+    def fingerprint(self) -> tuple:
+        return file_signature(self.path, self.journal_path)
+
+    def initialize(self):
+        """Create the data file if it doesn't exist"""
+        if not os.path.exists(self.path):
+            with self._lock():
+                if not os.path.exists(self.path):
+                    self._write_base([])
+
+    def load(self) -> List[Dict[str, str]]:
+        """Read every row with journaled changes applied"""
+        with self._lock(shared=True):
+            return self._load_locked()
+
+    def _load_locked(self) -> List[Dict[str, str]]:
+        if not os.path.exists(self.path):
+            return []
+        rows = self._read_base()
+
+        if os.path.exists(self.journal_path):
+            key = self.headers[0]
+            by_id = {row[key]: row for row in rows}
+            for delta in self._read_journal():
+                row = by_id.get(delta.get(key))
+                if row is not None:
+                    row.update((k, v) for k, v in delta.items() if k in row)
+        return rows
+
+    def changes_since(self, fingerprint: tuple) -> Optional[tuple]:
+        """
+        What was written after fingerprint, read from where it left off
+
+        Returns:
+            (appended rows, journaled deltas in order, current fingerprint),
+            or None if the files were rewritten since (compaction, removal)
+            and only load() gives the current rows
+        """
+        with self._lock(shared=True):
+            current = self.fingerprint()
+            (base, journal), (new_base, new_journal) = fingerprint, current
+            # Rewrites replace the data file, so its inode changes
+            if base is None or new_base is None or new_base[2] != base[2] or new_base[1] < base[1]:
+                return None
+            journal_offset = 0
+            if journal is not None:
+                if new_journal is None or new_journal[2] != journal[2] or new_journal[1] < journal[1]:
+                    return None
+                journal_offset = journal[1]
+            rows = self._read_base_since(base[1]) if new_base[1] > base[1] else []
+            deltas = list(self._read_journal(journal_offset)) if new_journal is not None else []
+        return rows, deltas, current
+
+    def _read_journal(self, offset: int = 0):
+        with open(self.journal_path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A torn line from an interrupted append; the update it
+                    # carried never completed
+                    continue
+
+    @staticmethod
+    def _journal_line(change: Dict[str, Any]) -> str:
+        return json.dumps({k: str(v) for k, v in change.items()}, ensure_ascii=False) + '\n'
+
+    def append(self, rows: Iterable[Dict[str, Any]]):
+        """Append new rows"""
+        rows = list(rows)
+        if rows:
+            return GroupCommit.transition(*self.committer.submit(('append', rows), self._commit))
+
+    def update(self, changes: Iterable[Dict[str, Any]]):
+        """Journal field deltas; each carries its Application ID plus changed fields"""
+        lines = [self._journal_line(change) for change in changes]
+        if lines:
+            return GroupCommit.transition(*self.committer.submit(('update', lines), self._commit))
+
+    def _commit(self, batch: List[tuple]) -> tuple:
+        """Write a group of queued appends and journal lines under the file lock"""
+        rows = [row for kind, items in batch if kind == 'append' for row in items]
+        lines = [line for kind, items in batch if kind == 'update' for line in items]
+
+        with self._lock():
+            before = self.fingerprint()
+            if rows:
+                self._append_base(rows)
+
+            if lines:
+                with open(self.journal_path, 'a+b') as f:
+                    # Start on a fresh line if a previous append was cut short
+                    if f.tell() > 0:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b'\n':
+                            lines.insert(0, '\n')
+                    f.write(''.join(lines).encode('utf-8'))
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                journal_size = os.path.getsize(self.journal_path)
+                if journal_size >= max(self.compact_threshold_bytes, os.path.getsize(self.path)):
+                    self._save_locked(self._load_locked())
+
+            return before, self.fingerprint()
+
+    def allocate_ids(self, count: int = 1, floor: int = 0) -> int:
+        """
+        Reserve count consecutive ID numbers
+
+        Args:
+            count: How many IDs to reserve
+            floor: Highest ID number the caller already knows is taken
+
+        Returns:
+            The first reserved number
+        """
+        with locked_file(self.seq_path, timeout=self.lock_timeout) as f:
+            f.seek(0)
+            text = f.read().strip()
+            last = int(text) if text.isdigit() else 0
+            first = max(last, floor) + 1
+            f.seek(0)
+            f.truncate()
+            f.write(str(first + count - 1).encode('ascii'))
+            f.flush()
+            os.fsync(f.fileno())
+        return first
+
+    def reserve_ids(self, count: int = 1, floor: int = 0) -> tuple:
+        """allocate_ids(), as (first number, None): the sequence lives outside the data files"""
+        return self.allocate_ids(count, floor), None
+
+    def remove(self, app_ids: Iterable[str]):
+        """Delete rows by Application ID, rewriting the data file without them"""
+        app_ids = set(app_ids)
+        if not app_ids:
+            return None
+        key = self.headers[0]
+        with self._lock():
+            before = self.fingerprint()
+            self._save_locked([row for row in self._load_locked() if row[key] not in app_ids])
+            return before, self.fingerprint()
+
+    def compact(self):
+        """Fold the journal into the data file and remove it"""
+        with self._lock():
+            if os.path.exists(self.journal_path):
+                self._save_locked(self._load_locked())
+
+    def save(self, rows: Iterable[Dict[str, Any]]):
+        """Atomically replace the file contents with rows and drop the journal"""
+        with self._lock():
+            self._save_locked(rows)
+
+    def _save_locked(self, rows: Iterable[Dict[str, Any]]):
+        self._write_base(rows)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def _read_base(self) -> List[Dict[str, str]]:
+        raise NotImplementedError
+
+    def _read_base_since(self, offset: int) -> List[Dict[str, str]]:
+        """Rows appended to the data file after its first offset bytes"""
+        raise NotImplementedError
+
+    def _write_base(self, rows: Iterable[Dict[str, Any]]):
+        """Atomically replace the data file with rows"""
+        raise NotImplementedError
+
+    def _append_base(self, rows: List[Dict[str, Any]]):
+        raise NotImplementedError
+
+
+class CSVStorage(JournaledFileStorage):
+    """Stores applications in a CSV file (the original format)"""
+
+    name = 'csv'
+
+    def _read_base(self) -> List[Dict[str, str]]:
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            return list(csv.DictReader(f))
+
+    def _read_base_since(self, offset: int) -> List[Dict[str, str]]:
+        with open(self.path, 'rb') as f:
+            header = next(csv.reader([f.readline().decode('utf-8')]), self.headers)
+            f.seek(max(offset, f.tell()))
+            text = f.read().decode('utf-8')
+        return list(csv.DictReader(io.StringIO(text, newline=''), fieldnames=header))
+
+    def _append_base(self, rows: List[Dict[str, Any]]):
+        with open(self.path, 'a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.headers)
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_base(self, rows: Iterable[Dict[str, Any]]):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.headers)
+            writer.writeheader()
+            writer.writerows(rows)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class SQLiteStorage:
+    """
+    Stores applications in an SQLite database
+
+    The table keeps the tracker's column names verbatim so rows round-trip
+    to and from CSV unchanged. Application ID is the primary key, and
+    Status, Follow-up Date and Interview Date carry secondary indexes.
+    Every write runs in a single transaction, and ID numbers come from a
+    sequence table advanced inside an immediate transaction. The seed CSV
+    is imported once, and a meta table records that it was, so a table
+    later emptied (e.g. by archiving) stays empty across restarts.
+
+    SQLite serializes writers across processes itself (waiting up to
+    lock_timeout); concurrent writers within a process are group-committed
+    into one transaction. Every write also advances a revision number in
+    the meta table, and fingerprint() is the database's (instance,
+    revision): PRAGMA data_version tells when another connection has
+    committed, so the revision is only re-read then. The return values of
+    append() and update() follow the CSV backend.
+    """
+
+    name = 'sqlite'
+    table = 'applications'
+    indexed_columns = ['Status', 'Follow-up Date', 'Interview Date']
+    bump_revision = "UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE name = 'revision'"
+
+    def __init__(self, path: str, headers: List[str], seed_csv: str = None, lock_timeout: float = 30.0):
+        self.path = path
+        self.headers = headers
+        self.seed_csv = seed_csv
+        self.lock_timeout = lock_timeout
+        self.committer = GroupCommit.for_path(path)
+        self._conn = None
+        self._conn_lock = threading.RLock()
+        self._revision = None  # ((data_version, total_changes), fingerprint) last read
+
+    @staticmethod
+    def _quote(column: str) -> str:
+        return '"' + column.replace('"', '""') + '"'
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=self.lock_timeout, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+        return self._conn
+
+    def fingerprint(self) -> tuple:
+        with self._conn_lock:
+            conn = self.conn
+            # data_version moves on other connections' commits, total_changes on this one's
+            seen = (conn.execute('PRAGMA data_version').fetchone()[0], conn.total_changes)
+            if self._revision is None or self._revision[0] != seen:
+                meta = dict(conn.execute("SELECT name, value FROM meta WHERE name IN ('instance', 'revision')"))
+                self._revision = (seen, (meta.get('instance'), int(meta.get('revision', 0))))
+            return self._revision[1]
+
+    def changes_since(self, fingerprint: tuple) -> Optional[tuple]:
+        """The database keeps no change log, so a cache always reloads"""
+        return None
+
+    def close(self):
+        with self._conn_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._revision = None
+
+    def initialize(self):
+        """Create the table and indexes, importing seed_csv into a new database"""
+        columns = ', '.join(
+            f'{self._quote(h)} TEXT PRIMARY KEY' if h == self.headers[0] else f'{self._quote(h)} TEXT'
+            for h in self.headers
+        )
+        with self._conn_lock, self.conn:
+            self.conn.execute(f'CREATE TABLE IF NOT EXISTS {self.table} ({columns})')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS id_sequence (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)')
+            for column in self.indexed_columns:
+                index_name = 'idx_{}_{}'.format(self.table, column.lower().replace(' ', '_').replace('-', '_'))
+                self.conn.execute(f'CREATE INDEX IF NOT EXISTS {index_name} ON {self.table} ({self._quote(column)})')
+
+        with self._conn_lock:
+            conn = self.conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                if conn.execute("SELECT 1 FROM meta WHERE name = 'seeded'").fetchone() is None:
+                    if self.seed_csv and os.path.exists(self.seed_csv) and self.count() == 0:
+                        placeholders = ', '.join('?' for _ in self.headers)
+                        conn.executemany(
+                            f'INSERT OR REPLACE INTO {self.table} VALUES ({placeholders})',
+                            (self._values(row) for row in CSVStorage(self.seed_csv, self.headers).load())
+                        )
+                    conn.execute("INSERT INTO meta (name, value) VALUES ('seeded', ?)", (self.seed_csv or '',))
+                conn.execute("INSERT OR IGNORE INTO meta (name, value) VALUES ('instance', ?), ('revision', '0')",
+                             (uuid.uuid4().hex,))
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+
+    def count(self) -> int:
+        with self._conn_lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def load(self) -> List[Dict[str, str]]:
+        """Read every row in insertion order"""
+        with self._conn_lock:
+            cursor = self.conn.execute(
+                'SELECT {} FROM {} ORDER BY rowid'.format(', '.join(self._quote(h) for h in self.headers), self.table)
+            )
+            return [dict(zip(self.headers, ('' if v is None else v for v in row))) for row in cursor]
+
+    def allocate_ids(self, count: int = 1, floor: int = 0) -> int:
+        """Reserve count consecutive ID numbers and return the first"""
+        return self.reserve_ids(count, floor)[0]
+
+    def reserve_ids(self, count: int = 1, floor: int = 0) -> tuple:
+        """
+        allocate_ids(), as (first number, (before, after) fingerprints)
+
+        Reserving IDs leaves the revision alone, so the fingerprints only
+        differ if another connection wrote in the meantime.
+        """
+        with self._conn_lock:
+            conn = self.conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                before = self.fingerprint()
+                found = conn.execute("SELECT value FROM id_sequence WHERE name = 'application'").fetchone()
+                first = max(found[0] if found else 0, floor) + 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO id_sequence (name, value) VALUES ('application', ?)",
+                    (first + count - 1,)
+                )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return first, (before, self.fingerprint())
+
+    def _values(self, row: Dict[str, Any]) -> tuple:
+        return tuple(str(row.get(h, '')) for h in self.headers)
+
+    def append(self, rows: Iterable[Dict[str, Any]]):
+        """Insert new rows"""
+        rows = list(rows)
+        if rows:
+            return GroupCommit.transition(*self.committer.submit(('append', rows), self._commit))
+
+    def update(self, changes: Iterable[Dict[str, Any]]):
+        """Apply field deltas by primary key"""
+        changes = list(changes)
+        if changes:
+            return GroupCommit.transition(*self.committer.submit(('update', changes), self._commit))
+
+    def _commit(self, batch: List[tuple]) -> tuple:
+        """Apply a group of queued inserts and updates in one transaction"""
+        key = self.headers[0]
+        placeholders = ', '.join('?' for _ in self.headers)
+        with self._conn_lock:
+            conn = self.conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                before = self.fingerprint()
+                for kind, items in batch:
+                    if kind == 'append':
+                        conn.executemany(
+                            f'INSERT INTO {self.table} VALUES ({placeholders})',
+                            (self._values(row) for row in items)
+                        )
+                        continue
+                    for change in items:
+                        columns = [h for h in self.headers[1:] if h in change]
+                        if not columns:
+                            continue
+                        assignments = ', '.join(f'{self._quote(h)} = ?' for h in columns)
+                        conn.execute(
+                            f'UPDATE {self.table} SET {assignments} WHERE {self._quote(key)} = ?',
+                            [str(change[h]) for h in columns] + [str(change[key])]
+                        )
+                conn.execute(self.bump_revision)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return before, self.fingerprint()
+
+    def remove(self, app_ids: Iterable[str]):
+        """Delete rows by Application ID in one transaction"""
+        key = self.headers[0]
+        with self._conn_lock:
+            conn = self.conn
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                before = self.fingerprint()
+                conn.executemany(
+                    f'DELETE FROM {self.table} WHERE {self._quote(key)} = ?',
+                    ((app_id,) for app_id in app_ids)
+                )
+                conn.execute(self.bump_revision)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+            return before, self.fingerprint()
+
+    def compact(self):
+        """Reclaim space left by updates"""
+        with self._conn_lock:
+            self.conn.execute('VACUUM')
+
+    def save(self, rows: Iterable[Dict[str, Any]]):
+        """Replace the table contents with rows"""
+        placeholders = ', '.join('?' for _ in self.headers)
+        with self._conn_lock, self.conn:
+            self.conn.execute(f'DELETE FROM {self.table}')
+            self.conn.executemany(
+                f'INSERT INTO {self.table} VALUES ({placeholders})',
+                (self._values(row) for row in rows)
+            )
+            self.conn.execute(self.bump_revision)
+
+    def import_csv(self, csv_path: str):
+        """Load rows from a tracker CSV (and its journal), replacing rows with the same Application ID"""
+        placeholders = ', '.join('?' for _ in self.headers)
+        rows = CSVStorage(csv_path, self.headers).load()
+        with self._conn_lock, self.conn:
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO {self.table} VALUES ({placeholders})',
+                (self._values(row) for row in rows)
+            )
+            self.conn.execute(self.bump_revision)
+
+
+def create_storage(backend: str, csv_file: str, headers: List[str]):
+    """
+    Build a storage backend for a tracker
+
+    Args:
+        backend: 'csv' or 'sqlite'
+        csv_file: The tracker's CSV path; SQLite stores next to it (.db)
+            and imports it on first use
+        headers: Column names
+
+    Returns:
+        Storage backend instance
+    """
+    if backend == 'csv':
+        return CSVStorage(csv_file, headers)
+    if backend == 'sqlite':
+        db_file = os.path.splitext(csv_file)[0] + '.db'
+        return SQLiteStorage(db_file, headers, seed_csv=csv_file)
+    raise ValueError(f'Unknown storage backend: {backend}')
@@ -0,0 +1,113 @@
+"""
+Trigram Index for Job Application Tracker
+Fuzzy matching of company names and job titles by shared character trigrams
+"""
+
+import heapq
+import re
+from typing import Dict, List, Optional, Set
+
+# Legal-form words that don't tell companies apart ("Google" vs "Google LLC")
+COMPANY_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company',
+    'plc', 'gmbh', 'ag', 'sa', 'bv', 'lp', 'llp'
+}
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+def normalize_name(value: str, strip_suffixes: bool = False) -> str:
+    """Lower-case, punctuation-free form of a name, optionally without a trailing legal form"""
+    words = _NON_WORD.sub(' ', (value or '').casefold()).split()
+    if strip_suffixes:
+        while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+            words.pop()
+    return ' '.join(words)
+
+
+def trigrams(normalized: str) -> Set[str]:
+    """Character trigrams of a normalized name, padded so short names and word starts count"""
+    if not normalized:
+        return set()
+    padded = f'  {normalized} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: str, b: str) -> float:
+    """Dice coefficient of two names' trigrams, from 0.0 to 1.0"""
+    grams_a = trigrams(normalize_name(a))
+    grams_b = trigrams(normalize_name(b))
+    if not grams_a or not grams_b:
+        return 0.0
+    return 2 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+
+class TrigramIndex:
+    """
+    Inverted index from trigram to the distinct names containing it
+
+    A lookup only visits names sharing at least one trigram with the query,
+    instead of comparing against every name.
+    """
+
+    def __init__(self, strip_suffixes: bool = False):
+        self.strip_suffixes = strip_suffixes
+        self.postings: Dict[str, Dict[str, None]] = {}
+        self.sizes: Dict[str, int] = {}  # name -> number of trigrams
+
+    def __len__(self) -> int:
+        return len(self.sizes)
+
+    def _grams(self, value: str) -> Set[str]:
+        return trigrams(normalize_name(value, self.strip_suffixes))
+
+    def add(self, value: str):
+        if value in self.sizes:
+            return
+        grams = self._grams(value)
+        self.sizes[value] = len(grams)
+        for gram in grams:
+            names = self.postings.get(gram)
+            if names is None:
+                self.postings[gram] = {value: None}
+            else:
+                names[value] = None
+
+    def remove(self, value: str):
+        if self.sizes.pop(value, None) is None:
+            return
+        for gram in self._grams(value):
+            names = self.postings.get(gram)
+            if names is not None:
+                names.pop(value, None)
+                if not names:
+                    del self.postings[gram]
+
+    def similar(self, query: str, limit: int = 10, min_score: float = 0.0,
+                order: Optional[Dict[str, int]] = None) -> List[tuple]:
+        """
+        Indexed names most similar to query
+
+        Args:
+            order: Rank of every indexed name among equal scores, lowest
+                first (e.g. the store position where it first appears);
+                without it, equal scores are in name order
+
+        Returns:
+            [(Dice similarity, name)], best first
+        """
+        grams = self._grams(query)
+        if not grams:
+            return []
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for name in self.postings.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+        size = len(grams)
+        scored = []
+        # Candidates come in set order, which varies between runs, so ties are broken explicitly
+        for name, count in shared.items():
+            score = 2 * count / (size + self.sizes[name])
+            if score >= min_score:
+                scored.append((-score, order[name] if order is not None else 0, name))
+        return [(round(-score, 3), name) for score, _, name in heapq.nsmallest(limit, scored)]
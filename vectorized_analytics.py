@@ -0,0 +1,134 @@
+"""
+Vectorized Analytics for Job Application Tracker
+Computes get_analytics() with NumPy over the store's categorical column arrays
+"""
+
+from datetime import date
+from typing import Dict, List, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from application_record import (
+    DECAY_AFTER_DAYS, DECAYING_STATUSES, DEFAULT_WEIGHT, SCORE_FLOOR, STATUS_WEIGHTS
+)
+from application_store import ApplicationStore
+
+INTERVIEW_STATUSES = ['Interviewed', 'Second Interview', 'Interview Scheduled']
+CLOSED_STATUSES = ['Rejected', 'Accepted', 'Withdrawn']
+# Follow-ups are still shown for withdrawn applications
+FOLLOWUP_CLOSED_STATUSES = ['Rejected', 'Accepted']
+
+
+def available() -> bool:
+    """True when NumPy is installed"""
+    return np is not None
+
+
+def derived_columns(store: ApplicationStore, as_of: date) -> tuple:
+    """Days Since Applied and Success Score arrays as of a date, in store order"""
+    columns = store.columns
+    status = np.frombuffer(columns.status, dtype=np.int32)
+    applied = np.frombuffer(columns.applied, dtype=np.int32).astype(np.int64)
+
+    days = np.where(applied != columns.NO_DATE, as_of.toordinal() - applied, 0)
+
+    weights = np.array([STATUS_WEIGHTS.get(name, DEFAULT_WEIGHT) for name in columns.statuses], dtype=np.int64)
+    decaying = np.array([name in DECAYING_STATUSES for name in columns.statuses], dtype=bool)
+    base = weights[status]
+    decayed = np.maximum(SCORE_FLOOR, base - (days - DECAY_AFTER_DAYS) * 2)
+    score = np.where(decaying[status] & (days > DECAY_AFTER_DAYS), decayed, base)
+    return days, np.clip(score, 0, 100)
+
+
+def overdue_followups(store: ApplicationStore, today: date) -> List[Dict[str, Any]]:
+    """The needs_followup entries of get_analytics(), in store order"""
+    columns = store.columns
+    if not len(columns.status):
+        return []
+    status = np.frombuffer(columns.status, dtype=np.int32)
+    follow_up = np.frombuffer(columns.follow_up, dtype=np.int32)
+
+    followup_open = np.ones(len(columns.statuses), dtype=bool)
+    for name in FOLLOWUP_CLOSED_STATUSES:
+        if name in columns.statuses:
+            followup_open[columns.statuses.index(name)] = False
+    today_ordinal = today.toordinal()
+    overdue = np.flatnonzero((follow_up <= today_ordinal) & followup_open[status])
+    if not len(overdue):
+        return []
+
+    records = store.rows
+    days_overdue = (today_ordinal - follow_up[overdue]).tolist()
+    return [
+        {
+            'company': app.company,
+            'job_title': app.job_title,
+            'followup_date': app.follow_up_date,
+            'days_overdue': late
+        }
+        for app, late in zip(map(records.__getitem__, overdue.tolist()), days_overdue)
+    ]
+
+
+def compute_analytics(store: ApplicationStore, today: date) -> Dict[str, Any]:
+    """
+    Same result as JobTrackerManager's row-by-row analytics, computed with
+    bincount over Status and Company Name codes and masks over the date
+    columns. Only the overdue follow-ups are materialized per row.
+    """
+    total = len(store)
+    if not total:
+        return {
+            'total_applications': 0,
+            'message': 'No applications tracked yet'
+        }
+
+    columns = store.columns
+    status = np.frombuffer(columns.status, dtype=np.int32)
+    company = np.frombuffer(columns.company, dtype=np.int32)
+    days, score = derived_columns(store, today)
+
+    # Status breakdown
+    counts = np.bincount(status, minlength=len(columns.statuses))
+    status_counts = {name: int(count) for name, count in zip(columns.statuses, counts) if count}
+
+    interviewed = sum(status_counts.get(name, 0) for name in INTERVIEW_STATUSES)
+    offers = status_counts.get('Offer Received', 0)
+    accepted = status_counts.get('Accepted', 0)
+    rejected = status_counts.get('Rejected', 0)
+    active = total - sum(status_counts.get(name, 0) for name in CLOSED_STATUSES)
+
+    avg_days = int(days.sum()) / total
+
+    needs_followup = overdue_followups(store, today)
+
+    # Top companies by mean success score, ties kept in order of first appearance
+    company_totals = np.bincount(company, weights=score, minlength=len(columns.companies))
+    company_sizes = np.bincount(company, minlength=len(columns.companies))
+    first_seen = np.full(len(columns.companies), total)
+    np.minimum.at(first_seen, company, np.arange(total))
+    present = np.flatnonzero(company_sizes)
+    present = present[np.argsort(first_seen[present], kind='stable')]
+    means = company_totals[present] / company_sizes[present]
+    top = np.argsort(-means, kind='stable')[:5]
+
+    return {
+        'total_applications': total,
+        'active_applications': active,
+        'status_breakdown': status_counts,
+        'metrics': {
+            'interview_rate': round(interviewed / total * 100, 1),
+            'offer_rate': round(offers / total * 100, 1),
+            'acceptance_rate': round(accepted / total * 100, 1),
+            'rejection_rate': round(rejected / total * 100, 1)
+        },
+        'average_days_since_applied': round(avg_days, 1),
+        'needs_followup': needs_followup,
+        'top_companies': [
+            {'company': columns.companies[present[i]], 'avg_score': round(float(means[i]), 1)}
+            for i in top.tolist()
+        ]
+    }